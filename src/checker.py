@@ -127,23 +127,27 @@ class UpdateChecker:
         # Process each news item
         relevant_news = []
         for news_item in all_news:
+            # Lowercase once for both package extraction and keyword checks
+            text_lower = (news_item.title + " " + news_item.content).lower()
+
             # Extract affected packages
-            affected = self.pattern_matcher.extract_package_names(
-                news_item.title + " " + news_item.content,
+            affected = self.pattern_matcher.extract_package_names_prepared(
+                text_lower,
                 installed_packages,
                 extra_patterns
             )
             news_item.affected_packages = affected
 
             # Check relevance
-            if self._is_news_relevant(news_item, installed_packages, critical_packages):
+            if self._is_news_relevant(news_item, installed_packages, critical_packages, text_lower):
                 relevant_news.append(news_item)
 
         return relevant_news
 
     def _is_news_relevant(self, news_item: NewsItem,
                           installed_packages: Set[str],
-                          critical_packages: Set[str]) -> bool:
+                          critical_packages: Set[str],
+                          text_lower: Optional[str] = None) -> bool:
         """
         Check if a news item is relevant.
 
@@ -151,6 +155,7 @@ class UpdateChecker:
             news_item: News item to check
             installed_packages: Set of installed packages
             critical_packages: Set of critical packages
+            text_lower: Lowercased title and content, if already computed
 
         Returns:
             True if news item is relevant
@@ -173,8 +178,9 @@ class UpdateChecker:
             "vulnerability", "exploit", "manual intervention"
         ]
 
-        combined_text = (news_item.title + " " + news_item.content).lower()
-        if any(keyword in combined_text for keyword in important_keywords):
+        if text_lower is None:
+            text_lower = (news_item.title + " " + news_item.content).lower()
+        if any(keyword in text_lower for keyword in important_keywords):
             return True
 
         return False
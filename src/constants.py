@@ -67,7 +67,7 @@ TRUSTED_FEED_DOMAINS = {
 FEED_URL_PATTERN = r'^https?://[a-zA-Z0-9\-._~:/?#[\]@!$&\'()*+,;=]+$'
 
 # Generic package names to exclude from pattern matching
-GENERIC_PACKAGE_NAMES = {
+GENERIC_PACKAGE_NAMES = frozenset({
     "package",
     "update",
     "version",
@@ -77,7 +77,7 @@ GENERIC_PACKAGE_NAMES = {
     "critical",
     "important",
     "bugfix",
-}
+})
 
 # Paths
 
@@ -9,6 +9,7 @@ from __future__ import annotations
 import os
 import re
 import subprocess
+import sys
 from pathlib import Path
 from typing import List, Optional, Dict, Any, Set
 
@@ -277,10 +278,11 @@ class PackageManager:
                 error_msg = result.stderr.strip() if result.stderr else "Unknown error"
                 raise PackageManagerError(f"Failed to get package names: {error_msg}")
 
+            # Interned so names extracted from news text share these strings
             package_names = set()
             for line in result.stdout.strip().split('\n'):
                 if line:
-                    package_names.add(line.strip())
+                    package_names.add(sys.intern(line.strip()))
 
             self._installed_names_cache = package_names
             logger.debug(f"Found {len(package_names)} installed package names")
@@ -16,8 +16,9 @@ import psutil  # type: ignore[import-untyped]
 import time
 import json
 import hashlib
+import weakref
 from pathlib import Path
-from typing import Optional, Union, Dict, Any, TextIO
+from typing import Optional, Union, Dict, Any, List, Tuple, TextIO
 from contextlib import contextmanager
 
 from .logger import get_logger, log_security_event
@@ -28,6 +29,36 @@ logger = get_logger(__name__)
 MAX_LOCK_AGE_SECONDS = 86400  # 24 hours - auto-cleanup very old locks
 LOCK_FILE_VERSION = "1.0"
 
+# Signal handlers are installed once per process and release every live lock
+_active_locks: List["weakref.ref[InstanceLock]"] = []
+_handlers_installed = False
+
+# Resolved lock file paths keyed by (lock_dir, app_name, mode)
+_PATH_CACHE: Dict[Tuple[str, str, str], str] = {}
+
+
+def _cleanup_all_locks(signum: int, frame: Any) -> None:
+    """Release all active instance locks and re-raise the signal."""
+    logger.debug(f"Received signal {signum}, cleaning up instance locks")
+    for lock_ref in list(_active_locks):
+        lock = lock_ref()
+        if lock is not None:
+            lock.release()
+    _active_locks.clear()
+    # Re-raise to allow normal signal handling
+    signal.signal(signum, signal.SIG_DFL)
+    os.kill(os.getpid(), signum)
+
+
+def _pid_alive(pid: Any) -> bool:
+    """Return True if pid refers to a running process."""
+    if not isinstance(pid, int) or pid <= 0:
+        return False
+    try:
+        return bool(psutil.pid_exists(pid))
+    except Exception:
+        return False
+
 
 class InstanceLockError(Exception):
     """Raised when instance lock operations fail."""
@@ -68,16 +99,24 @@ class InstanceLock:
 
         logger.debug(f"Initialized instance lock for {app_name} ({mode}) at {self.lock_file_path}")
 
-    def _get_lock_file_path(self, lock_dir: Optional[Union[str, Path]] = None) -> Path:
+    def _get_lock_file_path(self, lock_dir: Optional[Union[str, Path]] = None) -> str:
         """
         Get the lock file path with proper permissions.
 
+        The resolved path is cached per (lock_dir, app_name, mode) so repeated
+        constructions skip directory probing and path arithmetic.
+
         Args:
             lock_dir: Directory for lock files
 
         Returns:
             Path to lock file
         """
+        cache_key = (str(lock_dir) if lock_dir is not None else "", self.app_name, self.mode)
+        cached_path = _PATH_CACHE.get(cache_key)
+        if cached_path is not None and os.path.isdir(os.path.dirname(cached_path)):
+            return cached_path
+
         if lock_dir is None:
             # Use /var/run if available and writable, otherwise /tmp
             var_run = Path("/var/run/user") / str(os.getuid())
@@ -96,8 +135,9 @@ class InstanceLock:
             lock_dir = Path("/tmp")
 
         # Lock file name includes app name and mode
-        lock_file_name = f".{self.app_name}-{self.mode}.lock"
-        return lock_dir / lock_file_name
+        lock_file_path = os.path.join(str(lock_dir), f".{self.app_name}-{self.mode}.lock")
+        _PATH_CACHE[cache_key] = lock_file_path
+        return lock_file_path
 
     def acquire(self, timeout: float = 0.0, check_stale: bool = True) -> bool:
         """
@@ -121,7 +161,7 @@ class InstanceLock:
             # Try atomic file creation with secure permissions
             try:
                 self.lock_fd = os.open(
-                    str(self.lock_file_path),
+                    self.lock_file_path,
                     os.O_CREAT | os.O_WRONLY | os.O_EXCL,
                     0o600
                 )
@@ -133,6 +173,13 @@ class InstanceLock:
                 self.lock_fd = self.lock_file.fileno()
                 newly_created = False
 
+                # Reject early if the lock is owned by a live instance of our app
+                if timeout <= 0 and check_stale:
+                    data = self._get_lock_data()
+                    if data and self._is_held_by_live_instance(data):
+                        self._close_lock_file()
+                        self._raise_already_running(data['pid'])
+
                 # Ensure permissions are correct even for existing file
                 try:
                     os.chmod(self.lock_file_path, 0o600)
@@ -156,27 +203,12 @@ class InstanceLock:
                             return self.acquire(timeout=timeout, check_stale=False)
 
                         self._close_lock_file()
-                        existing_pid = self._get_existing_pid()
-                        log_security_event(
-                            "MULTIPLE_INSTANCE_ATTEMPT",
-                            {
-                                "app_name": self.app_name,
-                                "mode": self.mode,
-                                "existing_pid": existing_pid,
-                                "current_pid": self.pid
-                            },
-                            severity="warning"
-                        )
-                        raise InstanceAlreadyRunningError(
-                            f"Another instance of {self.app_name} ({self.mode}) is already running "
-                            f"(PID: {existing_pid or 'unknown'})"
-                        )
+                        self._raise_already_running(self._get_existing_pid())
                     time.sleep(0.1)
 
             # Write lock data with integrity check
             lock_data = {
                 'pid': self.pid,
-                'timestamp': time.time(),
                 'version': LOCK_FILE_VERSION,
                 'app_name': self.app_name,
                 'mode': self.mode,
@@ -209,33 +241,96 @@ class InstanceLock:
             raise InstanceLockError(f"Failed to acquire instance lock: {e}")
 
     def release(self) -> None:
-        """Release the instance lock."""
+        """
+        Release the instance lock.
+
+        The lock file is emptied before the flock is dropped so that a
+        concurrent reader sees an ownerless file, then the descriptor is
+        closed and the file removed. Each step is independent so a partial
+        failure never leaks the descriptor.
+        """
         if not self.locked:
             return
 
-        try:
-            if self.lock_fd is not None:
-                # Release the lock
-                try:
-                    fcntl.flock(self.lock_fd, fcntl.LOCK_UN)
-                except BaseException:
-                    pass
+        self.locked = False
 
-            self._close_lock_file()
+        if self.lock_fd is not None:
+            # Empty the file so concurrent readers see no owner
+            try:
+                os.ftruncate(self.lock_fd, 0)
+            except OSError as e:
+                logger.debug(f"Could not truncate lock file: {e}")
 
-            # Remove lock file
+            # Release the lock
             try:
-                self.lock_file_path.unlink()
-            except FileNotFoundError:
-                pass
-            except Exception as e:
-                logger.debug(f"Could not remove lock file: {e}")
+                fcntl.flock(self.lock_fd, fcntl.LOCK_UN)
+            except OSError as e:
+                logger.debug(f"Could not unlock lock file: {e}")
 
-            self.locked = False
-            logger.info(f"Released instance lock for {self.app_name} ({self.mode})")
+        self._close_lock_file()
 
+        # Remove lock file
+        try:
+            os.unlink(self.lock_file_path)
+        except FileNotFoundError:
+            pass
         except Exception as e:
-            logger.error(f"Error releasing instance lock: {e}")
+            logger.debug(f"Could not remove lock file: {e}")
+
+        logger.debug(f"Released instance lock for {self.app_name} ({self.mode})")
+
+    def _raise_already_running(self, existing_pid: Optional[int]) -> None:
+        """
+        Log the rejected attempt and raise InstanceAlreadyRunningError.
+
+        Args:
+            existing_pid: PID of the running instance, if known
+
+        Raises:
+            InstanceAlreadyRunningError: Always
+        """
+        log_security_event(
+            "MULTIPLE_INSTANCE_ATTEMPT",
+            {
+                "app_name": self.app_name,
+                "mode": self.mode,
+                "existing_pid": existing_pid,
+                "current_pid": self.pid
+            },
+            severity="warning"
+        )
+        raise InstanceAlreadyRunningError(
+            f"Another instance of {self.app_name} ({self.mode}) is already running "
+            f"(PID: {existing_pid or 'unknown'})"
+        )
+
+    def _is_held_by_live_instance(self, lock_data: Dict[str, Any]) -> bool:
+        """
+        Check whether lock data belongs to a running instance of this application.
+
+        Used to reject a second instance without going through the flock loop.
+        Anything inconclusive returns False so the regular flock path decides.
+
+        Args:
+            lock_data: Parsed lock file contents
+
+        Returns:
+            True if the lock owner is alive and is this application
+        """
+        existing_pid = lock_data.get('pid')
+        if existing_pid == self.pid or lock_data.get('app_name') != self.app_name:
+            return False
+        if self._get_lock_age() > MAX_LOCK_AGE_SECONDS:
+            return False
+        if not _pid_alive(existing_pid):
+            return False
+
+        # Guard against PID reuse by an unrelated process after a crash
+        try:
+            cmdline = ' '.join(psutil.Process(existing_pid).cmdline())
+        except Exception:
+            return False
+        return self.app_name in cmdline or 'asuc' in cmdline
 
     def _close_lock_file(self) -> None:
         """Close the lock file handle."""
@@ -260,7 +355,7 @@ class InstanceLock:
             Lock data dict if valid, None otherwise
         """
         try:
-            if self.lock_file_path.exists():
+            if os.path.exists(self.lock_file_path):
                 with open(self.lock_file_path, 'r') as f:
                     data = json.load(f)
                     # Validate data structure
@@ -282,6 +377,25 @@ class InstanceLock:
             return data['pid']
         return None
 
+    def _get_lock_age(self) -> float:
+        """
+        Get the age of the lock file from its modification time.
+
+        The lock file is only written when the lock is acquired, so its mtime
+        is the acquisition time.
+
+        Returns:
+            Age in seconds, or 0.0 if the file cannot be inspected
+        """
+        try:
+            if self.lock_fd is not None:
+                lock_timestamp = os.fstat(self.lock_fd).st_mtime
+            else:
+                lock_timestamp = os.stat(self.lock_file_path).st_mtime
+        except OSError:
+            return 0.0
+        return time.time() - lock_timestamp
+
     def _check_and_clean_stale_lock(self) -> bool:
         """
         Check if lock is stale and clean it up.
@@ -298,9 +412,9 @@ class InstanceLock:
             return False
 
         # Check lock age
-        lock_timestamp = lock_data.get('timestamp', 0)
-        if time.time() - lock_timestamp > MAX_LOCK_AGE_SECONDS:
-            logger.warning(f"Found very old lock (age: {time.time() - lock_timestamp:.0f}s), cleaning up")
+        lock_age = self._get_lock_age()
+        if lock_age > MAX_LOCK_AGE_SECONDS:
+            logger.warning(f"Found very old lock (age: {lock_age:.0f}s), cleaning up")
             try:
                 # Try to release the lock properly first
                 if self.lock_fd is not None:
@@ -308,7 +422,7 @@ class InstanceLock:
             except BaseException:
                 pass
             try:
-                self.lock_file_path.unlink()
+                os.unlink(self.lock_file_path)
                 return True
             except Exception as e:
                 logger.debug(f"Could not remove stale lock: {e}")
@@ -319,7 +433,7 @@ class InstanceLock:
             if not psutil.pid_exists(existing_pid):
                 logger.warning(f"Found stale lock from PID {existing_pid}, cleaning up")
                 try:
-                    self.lock_file_path.unlink()
+                    os.unlink(self.lock_file_path)
                     return True
                 except Exception as e:
                     logger.debug(f"Could not remove stale lock: {e}")
@@ -335,12 +449,12 @@ class InstanceLock:
                         'asuc' not in cmdline and
                             lock_data.get('app_name') != self.app_name):
                         logger.warning(f"Lock held by different process (PID {existing_pid}), cleaning up")
-                        self.lock_file_path.unlink()
+                        os.unlink(self.lock_file_path)
                         return True
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
                     # Process disappeared or we can't access it
                     try:
-                        self.lock_file_path.unlink()
+                        os.unlink(self.lock_file_path)
                         return True
                     except BaseException:
                         pass
@@ -350,20 +464,28 @@ class InstanceLock:
         return False
 
     def _setup_signal_handlers(self) -> None:
-        """Set up signal handlers for cleanup on termination."""
-        def cleanup_handler(signum, frame):
-            logger.debug(f"Received signal {signum}, cleaning up instance lock")
-            self.release()
-            # Re-raise to allow normal signal handling
-            signal.signal(signum, signal.SIG_DFL)
-            os.kill(os.getpid(), signum)
+        """Register this lock for cleanup, installing signal handlers once per process."""
+        global _handlers_installed
+
+        # Drop references to locks that have been garbage collected
+        _active_locks[:] = [ref for ref in _active_locks if ref() is not None]
+        if not any(ref() is self for ref in _active_locks):
+            _active_locks.append(weakref.ref(self))
+
+        if _handlers_installed:
+            return
 
         # Handle common termination signals
+        installed = False
         for sig in [signal.SIGTERM, signal.SIGINT]:
             try:
-                signal.signal(sig, cleanup_handler)
-            except BaseException:
-                pass  # Some signals may not be available on all platforms
+                signal.signal(sig, _cleanup_all_locks)
+                installed = True
+            except (ValueError, OSError, AttributeError):
+                # Not on the main thread, or the signal is unavailable on this platform
+                pass
+        # Retry with the next lock when nothing could be installed
+        _handlers_installed = installed
 
     def __enter__(self):
         """Context manager entry."""
@@ -6,16 +6,39 @@ Logging configuration for Arch Smart Update Checker.
 
 from __future__ import annotations
 
+import atexit
+import functools
+import io
 import logging
 import os
+import queue
 import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable
 import sys
 from datetime import datetime
 import re  # Added for sanitize_log_message
 import json  # Added for security log formatting
 
+try:
+    import hyperscan  # type: ignore[import-not-found]
+except ImportError:
+    # Optional accelerator for the sanitizer; plain re is used without it
+    hyperscan = None
+
+try:
+    import orjson  # type: ignore[import-not-found]
+
+    def _json_line(entry: Dict[str, Any]) -> bytes:
+        """Serialize a security log entry as one JSON line."""
+        return orjson.dumps(entry) + b'\n'  # type: ignore[no-any-return]
+except ImportError:
+    def _json_line(entry: Dict[str, Any]) -> bytes:
+        """Serialize a security log entry as one JSON line."""
+        return (json.dumps(entry) + '\n').encode('utf-8')
+
 
 class ColoredFormatter(logging.Formatter):
     """Custom formatter with colors for terminal output."""
@@ -29,15 +52,109 @@ class ColoredFormatter(logging.Formatter):
         'RESET': '\033[0m'      # Reset
     }
 
+    # Pre-wrapped level names keyed by level number
+    _LEVEL_COLOR_CACHE = {
+        logging.DEBUG: '\033[36mDEBUG\033[0m',
+        logging.INFO: '\033[32mINFO\033[0m',
+        logging.WARNING: '\033[33mWARNING\033[0m',
+        logging.ERROR: '\033[31mERROR\033[0m',
+        logging.CRITICAL: '\033[35mCRITICAL\033[0m',
+    }
+
     def format(self, record: logging.LogRecord) -> str:
         """Format log record with colors."""
-        log_color = self.COLORS.get(record.levelname, self.COLORS['RESET'])
-        reset_color = self.COLORS['RESET']
+        original_levelname = record.levelname
+
+        # Apply color to the level name without leaking it to other handlers
+        record.levelname = self._LEVEL_COLOR_CACHE.get(
+            record.levelno,
+            f"{self.COLORS['RESET']}{original_levelname}{self.COLORS['RESET']}"
+        )
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = original_levelname
 
-        # Apply color to the level name
-        record.levelname = f"{log_color}{record.levelname}{reset_color}"
 
-        return super().format(record)
+class BufferedFileHandler(logging.FileHandler):
+    """
+    File handler that batches writes instead of flushing every record.
+
+    Records at flush_level and above are flushed immediately; everything else
+    is flushed once the buffer fills or at most every flush_interval seconds.
+    """
+
+    def __init__(self, filename: str, buffer_size: int = 65536,
+                 flush_interval: float = 5.0, flush_level: int = logging.ERROR) -> None:
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.flush_level = flush_level
+        self._last_flush = time.monotonic()
+        self._stop_event = threading.Event()
+        super().__init__(filename)
+
+        # Flush periodically so idle loggers don't leave records in the buffer
+        self._flush_thread = threading.Thread(
+            target=self._flush_periodically, name="LogFileFlush", daemon=True
+        )
+        self._flush_thread.start()
+
+    def _open(self) -> Any:
+        """Open the log file with a large write buffer."""
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write a record, flushing only for severe records or when the interval elapsed."""
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            if (record.levelno >= self.flush_level or
+                    time.monotonic() - self._last_flush >= self.flush_interval):
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        """Flush buffered records to disk."""
+        super().flush()
+        self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        """Stop the periodic flush and close the file."""
+        self._stop_event.set()
+        super().close()
+
+    def _flush_periodically(self) -> None:
+        """Flush the buffer every flush_interval seconds until closed."""
+        while not self._stop_event.wait(self.flush_interval):
+            self.flush()
+
+
+class FileQueueHandler(QueueHandler):
+    """
+    Queue handler feeding the background writer for one log file.
+
+    The writer is looked up for every record, so one dropped in a forked
+    child is rebuilt the next time the child logs.
+    """
+
+    def __init__(self, log_file: str) -> None:
+        self.log_file = log_file
+        super().__init__(_get_file_writer(log_file)[0])
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Queue a record for the log file's writer, starting the writer if needed."""
+        writer = _file_log_writers.get(self.log_file)
+        if writer is None:
+            if _file_logging_stopped:
+                return
+            writer = _get_file_writer(self.log_file)
+        self.queue = writer[0]
+        writer[0].put_nowait(record)
 
 
 # Global configuration for logging with thread synchronization
@@ -46,10 +163,48 @@ _log_file_path: Optional[str] = None
 _security_log_path: Optional[str] = None  # Dedicated security log
 _configured_loggers: set[str] = set()  # Track configured loggers to prevent duplicates
 _logger_instances: Dict[str, logging.Logger] = {}  # Cache logger instances
-_global_state_lock = threading.RLock()  # Reentrant lock for global state synchronization
+_global_state_lock = threading.Lock()  # Lock for global state synchronization, never re-acquired
+
+# Background file logging: loggers enqueue records, one listener per file writes them
+_file_log_writers: Dict[str, tuple[queue.SimpleQueue[logging.LogRecord], QueueListener]] = {}
+_file_writers_lock = threading.Lock()  # Guards _file_log_writers, never held while logging
+_file_logging_stopped = False  # Set at exit, nothing drains queued records afterwards
+_shared_file_handler: Optional[logging.Handler] = None  # Attached to every logger for _log_file_path
+_shared_file_handler_path: Optional[str] = None
+
+# Formatters are stateless, so every logger shares one instance of each.
+# The console handler is shared too; it accepts every level and leaves
+# filtering to the level of the logger it is attached to.
+_CONSOLE_FORMATTER = ColoredFormatter('%(levelname)s - %(name)s - %(message)s')
+_FILE_FORMATTER = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_SHARED_CONSOLE_HANDLER = logging.StreamHandler(sys.stderr)
+_SHARED_CONSOLE_HANDLER.setFormatter(_CONSOLE_FORMATTER)
+
+# Process identity reported with security events, refreshed after fork
+_PID = os.getpid()
+_UID: Any = os.getuid() if hasattr(os, 'getuid') else 'N/A'
+_USER = os.environ.get('USER', 'unknown')
+
+# Persistent handle for the dedicated security log
+_security_log_fh: Optional[io.BufferedWriter] = None
+_security_log_fh_path: Optional[str] = None
+
+# Security events are processed off the caller thread by a single worker
+_security_queue: queue.SimpleQueue[Optional[Dict[str, Any]]] = queue.SimpleQueue()
+_security_worker: Optional[threading.Thread] = None
+_security_worker_stopped = False  # set at exit, later events are written synchronously
+_SECURITY_BATCH_SIZE = 64
+_SECURITY_FLUSH_INTERVAL = 30.0  # seconds buffered entries may wait before a flush
+_sec_last_flush = time.monotonic()
+_sec_pending = False  # entries written to the buffer but not flushed yet
+
+# Second-resolution ISO prefix reused for security event timestamps
+_iso_cache: tuple[int, str] = (-1, '')
 
 # Rate limiting for security events
-_security_event_counts: Dict[str, Dict[str, Any]] = {}  # event_type -> {count, first_time, last_time}
+_sec_count: Dict[str, int] = {}  # event_type -> events in current window
+_sec_first: Dict[str, float] = {}  # event_type -> monotonic start of current window
+_sec_ratelogged: set[str] = set()  # event types whose suppression was already logged
 _security_rate_limit_window = 60  # seconds
 _security_rate_limit_max = 10  # max events per window
 
@@ -134,22 +289,145 @@ def _reconfigure_all_loggers() -> None:
     debug = _global_config.get('verbose_logging', False) or _global_config.get('debug_mode', False)
     level = logging.DEBUG if debug else logging.INFO
 
+    # One file handler is shared by all loggers
+    file_handler = _get_shared_file_handler(level) if _log_file_path else None
+
     # Update all cached logger instances
     for logger in _logger_instances.values():
         logger.setLevel(level)
 
-        # Add file handler if file logging is enabled
-        if _log_file_path:
-            # Check if file handler already exists
-            file_handler = logging.FileHandler(_log_file_path)
-            file_handler.setLevel(level)
-            file_formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-            )
-            file_handler.setFormatter(file_formatter)
+        # Add file handler if file logging is enabled and not attached yet
+        if file_handler is not None and not any(h is file_handler for h in logger.handlers):
             logger.addHandler(file_handler)
 
 
+def _create_file_handler(log_file: str, level: int) -> logging.Handler:
+    """
+    Create a handler that hands records to the background writer for log_file.
+
+    The first call for a path opens the file and starts its queue listener;
+    later calls reuse both.
+
+    Args:
+        log_file: Path of the log file
+        level: Minimum level accepted by the returned handler
+
+    Returns:
+        QueueHandler feeding the log file's listener
+    """
+    queue_handler = FileQueueHandler(log_file)
+    queue_handler.setLevel(level)
+    return queue_handler
+
+
+def _get_file_writer(log_file: str) -> tuple[queue.SimpleQueue[logging.LogRecord], QueueListener]:
+    """
+    Get the queue and listener writing log_file, starting them on first use.
+
+    Args:
+        log_file: Path of the log file
+
+    Returns:
+        Queue feeding the listener, and the listener itself
+    """
+    with _file_writers_lock:
+        writer = _file_log_writers.get(log_file)
+        if writer is None:
+            file_handler = BufferedFileHandler(log_file)
+            file_handler.setFormatter(_FILE_FORMATTER)
+            log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+            listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+            listener.start()
+            writer = _file_log_writers[log_file] = (log_queue, listener)
+        return writer
+
+
+def _get_shared_file_handler(level: int) -> logging.Handler:
+    """
+    Get the file handler shared by all loggers for the global log file.
+
+    When the global log file changed since the handler was built, the old
+    handler is detached from every logger and its writer is shut down.
+    Must be called with _global_state_lock held.
+
+    Args:
+        level: Minimum level accepted by the handler
+
+    Returns:
+        Shared handler for _log_file_path
+    """
+    global _shared_file_handler, _shared_file_handler_path
+
+    if _shared_file_handler is None or _shared_file_handler_path != _log_file_path:
+        if _shared_file_handler is not None:
+            for name in _configured_loggers:
+                logging.getLogger(name).removeHandler(_shared_file_handler)
+            _shared_file_handler.close()
+            if _shared_file_handler_path is not None:
+                _stop_file_writer(_shared_file_handler_path)
+
+        assert _log_file_path is not None
+        _shared_file_handler = _create_file_handler(_log_file_path, level)
+        _shared_file_handler_path = _log_file_path
+
+    _shared_file_handler.setLevel(level)
+    return _shared_file_handler
+
+
+def _stop_file_writer(log_file: str) -> None:
+    """Drain queued records for log_file and close the file."""
+    with _file_writers_lock:
+        writer = _file_log_writers.pop(log_file, None)
+    if writer is None:
+        return
+    listener = writer[1]
+    try:
+        listener.stop()
+    except Exception:
+        pass
+    for handler in listener.handlers:
+        handler.close()
+
+
+def _stop_file_logging() -> None:
+    """Drain queued records and close log files at interpreter exit."""
+    global _file_logging_stopped
+    _file_logging_stopped = True
+    for log_file in list(_file_log_writers):
+        _stop_file_writer(log_file)
+
+
+def _reset_file_logging_after_fork() -> None:
+    """
+    Drop the file writers inherited by a forked child.
+
+    Their listener threads do not exist in the child and their buffers still
+    hold the parent's unflushed records, so each file is closed at the raw
+    level without flushing. FileQueueHandler rebuilds a writer on next use,
+    so the handlers attached to loggers stay valid.
+    """
+    global _file_writers_lock, _file_logging_stopped
+    _file_writers_lock = threading.Lock()
+    _file_logging_stopped = False
+
+    for _, listener in _file_log_writers.values():
+        for handler in listener.handlers:
+            stream = getattr(handler, 'stream', None)
+            if stream is None:
+                continue
+            handler.stream = None  # type: ignore[attr-defined]
+            try:
+                stream.buffer.raw.close()
+            except (AttributeError, OSError, ValueError):
+                pass
+    _file_log_writers.clear()
+
+
+atexit.register(_stop_file_logging)
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_file_logging_after_fork)
+
+
 def setup_logging(name: str, log_file: Optional[str] = None, debug: bool = False) -> logging.Logger:
     """
     Set up logging configuration with thread safety.
@@ -162,6 +440,9 @@ def setup_logging(name: str, log_file: Optional[str] = None, debug: bool = False
     Returns:
         Configured logger instance
     """
+    # Imported before taking the lock since importing it creates loggers
+    from .validators import validate_log_path
+
     with _global_state_lock:
         # Determine debug level from global config if not specified
         if not debug and _global_config:
@@ -178,20 +459,13 @@ def setup_logging(name: str, log_file: Optional[str] = None, debug: bool = False
         logger.setLevel(level)
         logger.handlers.clear()  # Clear existing handlers
 
-        # Console handler with colors (use stderr for logs)
-        console_handler = logging.StreamHandler(sys.stderr)
-        console_handler.setLevel(level)
-        console_formatter = ColoredFormatter(
-            '%(levelname)s - %(name)s - %(message)s'
-        )
-        console_handler.setFormatter(console_formatter)
-        logger.addHandler(console_handler)
+        # Shared console handler with colors (use stderr for logs)
+        logger.addHandler(_SHARED_CONSOLE_HANDLER)
 
         # File handler if specified
         if log_file:
             try:
                 # Validate log file path for security
-                from .validators import validate_log_path
                 try:
                     validate_log_path(log_file)
                 except ValueError as e:
@@ -204,13 +478,10 @@ def setup_logging(name: str, log_file: Optional[str] = None, debug: bool = False
                 # Set secure permissions on log directory
                 os.chmod(log_dir, 0o700)
 
-                file_handler = logging.FileHandler(log_file)
-                file_handler.setLevel(level)
-                file_formatter = logging.Formatter(
-                    '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-                )
-                file_handler.setFormatter(file_formatter)
-                logger.addHandler(file_handler)
+                if log_file == _log_file_path:
+                    logger.addHandler(_get_shared_file_handler(level))
+                else:
+                    logger.addHandler(_create_file_handler(log_file, level))
 
                 # Set secure permissions on log file
                 os.chmod(log_file, 0o600)
@@ -236,8 +507,13 @@ def get_logger(name: str) -> logging.Logger:
     Returns:
         Logger instance
     """
+    # Lock-free fast path: dict reads of existing keys are atomic
+    cached = _logger_instances.get(name)
+    if cached is not None:
+        return cached
+
     with _global_state_lock:
-        # Return cached instance if available
+        # Re-check in case another thread created it while we waited
         if name in _logger_instances:
             return _logger_instances[name]
 
@@ -257,25 +533,13 @@ def get_logger(name: str) -> logging.Logger:
         logger.setLevel(level)
         logger.handlers.clear()
 
-        # Console handler (use stderr for logs)
-        console_handler = logging.StreamHandler(sys.stderr)
-        console_handler.setLevel(level)
-        console_formatter = ColoredFormatter(
-            '%(levelname)s - %(name)s - %(message)s'
-        )
-        console_handler.setFormatter(console_formatter)
-        logger.addHandler(console_handler)
+        # Shared console handler (use stderr for logs)
+        logger.addHandler(_SHARED_CONSOLE_HANDLER)
 
         # File handler if global file logging is enabled
         if _log_file_path:
             try:
-                file_handler = logging.FileHandler(_log_file_path)
-                file_handler.setLevel(level)
-                file_formatter = logging.Formatter(
-                    '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-                )
-                file_handler.setFormatter(file_formatter)
-                logger.addHandler(file_handler)
+                logger.addHandler(_get_shared_file_handler(level))
             except Exception:
                 # Don't log this error to avoid recursion
                 pass
@@ -289,6 +553,378 @@ def get_logger(name: str) -> logging.Logger:
         return logger
 
 
+def _compile_patterns(patterns: list[tuple[str, str]]) -> tuple[tuple[re.Pattern[str], str], ...]:
+    """Compile (pattern, replacement) pairs once for reuse across calls."""
+    return tuple((re.compile(pattern, re.IGNORECASE), replacement) for pattern, replacement in patterns)
+
+
+# Default sensitive patterns to redact
+_DEFAULT_PATTERNS = _compile_patterns([
+    # File paths - redact home directory and username
+    (r'/home/[^/\s]+', '/home/[USER]'),
+    (r'C:[/\\]+Users[/\\]+[^/\\\\s]+', 'C:/Users/[USER]'),
+    (r'/Users/[^/\s]+', '/Users/[USER]'),  # macOS
+
+    # Email addresses
+    (r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', '[EMAIL]'),
+
+    # IP addresses (all ranges)
+    (
+        r'\b(?:192\.168\.\d{1,3}\.\d{1,3}|10\.\d{1,3}\.\d{1,3}\.\d{1,3}|172\.(?:1[6-9]|2[0-9]|3[0-1])\.\d{1,3}\.\d{1,3})\b',
+        '[PRIVATE_IP]'),
+    (
+        r'\b(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\b',
+        '[IP_ADDRESS]'),
+    (r'\b(?:[0-9a-fA-F]{1,4}:){7}[0-9a-fA-F]{1,4}\b', '[IPV6_ADDRESS]'),
+
+    # URLs with authentication
+    (r'https?://[^:]+:[^@]+@', 'https://[CREDENTIALS]@'),
+    (r'(?:ftp|sftp)://[^:]+:[^@]+@', '[PROTOCOL]://[CREDENTIALS]@'),
+
+    # Credentials and secrets (enhanced patterns)
+    (r'(?i)password["\s]*[:=]["\s]*[^\s"\']+', 'password="[REDACTED]"'),
+    (r'(?i)passwd["\s]*[:=]["\s]*[^\s"\']+', 'passwd="[REDACTED]"'),
+    (r'(?i)token["\s]*[:=]["\s]*[^\s"\']+', 'token="[REDACTED]"'),
+    (r'(?i)api_?key["\s]*[:=]["\s]*[^\s"\']+', 'api_key="[REDACTED]"'),
+    (r'(?i)secret["\s]*[:=]["\s]*[^\s"\']+', 'secret="[REDACTED]"'),
+    (r'(?i)auth["\s]*[:=]["\s]*[^\s"\']+', 'auth="[REDACTED]"'),
+    (r'(?i)authorization["\s]*[:=]["\s]*[^\s"\']+', 'authorization="[REDACTED]"'),
+    (r'(?i)bearer["\s]+[^\s"\']+', 'bearer [REDACTED]'),
+
+    # Cryptographic material
+    (r'\b[a-fA-F0-9]{32,}\b', '[HEX_STRING]'),  # Hashes, keys
+    (r'-----BEGIN [^-]+-----[^-]+-----END [^-]+-----', '[CERTIFICATE/KEY]'),
+    (r'\b[A-Za-z0-9+/]{40,}={0,2}\b', '[BASE64_DATA]'),  # Base64 encoded data
+
+    # Session and security tokens
+    (r'(?i)session["\s]*[:=]["\s]*[^\s"\']+', 'session="[REDACTED]"'),
+    (r'(?i)cookie["\s]*[:=]["\s]*[^\s"\']+', 'cookie="[REDACTED]"'),
+    (r'(?i)csrf["\s]*[:=]["\s]*[^\s"\']+', 'csrf="[REDACTED]"'),
+    (r'(?i)nonce["\s]*[:=]["\s]*[^\s"\']+', 'nonce="[REDACTED]"'),
+
+    # Database connection strings
+    (r'(?i)(?:mysql|postgresql|sqlite|mongodb)://[^\s]+', '[DATABASE_URL]'),
+    (r'(?i)(?:user|username)["\s]*[:=]["\s]*[^\s"\']+', 'user="[USER]"'),
+
+    # System identifiers
+    (r'(?i)hostname["\s]*[:=]["\s]*[^\s"\']+', 'hostname="[HOSTNAME]"'),
+    (r'(?i)machine["\s]*[:=]["\s]*[^\s"\']+', 'machine="[MACHINE]"'),
+    (r'(?i)uuid["\s]*[:=]["\s]*[0-9a-fA-F-]{32,}', 'uuid="[UUID]"'),
+
+    # Process and system info
+    (r'\bpid["\s]*[:=]?\s*\d+', 'pid=[PID]'),
+    (r'\btid["\s]*[:=]?\s*\d+', 'tid=[TID]'),
+    (r'(?i)thread[_-]?id["\s]*[:=]["\s]*[^\s"\']+', 'thread_id="[THREAD_ID]"'),
+])
+
+# Enhanced debug-level sanitization patterns
+_DEBUG_PATTERNS = _compile_patterns([
+    # Package and system information
+    (r'packages=\[[^\]]*\]', 'packages=[LIST_REDACTED]'),
+    (r'selected=\[[^\]]*\]', 'selected=[LIST_REDACTED]'),
+    (r'installed=\[[^\]]*\]', 'installed=[LIST_REDACTED]'),
+    (r'dependencies=\[[^\]]*\]', 'dependencies=[LIST_REDACTED]'),
+
+    # Command outputs and system info
+    (r'(?i)(?:update|command|full)\s+output(?:\s+for[^:]+)?:\s*.*', 'Output: [CONTENT_REDACTED]'),
+    (r'(?i)Running\s+command:\s+.*', 'Running command: [COMMAND_REDACTED]'),
+    (r'(?i)Executing:\s+.*', 'Executing: [EXECUTION_REDACTED]'),
+    (r'(?i)Shell\s+command:\s+.*', 'Shell command: [SHELL_REDACTED]'),
+
+    # System and environment details
+    (r'(?i)environment:\s*\{[^}]*\}', 'environment: {[ENV_REDACTED]}'),
+    (r'(?i)env_vars?:\s*\{[^}]*\}', 'env_vars: {[ENV_REDACTED]}'),
+    (r'(?i)system_info:\s*\{[^}]*\}', 'system_info: {[SYS_REDACTED]}'),
+
+    # Version and architecture information
+    (r'\b\d+\.\d+\.\d+[\w.-]*\b', '[VERSION]'),
+    (r'(?i)arch(?:itecture)?["\s]*[:=]["\s]*[^\s"\']+', 'arch="[ARCH]"'),
+    (r'(?i)platform["\s]*[:=]["\s]*[^\s"\']+', 'platform="[PLATFORM]"'),
+    (r'(?i)kernel["\s]*[:=]["\s]*[^\s"\']+', 'kernel="[KERNEL]"'),
+
+    # File system paths and details
+    (r'/usr/[^\s]+', '/usr/[PATH]'),
+    (r'/etc/[^\s]+', '/etc/[PATH]'),
+    (r'/var/[^\s]+', '/var/[PATH]'),
+    (r'/tmp/[^\s]+', '/tmp/[PATH]'),
+    (r'/opt/[^\s]+', '/opt/[PATH]'),
+    (r'/lib[^/]*[^\s]*', '/lib[PATH]'),
+    (r'/bin/[^\s]+', '/bin/[PATH]'),
+    (r'/sbin/[^\s]+', '/sbin/[PATH]'),
+
+    # Network and connection details
+    (r'(?i)port["\s]*[:=]?\s*\d+', 'port=[PORT]'),
+    (r'(?i)socket["\s]*[:=]["\s]*[^\s"\']+', 'socket="[SOCKET]"'),
+    (r'(?i)interface["\s]*[:=]["\s]*[^\s"\']+', 'interface="[INTERFACE]"'),
+
+    # Process identifiers and thread info
+    (r'thread_[a-f0-9]{8,}', 'thread_[ID]'),
+    (r'process_[a-f0-9]{8,}', 'process_[ID]'),
+    (r'job_[a-f0-9]{8,}', 'job_[ID]'),
+    (r'task_[a-f0-9]{8,}', 'task_[ID]'),
+
+    # Timing and performance data
+    (r'(?i)execution_time["\s]*[:=]["\s]*[\d.]+', 'execution_time="[TIME]"'),
+    (r'(?i)duration["\s]*[:=]["\s]*[\d.]+', 'duration="[TIME]"'),
+    (r'(?i)elapsed["\s]*[:=]["\s]*[\d.]+', 'elapsed="[TIME]"'),
+    (r'(?i)latency["\s]*[:=]["\s]*[\d.]+', 'latency="[TIME]"'),
+
+    # Memory and resource usage
+    (r'(?i)memory["\s]*[:=]["\s]*[\d.]+[^\s]*', 'memory="[MEMORY]"'),
+    (r'(?i)cpu["\s]*[:=]["\s]*[\d.]+%?', 'cpu="[CPU]"'),
+    (r'(?i)disk["\s]*[:=]["\s]*[\d.]+[^\s]*', 'disk="[DISK]"'),
+    (r'(?i)load["\s]*[:=]["\s]*[\d.]+', 'load="[LOAD]"'),
+
+    # Configuration details
+    (r'(?i)config["\s]*[:=]\s*\{[^}]*\}', 'config={[CONFIG_REDACTED]}'),
+    (r'(?i)settings["\s]*[:=]\s*\{[^}]*\}', 'settings={[SETTINGS_REDACTED]}'),
+    (r'(?i)options["\s]*[:=]\s*\{[^}]*\}', 'options={[OPTIONS_REDACTED]}'),
+
+    # Error context and stack traces
+    (r'(?i)traceback["\s]*[:=][^,}]+', 'traceback="[TRACEBACK_REDACTED]"'),
+    (r'(?i)stack["\s]*[:=][^,}]+', 'stack="[STACK_REDACTED]"'),
+    (r'(?i)backtrace["\s]*[:=][^,}]+', 'backtrace="[BACKTRACE_REDACTED]"'),
+
+    # User and session context
+    (r'(?i)current_user["\s]*[:=]["\s]*[^\s"\']+', 'current_user="[USER]"'),
+    (r'(?i)logged_in_user["\s]*[:=]["\s]*[^\s"\']+', 'logged_in_user="[USER]"'),
+    (r'(?i)active_session["\s]*[:=]["\s]*[^\s"\']+', 'active_session="[SESSION]"'),
+
+    # Application state
+    (r'(?i)state["\s]*[:=]\s*\{[^}]*\}', 'state={[STATE_REDACTED]}'),
+    (r'(?i)context["\s]*[:=]\s*\{[^}]*\}', 'context={[CONTEXT_REDACTED]}'),
+    (r'(?i)metadata["\s]*[:=]\s*\{[^}]*\}', 'metadata={[METADATA_REDACTED]}'),
+])
+
+# Production-safe patterns (always applied regardless of debug level)
+_PRODUCTION_PATTERNS = _compile_patterns([
+    # Credit card numbers
+    (r'\b(?:\d{4}[-\s]?){3}\d{4}\b', '[CREDIT_CARD]'),
+
+    # Social security numbers
+    (r'\b\d{3}-\d{2}-\d{4}\b', '[SSN]'),
+
+    # Phone numbers
+    (r'\b(?:\+?1[-.\s]?)?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}\b', '[PHONE]'),
+
+    # More generic credentials
+    (r'(?i)(?:key|pass|secret|token|auth)[_-]?[a-zA-Z0-9]{16,}', '[CREDENTIAL]'),
+
+    # JSON Web Tokens
+    (r'\beyJ[A-Za-z0-9_-]*\.[A-Za-z0-9_-]*\.[A-Za-z0-9_-]*\b', '[JWT_TOKEN]'),
+
+    # AWS/Cloud credentials
+    (r'\bAKIA[0-9A-Z]{16}\b', '[AWS_ACCESS_KEY]'),
+    (r'\b[0-9a-zA-Z/+]{40}\b', '[AWS_SECRET_KEY]'),
+
+    # Private keys and certificates (additional patterns)
+    (r'(?i)private[_-]?key["\s]*[:=]["\s]*[^\s"\']+', 'private_key="[REDACTED]"'),
+    (r'(?i)public[_-]?key["\s]*[:=]["\s]*[^\s"\']+', 'public_key="[REDACTED]"'),
+    (r'(?i)certificate["\s]*[:=]["\s]*[^\s"\']+', 'certificate="[REDACTED]"'),
+])
+
+# Ordered pattern sets applied by sanitize_log_message
+_SANITIZE_PATTERNS = _DEFAULT_PATTERNS + _PRODUCTION_PATTERNS
+_SANITIZE_DEBUG_PATTERNS = _SANITIZE_PATTERNS + _DEBUG_PATTERNS
+
+
+def _build_hyperscan_database(patterns: tuple[tuple[re.Pattern[str], str], ...]) -> Any:
+    """
+    Compile a pattern set into a Hyperscan database if the library is available.
+
+    Args:
+        patterns: Compiled (pattern, replacement) pairs
+
+    Returns:
+        Hyperscan database with pattern ids matching tuple indices, or None
+    """
+    if hyperscan is None:
+        return None
+
+    expressions = []
+    for pattern, _ in patterns:
+        source = pattern.pattern
+        if source.startswith('(?i)'):
+            source = source[4:]
+        expressions.append(source.encode('ascii'))
+
+    try:
+        database = hyperscan.Database()
+        database.compile(
+            expressions=expressions,
+            ids=list(range(len(expressions))),
+            elements=len(expressions),
+            flags=hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH
+        )
+        return database
+    except Exception:
+        return None
+
+
+_HYPERSCAN_DB = _build_hyperscan_database(_SANITIZE_PATTERNS)
+_HYPERSCAN_DEBUG_DB = _build_hyperscan_database(_SANITIZE_DEBUG_PATTERNS)
+_hyperscan_local = threading.local()
+
+
+def _first_matching_pattern(message: str, database: Any) -> int:
+    """
+    Find the first pattern index that can change the message.
+
+    Patterns are applied in order, so every pattern before the lowest matching
+    id leaves the message untouched and can be skipped. Hyperscan is only used
+    for ASCII text without \x1c-\x1f, where its character classes agree with re.
+
+    Args:
+        message: Message to scan
+        database: Hyperscan database for the active pattern set
+
+    Returns:
+        Index to start applying patterns from; 0 means apply all of them
+    """
+    if database is None or not message.isascii():
+        return 0
+    if '\x1c' in message or '\x1d' in message or '\x1e' in message or '\x1f' in message:
+        return 0
+
+    matched_ids: list[int] = []
+
+    def on_match(pattern_id: int, start: int, end: int, flags: int, context: Any) -> None:
+        matched_ids.append(pattern_id)
+
+    try:
+        # Scratch space is not thread safe, keep one per thread and database
+        scratches = getattr(_hyperscan_local, 'scratches', None)
+        if scratches is None:
+            scratches = _hyperscan_local.scratches = {}
+        scratch = scratches.get(id(database))
+        if scratch is None:
+            scratch = scratches[id(database)] = hyperscan.Scratch(database)
+        database.scan(message.encode('ascii'), match_event_handler=on_match, scratch=scratch)
+    except Exception:
+        return 0
+
+    return min(matched_ids) if matched_ids else len(_SANITIZE_DEBUG_PATTERNS)
+
+
+# Cheap necessary condition for any redaction pattern to match. Every pattern
+# needs one of these sigils, digit runs, keywords or long token runs, so text
+# without them can skip the pattern passes entirely.
+_SANITIZE_TRIGGER_RE = re.compile(
+    r'[@:=/\\]|\d\.\d|\d{3}|[pt]id|port|bearer|-----|eyJ|AKIA'
+    r'|[a-z0-9+]{32}|(?:key|pass|secret|token|auth)[_-]?[a-z0-9]{16}'
+    r'|(?:thread|process|job|task)_[a-f0-9]{8}',
+    re.IGNORECASE
+)
+
+# Characters scanned beyond the output length limit. A pre-cut scan is only
+# trusted when its redacted text still extends this far past the limit, so
+# whatever the cut left unmatched at the end never reaches the output.
+_SANITIZE_SCAN_SLACK = 256
+
+# Opening/closing delimiters of patterns whose matches can span whitespace
+# and run arbitrarily long; an opener left unclosed by the cut forces a full scan
+_SANITIZE_SPANNING_DELIMITERS = (('{', '}'), ('[', ']'), ('-----BEGIN', '-----END'))
+
+# Patterns used by _apply_additional_sanitization
+_CTRL_RE = re.compile(r'[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F]')
+_WS_RE = re.compile(r'\s+')
+_REDACTED_RE = re.compile(r'(\[REDACTED\][\s,]*){3,}')
+_CRED_RE = re.compile(r'(\[CREDENTIAL\][\s,]*){3,}')
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_custom_pattern(pattern: str) -> Optional[re.Pattern[str]]:
+    """Compile a caller-supplied sensitive pattern, returning None if it is invalid."""
+    try:
+        return re.compile(pattern, re.IGNORECASE)
+    except re.error as e:
+        get_logger(__name__).debug(f"Sanitization pattern failed: {e}")
+        return None
+
+
+def _sanitize_scan_window(message: str, limit: int) -> Optional[str]:
+    """
+    Cut a long message at the last whitespace before limit for pattern scanning.
+
+    Args:
+        message: Message longer than limit
+        limit: Maximum number of characters to scan
+
+    Returns:
+        Leading whole tokens of message, or None if a full scan is required
+    """
+    cut = max(message.rfind(' ', 0, limit), message.rfind('\n', 0, limit),
+              message.rfind('\t', 0, limit), message.rfind('\r', 0, limit))
+    if cut <= 0:
+        return None
+
+    window = message[:cut]
+    for opener, closer in _SANITIZE_SPANNING_DELIMITERS:
+        if window.rfind(opener) > window.rfind(closer):
+            return None
+    return window
+
+
+def _make_sanitizer(patterns: tuple[tuple[re.Pattern[str], str], ...], database: Any,
+                    debug_level: bool) -> Callable[[str, Optional[list[str]]], str]:
+    """
+    Build a sanitizer specialized for one pattern set and debug level.
+
+    The pattern set, Hyperscan database and length limits are bound once here
+    instead of being selected on every call.
+
+    Args:
+        patterns: Compiled (pattern, replacement) pairs applied in order
+        database: Hyperscan database for patterns, or None
+        debug_level: Whether the sanitizer is used for debug logging
+
+    Returns:
+        Function taking a message and optional custom patterns
+    """
+    max_length = 2000 if debug_level else 1000
+    scan_limit = max_length + _SANITIZE_SCAN_SLACK
+    trigger_search = _SANITIZE_TRIGGER_RE.search if database is None else None
+
+    def redact(message: str, sensitive_patterns: Optional[list[str]]) -> str:
+        # Fast path for messages no pattern can match; the Hyperscan gate
+        # below already covers this case when it is available
+        if trigger_search is not None and not sensitive_patterns and not trigger_search(message):
+            return message
+
+        sanitized = message
+        for pattern, replacement in patterns[_first_matching_pattern(message, database):]:
+            sanitized = pattern.sub(replacement, sanitized)
+
+        if sensitive_patterns:
+            for custom_pattern in sensitive_patterns:
+                compiled = _compile_custom_pattern(custom_pattern)
+                if compiled is not None:
+                    sanitized = compiled.sub('[CUSTOM_REDACTED]', sanitized)
+
+        return sanitized
+
+    def sanitize(message: str, sensitive_patterns: Optional[list[str]] = None) -> str:
+        # Scan only the leading whole tokens of huge messages so they don't cost
+        # a full regex pass per pattern. Redaction shrinks text, so the result
+        # is used only if it still reaches past the output limit by the slack;
+        # otherwise a token straddling the cut could surface half-redacted.
+        if len(message) > scan_limit:
+            window = _sanitize_scan_window(message, scan_limit)
+            if window is not None:
+                sanitized = redact(window, sensitive_patterns)
+                if len(sanitized) >= scan_limit:
+                    return _apply_additional_sanitization(sanitized, debug_level, truncated=True)
+
+        # Additional security measures
+        return _apply_additional_sanitization(redact(message, sensitive_patterns), debug_level)
+
+    return sanitize
+
+
+_SANITIZE_PROD = _make_sanitizer(_SANITIZE_PATTERNS, _HYPERSCAN_DB, debug_level=False)
+_SANITIZE_DEBUG = _make_sanitizer(_SANITIZE_DEBUG_PATTERNS, _HYPERSCAN_DEBUG_DB, debug_level=True)
+
+
 def sanitize_log_message(message: str, sensitive_patterns: Optional[list[str]] = None, debug_level: bool = False) -> str:
     """
     Enhanced log message sanitization to prevent information disclosure.
@@ -304,220 +940,42 @@ def sanitize_log_message(message: str, sensitive_patterns: Optional[list[str]] =
     if not isinstance(message, str):
         return str(message)
 
-    # Default sensitive patterns to redact
-    default_patterns = [
-        # File paths - redact home directory and username
-        (r'/home/[^/\s]+', '/home/[USER]'),
-        (r'C:[/\\]+Users[/\\]+[^/\\\\s]+', 'C:/Users/[USER]'),
-        (r'/Users/[^/\s]+', '/Users/[USER]'),  # macOS
-
-        # Email addresses
-        (r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', '[EMAIL]'),
-
-        # IP addresses (all ranges)
-        (
-            r'\b(?:192\.168\.\d{1,3}\.\d{1,3}|10\.\d{1,3}\.\d{1,3}\.\d{1,3}|172\.(?:1[6-9]|2[0-9]|3[0-1])\.\d{1,3}\.\d{1,3})\b',
-            '[PRIVATE_IP]'),
-        (
-            r'\b(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\b',
-            '[IP_ADDRESS]'),
-        (r'\b(?:[0-9a-fA-F]{1,4}:){7}[0-9a-fA-F]{1,4}\b', '[IPV6_ADDRESS]'),
-
-        # URLs with authentication
-        (r'https?://[^:]+:[^@]+@', 'https://[CREDENTIALS]@'),
-        (r'(?:ftp|sftp)://[^:]+:[^@]+@', '[PROTOCOL]://[CREDENTIALS]@'),
-
-        # Credentials and secrets (enhanced patterns)
-        (r'(?i)password["\s]*[:=]["\s]*[^\s"\']+', 'password="[REDACTED]"'),
-        (r'(?i)passwd["\s]*[:=]["\s]*[^\s"\']+', 'passwd="[REDACTED]"'),
-        (r'(?i)token["\s]*[:=]["\s]*[^\s"\']+', 'token="[REDACTED]"'),
-        (r'(?i)api_?key["\s]*[:=]["\s]*[^\s"\']+', 'api_key="[REDACTED]"'),
-        (r'(?i)secret["\s]*[:=]["\s]*[^\s"\']+', 'secret="[REDACTED]"'),
-        (r'(?i)auth["\s]*[:=]["\s]*[^\s"\']+', 'auth="[REDACTED]"'),
-        (r'(?i)authorization["\s]*[:=]["\s]*[^\s"\']+', 'authorization="[REDACTED]"'),
-        (r'(?i)bearer["\s]+[^\s"\']+', 'bearer [REDACTED]'),
-
-        # Cryptographic material
-        (r'\b[a-fA-F0-9]{32,}\b', '[HEX_STRING]'),  # Hashes, keys
-        (r'-----BEGIN [^-]+-----[^-]+-----END [^-]+-----', '[CERTIFICATE/KEY]'),
-        (r'\b[A-Za-z0-9+/]{40,}={0,2}\b', '[BASE64_DATA]'),  # Base64 encoded data
-
-        # Session and security tokens
-        (r'(?i)session["\s]*[:=]["\s]*[^\s"\']+', 'session="[REDACTED]"'),
-        (r'(?i)cookie["\s]*[:=]["\s]*[^\s"\']+', 'cookie="[REDACTED]"'),
-        (r'(?i)csrf["\s]*[:=]["\s]*[^\s"\']+', 'csrf="[REDACTED]"'),
-        (r'(?i)nonce["\s]*[:=]["\s]*[^\s"\']+', 'nonce="[REDACTED]"'),
-
-        # Database connection strings
-        (r'(?i)(?:mysql|postgresql|sqlite|mongodb)://[^\s]+', '[DATABASE_URL]'),
-        (r'(?i)(?:user|username)["\s]*[:=]["\s]*[^\s"\']+', 'user="[USER]"'),
-
-        # System identifiers
-        (r'(?i)hostname["\s]*[:=]["\s]*[^\s"\']+', 'hostname="[HOSTNAME]"'),
-        (r'(?i)machine["\s]*[:=]["\s]*[^\s"\']+', 'machine="[MACHINE]"'),
-        (r'(?i)uuid["\s]*[:=]["\s]*[0-9a-fA-F-]{32,}', 'uuid="[UUID]"'),
-
-        # Process and system info
-        (r'\bpid["\s]*[:=]?\s*\d+', 'pid=[PID]'),
-        (r'\btid["\s]*[:=]?\s*\d+', 'tid=[TID]'),
-        (r'(?i)thread[_-]?id["\s]*[:=]["\s]*[^\s"\']+', 'thread_id="[THREAD_ID]"'),
-    ]
-
-    # Enhanced debug-level sanitization patterns
-    debug_patterns = [
-        # Package and system information
-        (r'packages=\[[^\]]*\]', 'packages=[LIST_REDACTED]'),
-        (r'selected=\[[^\]]*\]', 'selected=[LIST_REDACTED]'),
-        (r'installed=\[[^\]]*\]', 'installed=[LIST_REDACTED]'),
-        (r'dependencies=\[[^\]]*\]', 'dependencies=[LIST_REDACTED]'),
-
-        # Command outputs and system info
-        (r'(?i)(?:update|command|full)\s+output(?:\s+for[^:]+)?:\s*.*', 'Output: [CONTENT_REDACTED]'),
-        (r'(?i)Running\s+command:\s+.*', 'Running command: [COMMAND_REDACTED]'),
-        (r'(?i)Executing:\s+.*', 'Executing: [EXECUTION_REDACTED]'),
-        (r'(?i)Shell\s+command:\s+.*', 'Shell command: [SHELL_REDACTED]'),
-
-        # System and environment details
-        (r'(?i)environment:\s*\{[^}]*\}', 'environment: {[ENV_REDACTED]}'),
-        (r'(?i)env_vars?:\s*\{[^}]*\}', 'env_vars: {[ENV_REDACTED]}'),
-        (r'(?i)system_info:\s*\{[^}]*\}', 'system_info: {[SYS_REDACTED]}'),
-
-        # Version and architecture information
-        (r'\b\d+\.\d+\.\d+[\w.-]*\b', '[VERSION]'),
-        (r'(?i)arch(?:itecture)?["\s]*[:=]["\s]*[^\s"\']+', 'arch="[ARCH]"'),
-        (r'(?i)platform["\s]*[:=]["\s]*[^\s"\']+', 'platform="[PLATFORM]"'),
-        (r'(?i)kernel["\s]*[:=]["\s]*[^\s"\']+', 'kernel="[KERNEL]"'),
-
-        # File system paths and details
-        (r'/usr/[^\s]+', '/usr/[PATH]'),
-        (r'/etc/[^\s]+', '/etc/[PATH]'),
-        (r'/var/[^\s]+', '/var/[PATH]'),
-        (r'/tmp/[^\s]+', '/tmp/[PATH]'),
-        (r'/opt/[^\s]+', '/opt/[PATH]'),
-        (r'/lib[^/]*[^\s]*', '/lib[PATH]'),
-        (r'/bin/[^\s]+', '/bin/[PATH]'),
-        (r'/sbin/[^\s]+', '/sbin/[PATH]'),
-
-        # Network and connection details
-        (r'(?i)port["\s]*[:=]?\s*\d+', 'port=[PORT]'),
-        (r'(?i)socket["\s]*[:=]["\s]*[^\s"\']+', 'socket="[SOCKET]"'),
-        (r'(?i)interface["\s]*[:=]["\s]*[^\s"\']+', 'interface="[INTERFACE]"'),
-
-        # Process identifiers and thread info
-        (r'thread_[a-f0-9]{8,}', 'thread_[ID]'),
-        (r'process_[a-f0-9]{8,}', 'process_[ID]'),
-        (r'job_[a-f0-9]{8,}', 'job_[ID]'),
-        (r'task_[a-f0-9]{8,}', 'task_[ID]'),
-
-        # Timing and performance data
-        (r'(?i)execution_time["\s]*[:=]["\s]*[\d.]+', 'execution_time="[TIME]"'),
-        (r'(?i)duration["\s]*[:=]["\s]*[\d.]+', 'duration="[TIME]"'),
-        (r'(?i)elapsed["\s]*[:=]["\s]*[\d.]+', 'elapsed="[TIME]"'),
-        (r'(?i)latency["\s]*[:=]["\s]*[\d.]+', 'latency="[TIME]"'),
-
-        # Memory and resource usage
-        (r'(?i)memory["\s]*[:=]["\s]*[\d.]+[^\s]*', 'memory="[MEMORY]"'),
-        (r'(?i)cpu["\s]*[:=]["\s]*[\d.]+%?', 'cpu="[CPU]"'),
-        (r'(?i)disk["\s]*[:=]["\s]*[\d.]+[^\s]*', 'disk="[DISK]"'),
-        (r'(?i)load["\s]*[:=]["\s]*[\d.]+', 'load="[LOAD]"'),
-
-        # Configuration details
-        (r'(?i)config["\s]*[:=]\s*\{[^}]*\}', 'config={[CONFIG_REDACTED]}'),
-        (r'(?i)settings["\s]*[:=]\s*\{[^}]*\}', 'settings={[SETTINGS_REDACTED]}'),
-        (r'(?i)options["\s]*[:=]\s*\{[^}]*\}', 'options={[OPTIONS_REDACTED]}'),
-
-        # Error context and stack traces
-        (r'(?i)traceback["\s]*[:=][^,}]+', 'traceback="[TRACEBACK_REDACTED]"'),
-        (r'(?i)stack["\s]*[:=][^,}]+', 'stack="[STACK_REDACTED]"'),
-        (r'(?i)backtrace["\s]*[:=][^,}]+', 'backtrace="[BACKTRACE_REDACTED]"'),
-
-        # User and session context
-        (r'(?i)current_user["\s]*[:=]["\s]*[^\s"\']+', 'current_user="[USER]"'),
-        (r'(?i)logged_in_user["\s]*[:=]["\s]*[^\s"\']+', 'logged_in_user="[USER]"'),
-        (r'(?i)active_session["\s]*[:=]["\s]*[^\s"\']+', 'active_session="[SESSION]"'),
-
-        # Application state
-        (r'(?i)state["\s]*[:=]\s*\{[^}]*\}', 'state={[STATE_REDACTED]}'),
-        (r'(?i)context["\s]*[:=]\s*\{[^}]*\}', 'context={[CONTEXT_REDACTED]}'),
-        (r'(?i)metadata["\s]*[:=]\s*\{[^}]*\}', 'metadata={[METADATA_REDACTED]}'),
-    ]
-
-    # Production-safe patterns (always applied regardless of debug level)
-    production_patterns = [
-        # Credit card numbers
-        (r'\b(?:\d{4}[-\s]?){3}\d{4}\b', '[CREDIT_CARD]'),
-
-        # Social security numbers
-        (r'\b\d{3}-\d{2}-\d{4}\b', '[SSN]'),
-
-        # Phone numbers
-        (r'\b(?:\+?1[-.\s]?)?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}\b', '[PHONE]'),
-
-        # More generic credentials
-        (r'(?i)(?:key|pass|secret|token|auth)[_-]?[a-zA-Z0-9]{16,}', '[CREDENTIAL]'),
-
-        # JSON Web Tokens
-        (r'\beyJ[A-Za-z0-9_-]*\.[A-Za-z0-9_-]*\.[A-Za-z0-9_-]*\b', '[JWT_TOKEN]'),
-
-        # AWS/Cloud credentials
-        (r'\bAKIA[0-9A-Z]{16}\b', '[AWS_ACCESS_KEY]'),
-        (r'\b[0-9a-zA-Z/+]{40}\b', '[AWS_SECRET_KEY]'),
-
-        # Private keys and certificates (additional patterns)
-        (r'(?i)private[_-]?key["\s]*[:=]["\s]*[^\s"\']+', 'private_key="[REDACTED]"'),
-        (r'(?i)public[_-]?key["\s]*[:=]["\s]*[^\s"\']+', 'public_key="[REDACTED]"'),
-        (r'(?i)certificate["\s]*[:=]["\s]*[^\s"\']+', 'certificate="[REDACTED]"'),
-    ]
-
-    # Combine patterns based on debug level
-    patterns = default_patterns + production_patterns
-    if debug_level:
-        patterns.extend(debug_patterns)
-
-    if sensitive_patterns:
-        patterns.extend([(pattern, '[CUSTOM_REDACTED]') for pattern in sensitive_patterns])
-
-    sanitized = message
-    for pattern, replacement in patterns:
-        try:
-            sanitized = re.sub(pattern, replacement, sanitized, flags=re.IGNORECASE)
-        except Exception as e:
-            # If regex fails, log it but continue with next pattern
-            logger = get_logger(__name__)
-            logger.debug(f"Sanitization pattern failed: {e}")
-            continue
-
-    # Additional security measures
-    sanitized = _apply_additional_sanitization(sanitized, debug_level)
+    return (_SANITIZE_DEBUG if debug_level else _SANITIZE_PROD)(message, sensitive_patterns)
 
-    return sanitized
 
-
-def _apply_additional_sanitization(message: str, debug_level: bool = False) -> str:
+def _apply_additional_sanitization(message: str, debug_level: bool = False,
+                                   truncated: bool = False) -> str:
     """
     Apply additional sanitization measures.
 
     Args:
         message: Message to sanitize
         debug_level: Whether this is for debug logging
+        truncated: Whether the input was already cut before pattern scanning
 
     Returns:
         Further sanitized message
     """
     # Limit message length to prevent log flooding
     max_length = 2000 if debug_level else 1000
-    if len(message) > max_length:
+    if truncated or len(message) > max_length:
         message = message[:max_length] + '... [TRUNCATED]'
 
-    # Remove control characters that might cause issues
-    message = re.sub(r'[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F]', '[CTRL]', message)
+    # Remove control characters that might cause issues; isprintable() is a
+    # cheap C-level precheck that is False whenever any of them is present
+    printable = message.isprintable()
+    if not printable:
+        message = _CTRL_RE.sub('[CTRL]', message)
 
-    # Normalize whitespace
-    message = re.sub(r'\s+', ' ', message).strip()
+    # Normalize whitespace. Printable text can only contain plain spaces, so
+    # the regex pass is needed only for runs of them or other whitespace.
+    if not printable or '  ' in message:
+        message = _WS_RE.sub(' ', message)
+    message = message.strip()
 
     # Remove repeated patterns that might indicate attempts to bypass sanitization
-    message = re.sub(r'(\[REDACTED\][\s,]*){3,}', '[MULTIPLE_REDACTED]', message)
-    message = re.sub(r'(\[CREDENTIAL\][\s,]*){3,}', '[MULTIPLE_CREDENTIALS]', message)
+    message = _REDACTED_RE.sub('[MULTIPLE_REDACTED]', message)
+    message = _CRED_RE.sub('[MULTIPLE_CREDENTIALS]', message)
 
     return message
 
@@ -533,7 +991,10 @@ def sanitize_debug_message(message: str, extra_patterns: Optional[list[str]] = N
     Returns:
         Sanitized debug message
     """
-    return sanitize_log_message(message, extra_patterns, debug_level=True)
+    if not isinstance(message, str):
+        return str(message)
+
+    return _SANITIZE_DEBUG(message, extra_patterns)
 
 
 def create_secure_debug_logger(name: str, enable_debug: bool = False) -> Any:
@@ -561,18 +1022,26 @@ def create_secure_debug_logger(name: str, enable_debug: bool = False) -> Any:
                 self._logger.debug(sanitized_msg, *args, **kwargs)
 
         def info(self, msg: Any, *args: Any, **kwargs: Any) -> None:
+            if not self._logger.isEnabledFor(logging.INFO):
+                return
             sanitized_msg = sanitize_log_message(str(msg))
             self._logger.info(sanitized_msg, *args, **kwargs)
 
         def warning(self, msg: Any, *args: Any, **kwargs: Any) -> None:
+            if not self._logger.isEnabledFor(logging.WARNING):
+                return
             sanitized_msg = sanitize_log_message(str(msg))
             self._logger.warning(sanitized_msg, *args, **kwargs)
 
         def error(self, msg: Any, *args: Any, **kwargs: Any) -> None:
+            if not self._logger.isEnabledFor(logging.ERROR):
+                return
             sanitized_msg = sanitize_log_message(str(msg))
             self._logger.error(sanitized_msg, *args, **kwargs)
 
         def critical(self, msg: Any, *args: Any, **kwargs: Any) -> None:
+            if not self._logger.isEnabledFor(logging.CRITICAL):
+                return
             sanitized_msg = sanitize_log_message(str(msg))
             self._logger.critical(sanitized_msg, *args, **kwargs)
 
@@ -583,71 +1052,265 @@ def create_secure_debug_logger(name: str, enable_debug: bool = False) -> Any:
     return SecureDebugLogger(logger)
 
 
+def _get_security_fh() -> Optional[io.BufferedWriter]:
+    """
+    Get the persistent buffered handle for the security log.
+
+    The file is opened on first use and reopened when the security log path
+    changes. Must be called with _global_state_lock held.
+
+    Returns:
+        Buffered writer for _security_log_path, or None if it is not set
+    """
+    global _security_log_fh, _security_log_fh_path
+
+    if _security_log_fh is not None and _security_log_fh_path == _security_log_path:
+        return _security_log_fh
+
+    if _security_log_fh is not None:
+        try:
+            _security_log_fh.close()
+        except OSError:
+            pass
+        _security_log_fh = None
+
+    if not _security_log_path:
+        return None
+
+    _security_log_fh = io.BufferedWriter(
+        open(_security_log_path, 'ab', buffering=0), buffer_size=65536
+    )
+    _security_log_fh_path = _security_log_path
+    return _security_log_fh
+
+
+def _flush_security_log() -> None:
+    """Flush buffered security log entries, periodically and at interpreter exit."""
+    global _sec_last_flush, _sec_pending
+    with _global_state_lock:
+        if _security_log_fh is not None:
+            try:
+                _security_log_fh.flush()
+            except (OSError, ValueError):
+                pass
+        _sec_last_flush = time.monotonic()
+        _sec_pending = False
+
+
+atexit.register(_flush_security_log)
+
+
+def _iso_timestamp(now: float) -> str:
+    """
+    Format a Unix timestamp like datetime.isoformat() with microseconds.
+
+    The date/time prefix is cached per second so bursts of events only
+    pay for formatting the microsecond suffix.
+
+    Args:
+        now: Unix timestamp from time.time()
+
+    Returns:
+        Local-time ISO 8601 timestamp
+    """
+    global _iso_cache
+    seconds = int(now)
+    cached_seconds, prefix = _iso_cache
+    if cached_seconds != seconds:
+        prefix = datetime.fromtimestamp(seconds).strftime('%Y-%m-%dT%H:%M:%S')
+        _iso_cache = (seconds, prefix)
+    return f"{prefix}.{int((now - seconds) * 1_000_000):06d}"
+
+
 def log_security_event(event_type: str, details: Optional[dict[str, Any]] = None, severity: str = "warning") -> None:
     """
     Log a security event with rate limiting and metrics.
-    
+
+    The event is queued and handled by a background worker, which applies
+    rate limiting, sanitizes the details and writes the log entries, so
+    callers never block on sanitization or file I/O.
+
     Args:
         event_type: Type of security event
         details: Event details (will be sanitized)
         severity: Log severity level
     """
-    
+    event = {
+        'event_type': event_type,
+        'details': dict(details) if details else None,
+        'severity': severity,
+        'ts': time.time(),
+        'mono': time.monotonic(),
+        'thread': threading.current_thread().name,
+    }
+
+    # Nothing drains the queue once the worker was stopped at exit
+    if _security_worker_stopped:
+        try:
+            line = _process_security_event(event)
+        except Exception:
+            return
+        if line is not None:
+            _write_security_lines([line], flush_now=True)
+        return
+
+    if _security_worker is None:
+        _start_security_worker()
+
+    _security_queue.put(event)
+
+
+def _start_security_worker() -> None:
+    """Start the security event worker thread if it is not running yet."""
+    global _security_worker
+    with _global_state_lock:
+        if _security_worker is None:
+            _security_worker = threading.Thread(
+                target=_security_worker_loop, name="SecurityEventWorker", daemon=True
+            )
+            _security_worker.start()
+
+
+def _security_worker_loop() -> None:
+    """
+    Process queued security events in batches until a None sentinel arrives.
+
+    Entries accumulate in the security log's write buffer and are flushed
+    when it fills, when a severe event arrives, or once _SECURITY_FLUSH_INTERVAL
+    seconds pass with entries pending.
+    """
+    while True:
+        try:
+            timeout = max(0.0, _SECURITY_FLUSH_INTERVAL - (time.monotonic() - _sec_last_flush))
+            batch = [_security_queue.get(timeout=timeout if _sec_pending else None)]
+        except queue.Empty:
+            # Time-based flush while idle
+            _flush_security_log()
+            continue
+
+        while len(batch) < _SECURITY_BATCH_SIZE:
+            try:
+                batch.append(_security_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        lines: list[bytes] = []
+        flush_now = False
+        stop = False
+        for event in batch:
+            if event is None:
+                stop = True
+                continue
+            try:
+                line = _process_security_event(event)
+            except Exception:
+                # Never let one bad event kill the worker
+                continue
+            if line is not None:
+                lines.append(line)
+                flush_now = flush_now or event['severity'] in ('critical', 'error')
+
+        if lines:
+            _write_security_lines(lines, flush_now)
+
+        if stop:
+            return
+
+
+def _write_security_lines(lines: list[bytes], flush_now: bool) -> None:
+    """
+    Append entries to the security log's write buffer.
+
+    The buffer is flushed when flush_now is set or once _SECURITY_FLUSH_INTERVAL
+    seconds passed since the last flush.
+
+    Args:
+        lines: JSON lines built by _process_security_event
+        flush_now: Whether the entries must reach the disk immediately
+    """
+    global _sec_last_flush, _sec_pending
+
+    try:
+        with _global_state_lock:
+            security_fh = _get_security_fh()
+            if security_fh is not None:
+                security_fh.writelines(lines)
+                _sec_pending = True
+                if flush_now or time.monotonic() - _sec_last_flush >= _SECURITY_FLUSH_INTERVAL:
+                    security_fh.flush()
+                    _sec_last_flush = time.monotonic()
+                    _sec_pending = False
+    except (OSError, IOError) as e:
+        # Don't fail if we can't write to security log
+        get_logger("security").debug(f"Failed to write to security log: {e}")
+
+
+def _process_security_event(event: Dict[str, Any]) -> Optional[bytes]:
+    """
+    Rate limit, sanitize and log one queued security event.
+
+    Args:
+        event: Raw event queued by log_security_event
+
+    Returns:
+        JSON line for the dedicated security log, or None if nothing to write
+    """
+    event_type = event['event_type']
+    details = event['details']
+    severity = event['severity']
+
+    security_logger = get_logger("security")
+
     # Check rate limiting
     with _global_state_lock:
-        current_time = datetime.now()
-        event_info = _security_event_counts.get(event_type, {})
-        
-        if event_info:
-            time_since_first = (current_time - event_info['first_time']).total_seconds()
-            
-            # Reset window if expired
-            if time_since_first > _security_rate_limit_window:
-                event_info = {'count': 0, 'first_time': current_time, 'last_time': current_time}
-            
-            # Check if rate limit exceeded
-            if event_info['count'] >= _security_rate_limit_max:
-                if event_info.get('rate_limit_logged', False) is False:
-                    # Log once that we're rate limiting
-                    security_logger = get_logger("security")
-                    security_logger.warning(
-                        f"RATE_LIMIT: Suppressing further {event_type} events for {_security_rate_limit_window}s"
-                    )
-                    event_info['rate_limit_logged'] = True
-                return
+        now = event['mono']
+        first = _sec_first.get(event_type)
+
+        # Start a new window on first sight or once the current one expired
+        if first is None or now - first > _security_rate_limit_window:
+            _sec_count[event_type] = 0
+            _sec_first[event_type] = now
+            _sec_ratelogged.discard(event_type)
+
+        # Check if rate limit exceeded
+        suppressed = _sec_count[event_type] >= _security_rate_limit_max
+        log_suppression = suppressed and event_type not in _sec_ratelogged
+        if suppressed:
+            _sec_ratelogged.add(event_type)
         else:
-            event_info = {'count': 0, 'first_time': current_time, 'last_time': current_time}
-        
-        # Update event count
-        event_info['count'] += 1
-        event_info['last_time'] = current_time
-        _security_event_counts[event_type] = event_info
-    
-    security_logger = get_logger("security")
+            # Update event count
+            _sec_count[event_type] += 1
+
+    # Log outside the lock, logging may create loggers which takes it again
+    if suppressed:
+        if log_suppression:
+            # Log once that we're rate limiting
+            security_logger.warning(
+                f"RATE_LIMIT: Suppressing further {event_type} events for {_security_rate_limit_window}s"
+            )
+        return None
 
     # Gather enriched context
     context = {
-        'timestamp': datetime.now().isoformat(),
+        'timestamp': _iso_timestamp(event['ts']),
         'event_type': event_type,
         'severity': severity,
-        'pid': os.getpid(),
-        'uid': os.getuid() if hasattr(os, 'getuid') else 'N/A',
-        'user': os.environ.get('USER', 'unknown'),
+        'pid': _PID,
+        'uid': _UID,
+        'user': _USER,
     }
     
-    # Add thread info if in multi-threaded context
-    current_thread = threading.current_thread()
-    if current_thread.name != 'MainThread':
-        context['thread'] = current_thread.name
+    # Add thread info if logged from a multi-threaded context
+    if event['thread'] != 'MainThread':
+        context['thread'] = event['thread']
     
-    # Sanitize event details
+    # Sanitize event details; keys come from a small fixed set so their
+    # sanitized form is cached and only values are scanned per event
     if details:
-        sanitized_details = {}
-        for key, value in details.items():
-            # Sanitize both key and value
-            safe_key = sanitize_log_message(str(key))
-            safe_value = sanitize_log_message(str(value))
-            sanitized_details[safe_key] = safe_value
+        sanitized_details = {
+            _sanitize_detail_key(str(key)): sanitize_log_message(str(value))
+            for key, value in details.items()
+        }
     else:
         sanitized_details = {}
 
@@ -671,21 +1334,6 @@ def log_security_event(event_type: str, details: Optional[dict[str, Any]] = None
     else:
         security_logger.info(log_msg)
     
-    # Also write to dedicated security log if available
-    if _security_log_path:
-        try:
-            with open(_security_log_path, 'a') as f:
-                # Write JSON formatted entry for easier parsing
-                security_entry = {
-                    **context,
-                    'message': log_msg,
-                    'details': sanitized_details
-                }
-                f.write(json.dumps(security_entry) + '\n')
-        except (OSError, IOError) as e:
-            # Don't fail if we can't write to security log
-            security_logger.debug(f"Failed to write to security log: {e}")
-    
     # Record metrics
     try:
         from .security_metrics import record_security_metric
@@ -698,19 +1346,103 @@ def log_security_event(event_type: str, details: Optional[dict[str, Any]] = None
         # Don't fail if metrics recording fails
         security_logger.debug(f"Failed to record security metric: {e}")
 
+    # Entry for the dedicated security log, JSON formatted for easier parsing
+    if not _security_log_path:
+        return None
+    return _json_line({
+        **context,
+        'message': log_msg,
+        'details': sanitized_details
+    })
+
+
+@functools.lru_cache(maxsize=256)
+def _sanitize_detail_key(key: str) -> str:
+    """Sanitize a security event detail key, caching the result."""
+    return sanitize_log_message(key)
+
+
+def _stop_security_worker(timeout: float = 2.0) -> None:
+    """
+    Let the security worker drain queued events before interpreter exit.
+
+    Events logged afterwards, e.g. by later atexit handlers, are written
+    synchronously by log_security_event.
+    """
+    global _security_worker_stopped
+    _security_worker_stopped = True
+    worker = _security_worker
+    if worker is not None and worker.is_alive():
+        _security_queue.put(None)
+        worker.join(timeout)
+
+
+def _reset_security_worker_after_fork() -> None:
+    """
+    Reset the worker thread, queue, security log handle and cached PID in a forked child.
+
+    The inherited handle still buffers the parent's unflushed entries, so it is
+    dropped without flushing; closing its raw file first keeps the buffer from
+    being flushed when the writer is garbage collected.
+    """
+    global _security_queue, _security_worker, _security_worker_stopped, _PID
+    global _security_log_fh, _security_log_fh_path, _sec_pending, _global_state_lock
+
+    # The lock may have been held by a thread that does not exist in the child
+    _global_state_lock = threading.Lock()
+    _security_queue = queue.SimpleQueue()
+    _security_worker = None
+    _security_worker_stopped = False
+    _PID = os.getpid()
+
+    inherited_fh = _security_log_fh
+    _security_log_fh = None
+    _security_log_fh_path = None
+    _sec_pending = False
+    if inherited_fh is not None:
+        try:
+            inherited_fh.raw.close()
+        except (OSError, ValueError):
+            pass
+
+
+# Registered after _flush_security_log so it runs first at exit
+atexit.register(_stop_security_worker)
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_security_worker_after_fork)
+
 
 class ContextualSanitizer:
     """Context-aware log sanitization for different application components."""
 
+    __slots__ = ('component_name', 'component_patterns')
+
+    # Compiled component patterns shared by all instances, keyed by component name
+    _COMPILED_COMPONENTS: Dict[str, tuple[tuple[re.Pattern[str], str], ...]] = {}
+
     def __init__(self, component_name: str):
         self.component_name = component_name
-        self.component_patterns = self._get_component_patterns()
+        compiled = ContextualSanitizer._COMPILED_COMPONENTS.get(component_name)
+        if compiled is None:
+            compiled = ContextualSanitizer._compile_for(component_name)
+        self.component_patterns = compiled
+
+    @classmethod
+    def _compile_for(cls, component_name: str) -> tuple[tuple[re.Pattern[str], str], ...]:
+        """Compile and memoize the patterns for a component."""
+        compiled = tuple(
+            (re.compile(pattern, re.IGNORECASE), replacement)
+            for pattern, replacement in cls._get_component_patterns(component_name)
+        )
+        cls._COMPILED_COMPONENTS[component_name] = compiled
+        return compiled
 
-    def _get_component_patterns(self) -> list[tuple[str, str]]:
+    @staticmethod
+    def _get_component_patterns(component_name: str) -> list[tuple[str, str]]:
         """Get sanitization patterns specific to component."""
         patterns = []
 
-        if self.component_name in ['network', 'feed', 'http']:
+        if component_name in ['network', 'feed', 'http']:
             patterns.extend([
                 (r'(?i)url["\s]*[:=]["\s]*[^\s"\']+', 'url="[URL_REDACTED]"'),
                 (r'(?i)endpoint["\s]*[:=]["\s]*[^\s"\']+', 'endpoint="[ENDPOINT_REDACTED]"'),
@@ -719,7 +1451,7 @@ class ContextualSanitizer:
                 (r'(?i)headers["\s]*[:=]\s*\{[^}]*\}', 'headers={[HEADERS_REDACTED]}'),
             ])
 
-        elif self.component_name in ['package', 'pacman', 'system']:
+        elif component_name in ['package', 'pacman', 'system']:
             patterns.extend([
                 (r'(?i)package[_\s]list["\s]*[:=][^,}]+', 'package_list="[PACKAGES_REDACTED]"'),
                 (r'(?i)installed[_\s]packages["\s]*[:=][^,}]+', 'installed_packages="[PACKAGES_REDACTED]"'),
@@ -727,7 +1459,7 @@ class ContextualSanitizer:
                 (r'(?i)dependencies["\s]*[:=][^,}]+', 'dependencies="[DEPS_REDACTED]"'),
             ])
 
-        elif self.component_name in ['gui', 'ui', 'interface']:
+        elif component_name in ['gui', 'ui', 'interface']:
             patterns.extend([
                 (r'(?i)user[_\s]input["\s]*[:=][^,}]+', 'user_input="[INPUT_REDACTED]"'),
                 (r'(?i)form[_\s]data["\s]*[:=][^,}]+', 'form_data="[FORM_REDACTED]"'),
@@ -735,7 +1467,7 @@ class ContextualSanitizer:
                 (r'(?i)widget[_\s]state["\s]*[:=][^,}]+', 'widget_state="[STATE_REDACTED]"'),
             ])
 
-        elif self.component_name in ['config', 'settings']:
+        elif component_name in ['config', 'settings']:
             patterns.extend([
                 (r'(?i)configuration["\s]*[:=]\s*\{[^}]*\}', 'configuration={[CONFIG_REDACTED]}'),
                 (r'(?i)preferences["\s]*[:=]\s*\{[^}]*\}', 'preferences={[PREFS_REDACTED]}'),
@@ -758,15 +1490,13 @@ class ContextualSanitizer:
         # Apply component-specific patterns first
         sanitized = message
         for pattern, replacement in self.component_patterns:
-            try:
-                sanitized = re.sub(pattern, replacement, sanitized, flags=re.IGNORECASE)
-            except Exception:
-                continue
+            sanitized = pattern.sub(replacement, sanitized)
 
         # Apply general sanitization
         return sanitize_log_message(sanitized, debug_level=debug_level)
 
 
+@functools.lru_cache(maxsize=64)
 def get_contextual_sanitizer(component_name: str) -> ContextualSanitizer:
     """
     Get a context-aware sanitizer for a specific component.
@@ -775,6 +1505,6 @@ def get_contextual_sanitizer(component_name: str) -> ContextualSanitizer:
         component_name: Name of the component
 
     Returns:
-        ContextualSanitizer instance
+        ContextualSanitizer instance, shared by all callers for the component
     """
     return ContextualSanitizer(component_name)
@@ -6,21 +6,137 @@ Shared utility for running pacman commands.
 
 from __future__ import annotations
 
+import asyncio
 import tempfile
 import os
+import shlex
 import time
 import subprocess
 from typing import List, Tuple, Optional, Dict, Any
 from datetime import datetime
-from pathlib import Path
 import re
 
+from ..constants import CACHE_DIR_PERMISSIONS, get_cache_dir
 from ..utils.logger import get_logger, log_security_event
 from ..utils.update_history import UpdateHistoryEntry
 from .subprocess_wrapper import SecureSubprocess
 
 logger = get_logger(__name__)
 
+# Pacman sync database directory and the (directory mtime, result) pair
+# last computed by get_database_last_sync_time
+_SYNC_DIR = "/var/lib/pacman/sync"
+_sync_cache: Optional[Tuple[float, Optional[datetime]]] = None
+
+# Full system upgrades are logged as "starting full system upgrade"; only the
+# tail of the log is scanned, newest chunk first
+_PACMAN_LOG = "/var/log/pacman.log"
+_FULL_UPDATE_RE = re.compile(
+    rb'\[(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})[+-]\d{4}\][^\n]*starting full system upgrade'
+)
+_LOG_SCAN_CHUNK = 64 * 1024
+_LOG_SCAN_MAX_BYTES = 10 * 1024 * 1024
+
+# Terminal emulators tried in order, with the arguments preceding the command
+_TERMINAL_TEMPLATES: Tuple[Tuple[str, ...], ...] = (
+    ('gnome-terminal', '--'),
+    ('konsole', '-e'),
+    ('xfce4-terminal', '-e'),
+    ('xterm', '-e'),
+    ('alacritty', '-e'),
+    ('termite', '-e'),
+    ('kitty', '--'),
+    ('tilix', '-e'),
+)
+# Terminals whose -e option takes the whole command as one string
+_SINGLE_STRING_TERMINALS = frozenset({'xfce4-terminal', 'termite'})
+
+# Terminal emulator that last launched an update successfully
+_last_terminal: Optional[str] = None
+
+# Update script run inside the terminal. Its content never changes: the output
+# file and the packages arrive as positional parameters, already tokenized, so
+# bash never re-parses them.
+_UPDATE_SCRIPT = '''#!/bin/bash
+set -e
+set -o pipefail
+
+# Usage: pacman_update.sh OUTPUT_FILE PACKAGE...
+OUT="$1"
+shift
+
+echo "Starting package update..."
+echo "Command: sudo pacman -Su --noconfirm $*"
+echo
+
+# Use -Su to upgrade selected packages and capture exit code securely
+if sudo pacman -Su --noconfirm "$@" 2>&1 | tee "$OUT"; then
+    EXIT_CODE=${PIPESTATUS[0]}
+else
+    EXIT_CODE=$?
+fi
+
+echo "$EXIT_CODE" > "$OUT.exitcode"
+
+echo
+if [ "$EXIT_CODE" -eq 0 ]; then
+    echo "Update completed successfully!"
+else
+    echo "Update failed with exit code: $EXIT_CODE"
+fi
+
+echo "Press Enter to close this window..."
+
+# The update is finished: release stdout/stderr so anything reading them sees
+# EOF now instead of when the window is closed
+exec >/dev/null 2>&1
+read -r
+'''
+_update_script_path: Optional[str] = None
+
+
+def _get_update_script() -> str:
+    """
+    Return the path of the update script, writing it once per process.
+
+    The script lives in the user's cache directory rather than being created
+    and deleted around every update, which also keeps it in place while the
+    terminal emulator starts up and reads it.
+
+    Returns:
+        Path of the owner-only executable script
+    """
+    global _update_script_path
+    if _update_script_path is not None and os.path.exists(_update_script_path):
+        return _update_script_path
+
+    cache_dir = get_cache_dir()
+    cache_dir.mkdir(mode=CACHE_DIR_PERMISSIONS, parents=True, exist_ok=True)
+    script_path = str(cache_dir / 'pacman_update.sh')
+
+    # Rewrite on first use so a stale or altered copy is never run
+    fd = os.open(script_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_NOFOLLOW, 0o700)
+    with os.fdopen(fd, 'w') as f:
+        f.write(_UPDATE_SCRIPT)
+
+    # Set secure executable permissions (owner only)
+    os.chmod(script_path, 0o700)
+
+    _update_script_path = script_path
+    return script_path
+
+
+def _invalid_package_names(packages: List[str]) -> List[str]:
+    """
+    Return every package name that fails validation, in input order.
+
+    Applies the rule of SecureSubprocess.sanitize_package_name without
+    raising, so a whole package list is checked in one pass.
+    """
+    fullmatch = SecureSubprocess._PACKAGE_NAME_RE.fullmatch
+    max_length = SecureSubprocess._MAX_PACKAGE_NAME_LENGTH
+    return [pkg for pkg in packages if len(pkg) > max_length or not fullmatch(pkg)]
+
 
 class PacmanRunner:
     """Handles execution of pacman commands."""
@@ -28,22 +144,27 @@ class PacmanRunner:
     @staticmethod
     def get_database_last_sync_time() -> Optional[datetime]:
         """Get the last time the package database was synced."""
+        global _sync_cache
         try:
-            # Check multiple possible locations for pacman database
-            db_paths = [
-                "/var/lib/pacman/sync/core.db",
-                "/var/lib/pacman/sync/extra.db",
-                "/var/lib/pacman/sync/multilib.db"
-            ]
-            
-            latest_time = None
-            for db_path in db_paths:
-                if os.path.exists(db_path):
-                    mtime = os.path.getmtime(db_path)
-                    db_time = datetime.fromtimestamp(mtime)
-                    if latest_time is None or db_time > latest_time:
-                        latest_time = db_time
-            
+            # Syncing replaces the .db files, which updates the directory
+            # mtime, so an unchanged directory means an unchanged answer
+            try:
+                dir_mtime = os.stat(_SYNC_DIR).st_mtime
+            except FileNotFoundError:
+                return None
+
+            cached = _sync_cache
+            if cached is not None and cached[0] == dir_mtime:
+                return cached[1]
+
+            with os.scandir(_SYNC_DIR) as entries:
+                latest_mtime = max(
+                    (entry.stat().st_mtime for entry in entries if entry.name.endswith('.db')),
+                    default=None
+                )
+
+            latest_time = datetime.fromtimestamp(latest_mtime) if latest_mtime is not None else None
+            _sync_cache = (dir_mtime, latest_time)
             return latest_time
             
         except Exception as e:
@@ -54,53 +175,63 @@ class PacmanRunner:
     def get_last_full_update_time() -> Optional[datetime]:
         """Get the last time a full system update was performed (from pacman log)."""
         try:
-            pacman_log = "/var/log/pacman.log"
-            if not os.path.exists(pacman_log):
+            if not os.path.exists(_PACMAN_LOG):
                 return None
-            
-            # We'll look for patterns that indicate a full system update
-            # Full updates typically have "starting full system upgrade" in the log
-            full_update_pattern = re.compile(r'\[(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}[+-]\d{4})\].*starting full system upgrade')
-            
-            last_update_time = None
-            
-            # Read the log file from the end for efficiency (most recent entries first)
-            # We'll read the last 10MB of the log to find recent updates
-            max_bytes = 10 * 1024 * 1024  # 10MB
-            
-            with open(pacman_log, 'rb') as f:
-                # Seek to the end
+
+            # Read the log backwards in chunks, most recent entries first, and
+            # stop at the newest full system upgrade within the last 10MB
+            with open(_PACMAN_LOG, 'rb') as f:
                 f.seek(0, 2)
-                file_size = f.tell()
-                
-                # Read from max_bytes before end, or from start if file is smaller
-                start_pos = max(0, file_size - max_bytes)
-                f.seek(start_pos)
-                
-                # Read the content
-                content = f.read().decode('utf-8', errors='ignore')
-                
-                # Find all full system upgrade entries
-                for match in full_update_pattern.finditer(content):
-                    timestamp_str = match.group(1)
-                    try:
-                        # Parse the timestamp
-                        update_time = datetime.strptime(timestamp_str, '%Y-%m-%dT%H:%M:%S%z')
-                        # Remove timezone info for comparison
-                        update_time = update_time.replace(tzinfo=None)
-                        
-                        if last_update_time is None or update_time > last_update_time:
-                            last_update_time = update_time
-                    except Exception as e:
-                        logger.debug(f"Failed to parse timestamp {timestamp_str}: {e}")
-                        continue
-            
-            return last_update_time
+                pos = f.tell()
+                stop = max(0, pos - _LOG_SCAN_MAX_BYTES)
+                partial_line = b''
+
+                while pos > stop:
+                    start = max(stop, pos - _LOG_SCAN_CHUNK)
+                    f.seek(start)
+                    block = f.read(pos - start) + partial_line
+                    pos = start
+
+                    # The first line may begin in the preceding chunk; carry it over
+                    if pos > stop:
+                        cut = block.find(b'\n') + 1
+                        if cut:
+                            partial_line, block = block[:cut], block[cut:]
+                        else:
+                            partial_line, block = block, b''
+
+                    for match in reversed(list(_FULL_UPDATE_RE.finditer(block))):
+                        try:
+                            # Fixed-format local timestamp; timezone offset is ignored
+                            return datetime(*map(int, match.groups()))
+                        except ValueError as e:
+                            logger.debug(f"Failed to parse timestamp {match.group(0)[:26]!r}: {e}")
+                            continue
+
+            return None
             
         except Exception as e:
             logger.error(f"Failed to get last full update time from pacman log: {e}")
             return None
 
+    @staticmethod
+    async def get_sync_and_update_times() -> Tuple[Optional[datetime], Optional[datetime]]:
+        """
+        Get the database sync time and last full update time concurrently.
+
+        Both lookups are blocking file I/O, so they run in the loop's default
+        executor and the sync directory scan overlaps with the log read.
+
+        Returns:
+            Tuple of (database_last_sync_time, last_full_update_time)
+        """
+        loop = asyncio.get_running_loop()
+        sync_time, update_time = await asyncio.gather(
+            loop.run_in_executor(None, PacmanRunner.get_database_last_sync_time),
+            loop.run_in_executor(None, PacmanRunner.get_last_full_update_time)
+        )
+        return sync_time, update_time
+
     @staticmethod
     def sync_database(config) -> Dict[str, Any]:
         """
@@ -152,6 +283,20 @@ class PacmanRunner:
                 'error': str(e)
             }
 
+    @staticmethod
+    async def sync_database_async(config) -> Dict[str, Any]:
+        """
+        Sync pacman database without blocking the running event loop.
+
+        The blocking sync_database call runs in the loop's default executor,
+        so it keeps SecureSubprocess validation while other work proceeds.
+
+        Returns:
+            Same dict as sync_database
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, PacmanRunner.sync_database, config)
+
     @staticmethod
     def run_update_in_terminal(packages: List[str]) -> Optional[subprocess.Popen]:
         """
@@ -163,17 +308,14 @@ class PacmanRunner:
         Returns:
             Popen object if successful, None otherwise
         """
+        global _last_terminal
+
         # Validate all package names first
-        for pkg in packages:
-            try:
-                SecureSubprocess.sanitize_package_name(pkg)
-            except ValueError as e:
-                logger.error(f"Invalid package name: {pkg} - {e}")
-                return None
+        bad = _invalid_package_names(packages)
+        if bad:
+            logger.error(f"Invalid package names: {', '.join(bad)}")
+            return None
 
-        # Use -Su to upgrade selected packages
-        cmd_args = ["sudo", "pacman", "-Su", "--noconfirm"] + packages
-        
         # Log package update operation for security auditing
         log_security_event(
             "PACKAGE_UPDATE_INITIATED",
@@ -185,93 +327,47 @@ class PacmanRunner:
             severity="info"
         )
 
-        # Create a secure temporary file to capture output
-        import stat
+        # Create a secure temporary file to capture output; mkstemp already
+        # creates it with owner-only (0o600) permissions. The path is built by
+        # mkstemp from the temp dir and our fixed prefix/suffix, so it cannot
+        # traverse anywhere and needs no validate_log_path round trip.
         output_fd, output_path = tempfile.mkstemp(suffix='.log', prefix='asuc_pacman_')
         os.close(output_fd)  # Close the file descriptor, we'll open by path
 
-        # Set secure permissions (owner only)
-        os.chmod(output_path, stat.S_IRUSR | stat.S_IWUSR)  # 0o600
-
-        # Create secure script to avoid shell injection
-        from ..utils.validators import validate_log_path
-
-        # Validate output path for security
-        try:
-            validate_log_path(output_path)
-        except ValueError as e:
-            logger.error(f"Invalid output path: {e}")
-            return None
-
         # Create secure script file instead of shell command construction
-        script_fd, script_path = tempfile.mkstemp(suffix='.sh', prefix='asuc_pacman_')
         try:
-            # Build secure script content with validated arguments
-            script_content = f'''#!/bin/bash
-set -e
-set -o pipefail
-
-echo "Starting package update..."
-echo "Command: {' '.join(cmd_args)}"
-echo
-
-# Execute the command and capture exit code securely
-if {' '.join(cmd_args)} 2>&1 | tee "{output_path}"; then
-    EXIT_CODE=${{PIPESTATUS[0]}}
-else
-    EXIT_CODE=$?
-fi
-
-echo "$EXIT_CODE" > "{output_path}.exitcode"
-
-echo
-if [ "$EXIT_CODE" -eq 0 ]; then
-    echo "Update completed successfully!"
-else
-    echo "Update failed with exit code: $EXIT_CODE"
-fi
-
-echo "Press Enter to close this window..."
-read
-'''
+            script_path = _get_update_script()
+        except OSError as e:
+            logger.error(f"Failed to write update script: {e}")
+            return None
 
-            with os.fdopen(script_fd, 'w') as f:
-                f.write(script_content)
-
-            # Set secure executable permissions (owner only)
-            os.chmod(script_path, 0o700)
-
-            # Use array-based terminal commands to avoid injection
-            terminal_commands = [
-                ['gnome-terminal', '--', 'bash', script_path],
-                ['konsole', '-e', 'bash', script_path],
-                ['xfce4-terminal', '-e', f'bash {script_path}'],
-                ['xterm', '-e', 'bash', script_path],
-                ['alacritty', '-e', 'bash', script_path],
-                ['termite', '-e', f'bash {script_path}'],
-                ['kitty', '--', 'bash', script_path],
-                ['tilix', '-e', 'bash', script_path]
-            ]
-
-            for term_cmd in terminal_commands:
-                try:
-                    terminal = term_cmd[0]
-                    # Check if terminal exists
-                    if SecureSubprocess.check_command_exists(terminal):
-                        proc = SecureSubprocess.popen(term_cmd)
-                        logger.info(f"Started update in {terminal}")
-                        return proc
-                except (FileNotFoundError, OSError, ValueError):
-                    continue
+        script_argv = ['bash', script_path, output_path] + packages
 
-            return None
+        # Try the terminal that worked last time first, so the missing
+        # ones before it are not probed again on every update
+        templates = _TERMINAL_TEMPLATES
+        if _last_terminal is not None:
+            templates = sorted(templates, key=lambda template: template[0] != _last_terminal)
 
-        finally:
-            # Clean up script file
+        for template in templates:
             try:
-                os.unlink(script_path)
-            except (OSError, FileNotFoundError):
-                pass
+                terminal = template[0]
+                # Check if terminal exists
+                if SecureSubprocess.check_command_exists(terminal):
+                    # Use array-based terminal commands to avoid injection;
+                    # terminals that take a single command string get it shell-quoted
+                    if terminal in _SINGLE_STRING_TERMINALS:
+                        term_cmd = [*template, shlex.join(script_argv)]
+                    else:
+                        term_cmd = [*template, *script_argv]
+                    proc = SecureSubprocess.popen(term_cmd)
+                    _last_terminal = terminal
+                    logger.info(f"Started update in {terminal}")
+                    return proc
+            except (FileNotFoundError, OSError, ValueError):
+                continue
+
+        return None
 
     @staticmethod
     def run_update_interactive(packages: List[str], capture_output: bool = False) -> Tuple[int, float, Optional[str]]:
@@ -286,12 +382,11 @@ read
             Tuple of (exit_code, duration_sec, output_text)
         """
         # Validate all package names first
-        for pkg in packages:
-            try:
-                SecureSubprocess.sanitize_package_name(pkg)
-            except ValueError as e:
-                logger.error(f"Invalid package name: {pkg} - {e}")
-                return 1, 0.0, str(e)
+        bad = _invalid_package_names(packages)
+        if bad:
+            message = f"Invalid package names: {', '.join(bad)}"
+            logger.error(message)
+            return 1, 0.0, message
 
         cmd_args = ["-Su"] + packages
 
@@ -299,16 +394,16 @@ read
 
         try:
             if capture_output:
-                # Capture output
+                # Capture output, with stderr merged into stdout by the pipe
                 result = SecureSubprocess.run_pacman(
                     cmd_args,
                     require_sudo=True,
-                    capture_output=True,
+                    merge_stderr=True,
                     text=True,
                     check=False
                 )
                 exit_code = result.returncode
-                output = result.stdout + result.stderr
+                output = result.stdout
             else:
                 # Run interactively
                 result = SecureSubprocess.run_pacman(
@@ -329,6 +424,24 @@ read
             duration = time.time() - start_time
             return 1, duration, str(e)
 
+    @staticmethod
+    async def run_update_interactive_async(packages: List[str],
+                                           capture_output: bool = False) -> Tuple[int, float, Optional[str]]:
+        """
+        Run pacman update without blocking the running event loop.
+
+        Args:
+            packages: List of packages to update
+            capture_output: Whether to capture output
+
+        Returns:
+            Same tuple as run_update_interactive
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, PacmanRunner.run_update_interactive, packages, capture_output
+        )
+
     @staticmethod
     def create_history_entry(packages: List[str], exit_code: int, duration: float) -> UpdateHistoryEntry:
         """
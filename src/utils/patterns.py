@@ -6,15 +6,25 @@ Package pattern matching utilities with ReDoS protection.
 
 from __future__ import annotations
 
+import functools
 import re
-import threading
-from typing import Set, List, Optional, Iterator, Any
+import sys
+from typing import Set, List, Dict, Optional, Iterable, Iterator, Any
 from contextlib import contextmanager
-from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError, as_completed
 
 from ..utils.logger import get_logger
 from ..constants import GENERIC_PACKAGE_NAMES
 
+try:
+    import ahocorasick
+except ImportError:  # Optional: speeds up matching against installed packages
+    ahocorasick = None
+
+try:
+    import re2
+except ImportError:  # Optional: linear-time matching for untrusted patterns
+    re2 = None
+
 logger = get_logger(__name__)
 
 
@@ -23,68 +33,315 @@ class RegexTimeoutError(Exception):
     pass
 
 
-class ThreadSafeRegexManager:
-    """Thread-safe regex manager to replace signal-based timeout."""
-
-    def __init__(self, max_workers: int = 2):
-        """Initialize with thread pool for regex operations."""
-        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="RegexWorker")
-        self._local = threading.local()
-        logger.debug(f"Initialized thread-safe regex manager with {max_workers} workers")
+def _compile_safe(pattern: str, flags: int = 0) -> Any:
+    """
+    Compile an untrusted pattern, preferring RE2's linear-time engine.
 
-    def safe_regex_finditer(self, pattern: str, text: str, flags: int = 0, timeout: int = 2) -> Iterator:
-        """
-        Thread-safe regex finditer with timeout protection.
+    RE2 cannot backtrack catastrophically, so user-supplied patterns get
+    bounded matching time without any threads. Patterns RE2 does not support
+    (backreferences, lookaround) fall back to the standard re module, with
+    quantifiers made possessive where that cannot change the result.
 
-        Args:
-            pattern: Regex pattern
-            text: Text to search
-            flags: Regex flags
-            timeout: Timeout in seconds
+    Args:
+        pattern: Regex pattern
+        flags: re flags; only re.IGNORECASE is honoured by RE2
 
-        Returns:
-            Iterator of regex matches
+    Returns:
+        Compiled pattern object with finditer/search
 
-        Raises:
-            RegexTimeoutError: If operation times out
-        """
+    Raises:
+        re.error: If the pattern is invalid
+    """
+    if re2 is not None and not flags & ~re.IGNORECASE:
+        options = re2.Options()
+        options.case_sensitive = not flags & re.IGNORECASE
+        options.log_errors = False
+        try:
+            return re2.compile(pattern, options)
+        except re2.error:
+            pass
+    if _SUPPORTS_POSSESSIVE and not flags & ~re.IGNORECASE:
         try:
-            # Submit regex operation to thread pool
-            future = self._executor.submit(self._execute_regex, pattern, text, flags)
+            return re.compile(_make_possessive(pattern), flags)
+        except re.error:
+            pass
+    return re.compile(pattern, flags)
 
-            # Wait for result with timeout
-            try:
-                return future.result(timeout=timeout)
-            except FutureTimeoutError:
-                logger.warning(f"Regex operation timed out after {timeout}s: {pattern[:50]}...")
-                # Cancel the future if possible
-                future.cancel()
-                return iter([])
 
-        except Exception as e:
-            logger.error(f"Error in regex operation: {e}")
-            return iter([])
+# Untrusted patterns that run on the backtracking re engine only see this
+# much of the input, bounding the work even if vetting misses a bad shape
+_UNTRUSTED_TEXT_LIMIT = 8192
 
-    @staticmethod
-    def _execute_regex(pattern: str, text: str, flags: int = 0) -> Iterator:
-        """Execute regex operation in thread pool."""
-        try:
-            compiled_pattern = re.compile(pattern, flags)
-            return compiled_pattern.finditer(text)
-        except re.error as e:
-            logger.error(f"Regex compilation error: {e}")
-            return iter([])
-
-    def __del__(self):
-        """Cleanup thread pool on destruction."""
-        try:
-            self._executor.shutdown(wait=False)
-        except Exception:
-            pass
+# Upper bound on package names extracted from one text
+_MAX_FOUND_PACKAGES = 1000
+
+_QUANTIFIER_RE = re.compile(r'[*+?]|\{(\d*)(,?)(\d*)\}')
+_GROUP_PREFIX_RE = re.compile(r'\?(?::|=|!|>|<=|<!|P<\w+>|[aiLmsux-]+(?::|(?=\))))')
+
+# Single-character atoms built only from literal characters: a plain or escaped
+# character, or a non-negated class of them. No \w, \d, \s or '.'.
+_LITERAL_CHAR = r'(?:[^\\.\[\]]|\\[^a-zA-Z0-9]|\\x[0-9a-fA-F]{2}|\\[tnrfv])'
+_LITERAL_ATOM_RE = re.compile(r'%s|\[(?!\^)(?:%s|-)+\]' % (_LITERAL_CHAR, _LITERAL_CHAR))
+
+# Category escapes that share no character anywhere in Unicode
+_DISJOINT_CATEGORIES = frozenset(map(frozenset, [
+    (r'\w', r'\W'), (r'\w', r'\s'), (r'\W', r'\d'), (r'\d', r'\D'), (r'\d', r'\s'), (r'\s', r'\S'),
+]))
 
 
-# Global thread-safe regex manager instance
-_regex_manager = ThreadSafeRegexManager()
+def _is_latin1_atom(atom: str) -> bool:
+    """Return True if an atom provably matches only Latin-1 characters and their case variants."""
+    return _LITERAL_ATOM_RE.fullmatch(atom) is not None and max(map(ord, atom)) <= 0xFF
+
+
+@functools.lru_cache(maxsize=256)
+def _atoms_overlap(first: Optional[str], second: Optional[str]) -> bool:
+    """
+    Return True if two single-character atoms can match a common character.
+
+    Only Latin-1 is probed, which is exact when either atom is built from
+    Latin-1 literals: the few wider characters it can match case-insensitively
+    (e.g. U+212A KELVIN SIGN) are letters that every atom treats like their
+    Latin-1 equivalents. Other atoms that both reach beyond Latin-1 are
+    assumed to overlap unless they are known disjoint category escapes.
+    """
+    if first is None or second is None:
+        return True
+    if not (_is_latin1_atom(first) or _is_latin1_atom(second)):
+        return frozenset((first, second)) not in _DISJOINT_CATEGORIES
+    try:
+        first_re = re.compile(first, re.IGNORECASE)
+        second_re = re.compile(second, re.IGNORECASE)
+    except re.error:
+        return True
+    return any(first_re.fullmatch(char) and second_re.fullmatch(char)
+               for char in map(chr, range(256)))
+
+
+def _has_redos_shape(pattern: str) -> bool:
+    """
+    Statically check a pattern for shapes prone to catastrophic backtracking.
+
+    Flags a repeated group containing a variable quantifier (``(a+)+``,
+    ``(a*)*``), a repeated alternation whose branches can start with the same
+    character (``(a|a)+``, ``(a|ab)*``) and adjacent unbounded repeats of
+    overlapping atoms (``\\w+\\d+``). The check is conservative: constructs
+    it does not analyse, such as a group opening a branch, count as unsafe.
+
+    Args:
+        pattern: Regex pattern to check
+
+    Returns:
+        True if the pattern should be rejected
+    """
+    # Per group: whether it contains a variable quantifier, the first atom of
+    # each branch (None when unknown), the previous atom if it repeats without
+    # bound, and whether the current branch is still empty
+    stack: List[list] = [[False, [], None, True]]
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        frame = stack[-1]
+        group = None
+        atom: Optional[str] = None
+
+        if char == '(':
+            i += 1
+            if pattern.startswith('?', i):
+                prefix = _GROUP_PREFIX_RE.match(pattern, i)
+                if prefix is None:
+                    # Backreferences, conditionals, comments and inline flags
+                    return True
+                i = prefix.end()
+            stack.append([False, [], None, True])
+            continue
+        if char == '|':
+            if frame[3]:
+                frame[1].append(None)
+            frame[2] = None
+            frame[3] = True
+            i += 1
+            continue
+        if char in '^$':
+            i += 1
+            continue
+
+        if char == ')':
+            if len(stack) == 1:
+                return True
+            group = stack.pop()
+            if group[3] and group[1]:
+                group[1].append(None)  # empty last branch
+            frame = stack[-1]
+            i += 1
+        elif char == '\\':
+            atom = pattern[i:i + 2]
+            i += 2
+        elif char == '[':
+            end = i + 1
+            if pattern.startswith('^', end):
+                end += 1
+            if pattern.startswith(']', end):
+                end += 1
+            while end < len(pattern) and pattern[end] != ']':
+                end += 2 if pattern[end] == '\\' else 1
+            atom = pattern[i:end + 1]
+            i = end + 1
+        else:
+            atom = char
+            i += 1
+
+        # Classify the quantifier following the atom, if any
+        repeats = variable = unbounded = False
+        quantifier = _QUANTIFIER_RE.match(pattern, i)
+        if quantifier:
+            token = quantifier.group(0)
+            low, comma, high = quantifier.groups()
+            if token in ('*', '+'):
+                repeats = variable = unbounded = True
+            elif token == '?':
+                variable = True
+            elif comma and not high:
+                repeats = variable = unbounded = True
+            elif comma:
+                repeats = int(high) > 1
+                variable = int(low or 0) != int(high)
+            else:
+                repeats = int(low or 0) > 1
+            i = quantifier.end()
+            if pattern.startswith(('?', '+'), i):
+                i += 1  # lazy or possessive suffix
+
+        if group is not None:
+            has_variable, branch_starts = group[0], group[1]
+            if repeats:
+                if has_variable:
+                    return True
+                for index, start in enumerate(branch_starts):
+                    for other in branch_starts[index + 1:]:
+                        if _atoms_overlap(start, other):
+                            return True
+            frame[0] = frame[0] or has_variable or variable
+        else:
+            frame[0] = frame[0] or variable
+
+        if frame[3]:
+            frame[1].append(atom)
+            frame[3] = False
+        if unbounded and atom is not None:
+            if frame[2] is not None and _atoms_overlap(frame[2], atom):
+                return True
+            frame[2] = atom
+        else:
+            frame[2] = None
+    return len(stack) != 1
+
+
+# Possessive quantifiers are supported by re from Python 3.11
+_SUPPORTS_POSSESSIVE = sys.version_info >= (3, 11)
+
+
+def _make_possessive(pattern: str) -> str:
+    """
+    Make greedy quantifiers possessive where that cannot change any match.
+
+    A quantified single-character atom followed by a mandatory atom that
+    shares no character with it can never give characters back usefully,
+    so ``[a-z]+-`` becomes ``[a-z]++-`` and the engine stops backtracking
+    into the run. Patterns using constructs this scan does not understand
+    are returned unchanged.
+
+    Args:
+        pattern: Regex pattern
+
+    Returns:
+        Equivalent pattern with possessive quantifiers where safe
+    """
+    # Items are (atom, quantifier match, end of quantifier, greedy); None is a barrier
+    items: List[Optional[tuple]] = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '(':
+            i += 1
+            if pattern.startswith('?', i):
+                prefix = _GROUP_PREFIX_RE.match(pattern, i)
+                if prefix is None or prefix.group(0)[1] in 'aiLmsux-':
+                    return pattern  # inline flags, backreferences, conditionals
+                i = prefix.end()
+            items.append(None)
+            continue
+        if char in ')|^$':
+            i += 1
+            items.append(None)
+            continue
+        if char == '\\':
+            escaped = pattern[i + 1:i + 2]
+            if not escaped or (escaped.isalnum() and escaped not in 'dDsSwW'):
+                return pattern  # anchors, backreferences, numeric escapes
+            atom = pattern[i:i + 2]
+            i += 2
+        elif char == '[':
+            end = i + 1
+            if pattern.startswith('^', end):
+                end += 1
+            if pattern.startswith(']', end):
+                end += 1
+            while end < len(pattern) and pattern[end] != ']':
+                end += 2 if pattern[end] == '\\' else 1
+            atom = pattern[i:end + 1]
+            i = end + 1
+        elif char in '*+?{':
+            return pattern  # quantifier without an atom we understand
+        else:
+            atom = char
+            i += 1
+
+        greedy = True
+        quantifier = _QUANTIFIER_RE.match(pattern, i)
+        if quantifier:
+            if quantifier.group(0) in ('{}', '{,}'):
+                return pattern
+            i = quantifier.end()
+            if pattern.startswith(('?', '+'), i):
+                greedy = False  # already lazy or possessive
+                i += 1
+        items.append((atom, quantifier, i, greedy))
+
+    insert_at = []
+    for current, following in zip(items, items[1:]):
+        if current is None or following is None or current[1] is None or not current[3]:
+            continue
+        next_quantifier = following[1]
+        if next_quantifier is not None:
+            token = next_quantifier.group(0)
+            # The next atom must be mandatory, or the run could end anywhere
+            if token in ('*', '?') or (token.startswith('{') and not int(next_quantifier.group(1) or 0)):
+                continue
+        if not _atoms_overlap(current[0], following[0]):
+            insert_at.append(current[2])
+
+    for position in reversed(insert_at):
+        pattern = pattern[:position] + '+' + pattern[position:]
+    return pattern
+
+
+class ThreadSafeRegexManager:
+    """
+    DEPRECATED: Kept for backward compatibility.
+
+    Matching used to be submitted to a thread pool, but re holds the GIL and
+    finditer is lazy, so the timeout never bounded anything. Untrusted
+    patterns are now compiled with _compile_safe and matched in-process.
+    """
+
+    def __init__(self, max_workers: int = 2):
+        """Initialize the manager; max_workers is ignored."""
+        pass
+
+    def safe_regex_finditer(self, pattern: Any, text: str, flags: int = 0, timeout: int = 2) -> Iterator:
+        """Delegate to the module-level safe_regex_finditer."""
+        return safe_regex_finditer(pattern, text, flags, timeout)
 
 
 @contextmanager
@@ -103,29 +360,90 @@ def regex_timeout(seconds: int = 2):
     yield
 
 
-def safe_regex_finditer(pattern: str, text: str, flags: int = 0, timeout: int = 2) -> Iterator:
+def safe_regex_finditer(pattern: Any, text: str, flags: int = 0, timeout: int = 2) -> Iterator:
     """
-    Safely execute regex finditer with thread-safe timeout protection.
+    Safely execute regex finditer on bounded input.
 
     Args:
-        pattern: Regex pattern
+        pattern: Regex pattern, or an already compiled pattern object
         text: Text to search
-        flags: Regex flags
-        timeout: Timeout in seconds
+        flags: Regex flags (only used when pattern is a string)
+        timeout: Ignored, maintained for compatibility
 
     Returns:
         Iterator of regex matches
-
-    Raises:
-        RegexTimeoutError: If operation times out
     """
     # Input length validation to prevent DoS
     if len(text) > 100000:  # 100KB limit
         logger.warning(f"Text too long for regex processing: {len(text)} chars")
         return iter([])
 
-    # Use thread-safe regex manager
-    return _regex_manager.safe_regex_finditer(pattern, text, flags, timeout)
+    try:
+        # Precompiled patterns are trusted and matched directly
+        if isinstance(pattern, str):
+            if _has_redos_shape(pattern):
+                logger.warning(f"Rejected regex prone to catastrophic backtracking: {pattern}")
+                return iter([])
+            compiled = _compile_safe(pattern, flags)
+            if isinstance(compiled, re.Pattern):
+                text = text[:_UNTRUSTED_TEXT_LIMIT]
+        else:
+            compiled = pattern
+        return compiled.finditer(text)
+    except re.error as e:
+        logger.error(f"Regex compilation error: {e}")
+        return iter([])
+    except Exception as e:
+        logger.error(f"Error in regex operation: {e}")
+        return iter([])
+
+
+def _is_word_char(char: str) -> bool:
+    """Return True for characters matched by \\w in str patterns."""
+    return char.isalnum() or char == '_'
+
+
+_NAME_BEFORE_PACKAGE = re.compile(r'([a-z0-9](?:[a-z0-9\-_.]){1,48}[a-z0-9])\s+package')
+
+
+def _finditer_name_before_package(text: str) -> Iterator:
+    """Yield the matches of ``_NAME_BEFORE_PACKAGE.finditer(text)``.
+
+    The pattern has no literal prefix, so a plain scan tries it at every
+    offset of the text. A match always ends at a ``package`` preceded by
+    whitespace and starts at most 50 characters before that whitespace, so
+    only that window is searched for each occurrence.
+    """
+    last_end = 0
+    index = text.find('package')
+    while index != -1:
+        name_end = index
+        while name_end > last_end and text[name_end - 1].isspace():
+            name_end -= 1
+        if name_end < index:
+            match = _NAME_BEFORE_PACKAGE.search(text, max(last_end, name_end - 50), index + 7)
+            if match:
+                yield match
+                last_end = match.end()
+        index = text.find('package', max(index + 1, last_end))
+
+
+# Finders for explicit package mentions, applied to lowercased text, each
+# with a literal that must occur in the text for the pattern to match
+_MENTION_PATTERNS = (
+    ('package', re.compile(r'package\s+([a-z0-9](?:[a-z0-9\-_.]){1,48}[a-z0-9])').finditer),
+    ('package', _finditer_name_before_package),
+    ('`', re.compile(r'`([a-z0-9](?:[a-z0-9\-_.]){1,48}[a-z0-9])`').finditer),  # Markdown code
+    ('"', re.compile(r'"([a-z0-9](?:[a-z0-9\-_.]){1,48}[a-z0-9])"').finditer),  # Quoted
+)
+
+
+# Simplified pattern for package with version (no nested quantifiers)
+_VERSION_PATTERN = re.compile(
+    r'(?P<package>[a-z0-9](?:[a-z0-9\-_.+]){1,48}[a-z0-9])\s*'
+    r'(?P<operator>>=?|<=?|==?)\s*'
+    r'(?P<version>[\d](?:[\d\-._]){0,19})'
+)
 
 
 class PackagePatternMatcher:
@@ -143,8 +461,21 @@ class PackagePatternMatcher:
             r'\blib([a-z0-9](?:[a-z0-9\-_.]){1,43}[a-z0-9])\b',
         ]
 
+        # Built-in patterns are bounded and ReDoS-safe, so they are compiled
+        # once and matched directly. The first two only ever yield installed
+        # names bounded by \b on both sides, which the direct installed-package
+        # match already finds, so scanning with them cannot add results. Only
+        # the lib-prefix pattern, whose name part has no leading \b, is run.
+        # Each entry pairs the pattern with a literal it cannot match without.
+        self._compiled_base = [('lib', re.compile(self.base_patterns[2], re.IGNORECASE))]
+
         self.custom_patterns: List[str] = []
+        self._compiled_custom: List[Any] = []
         self.pattern_cache: dict[str, Any] = {}  # Cache compiled patterns
+        # Aho-Corasick automaton for the last installed package set seen
+        self._ac_cache: Optional[tuple[frozenset[str], Any]] = None
+        # Combined regex, names and name lengths for the last set seen
+        self._installed_re_cache: Optional[tuple[frozenset[str], Any]] = None
         logger.debug("Initialized PackagePatternMatcher with secure patterns")
 
     def add_custom_patterns(self, patterns: List[str]) -> None:
@@ -160,14 +491,16 @@ class PackagePatternMatcher:
                 if len(pattern) > 200:
                     logger.warning(f"Pattern too long, skipping: {len(pattern)} chars")
                     continue
+                if _has_redos_shape(pattern):
+                    logger.warning(f"Pattern prone to catastrophic backtracking, skipping: {pattern}")
+                    continue
 
-                # Test compile with timeout
-                with regex_timeout(1):
-                    re.compile(pattern)
+                compiled = _compile_safe(pattern, re.IGNORECASE)
 
                 self.custom_patterns.append(pattern)
+                self._compiled_custom.append(compiled)
                 logger.debug(f"Added custom pattern: {pattern}")
-            except (re.error, RegexTimeoutError) as e:
+            except re.error as e:
                 logger.warning(f"Invalid or unsafe regex pattern '{pattern}': {e}")
 
     def extract_package_names(self, text: str,
@@ -192,47 +525,88 @@ class PackagePatternMatcher:
             logger.warning(f"Input text too long for processing: {len(text)} chars")
             return set()
 
+        # Membership is tested for every candidate, so make it O(1)
+        if not isinstance(installed_packages, (set, frozenset)):
+            installed_packages = frozenset(installed_packages)
+
+        return self.extract_package_names_prepared(text.lower(), installed_packages, extra_patterns)
+
+    def extract_package_names_prepared(self, text_lower: str,
+                                       installed_packages: Set[str],
+                                       extra_patterns: Optional[List[str]] = None) -> Set[str]:
+        """
+        Extract package names from text that is already lowercased.
+
+        Same as extract_package_names, for callers that already hold the
+        lowercased text and want to avoid lowercasing it again.
+
+        Args:
+            text_lower: Lowercased text to search in
+            installed_packages: Set or frozenset of installed package names
+            extra_patterns: Additional patterns to use
+
+        Returns:
+            Set of found package names
+        """
+        if not text_lower:
+            return set()
+        if len(text_lower) > 100000:  # 100KB limit
+            logger.warning(f"Input text too long for processing: {len(text_lower)} chars")
+            return set()
+
         found_packages = set()
-        text_lower = text.lower()
 
         # Method 1: Direct matching against installed packages (most reliable)
-        for package in installed_packages:
-            if len(package) > 100:  # Skip extremely long package names
-                continue
-
-            # Use word boundary matching with length limit
-            try:
-                pattern = r'\b' + re.escape(package) + r'\b'
-                if re.search(pattern, text_lower):
-                    if package not in GENERIC_PACKAGE_NAMES:
-                        found_packages.add(package)
-                        logger.debug(f"Found package by direct match: {package}")
-            except re.error:
-                continue
+        if ahocorasick is not None:
+            # One pass over the text finds every installed package at once
+            for package in self._match_installed(text_lower, installed_packages):
+                found_packages.add(package)
+                logger.debug(f"Found package by direct match: {package}")
+        else:
+            for package in self._match_installed_regex(text_lower, installed_packages):
+                found_packages.add(package)
+                logger.debug(f"Found package by direct match: {package}")
 
         # Method 2: Pattern-based extraction with security
-        patterns_to_use = self.base_patterns[:]
-
-        # Add custom patterns (already validated)
-        patterns_to_use.extend(self.custom_patterns)
+        # A substring test skips built-in patterns whose literal is absent. With
+        # IGNORECASE, non-ASCII text can match a literal case-insensitively
+        # (e.g. 'ı' matches 'i'), so the test only applies to ASCII text.
+        is_ascii = text_lower.isascii()
+        patterns_to_use = [
+            compiled for literal, compiled in self._compiled_base
+            if not is_ascii or literal in text_lower
+        ]
+        untrusted = list(self._compiled_custom)
 
-        # Add extra patterns with validation
+        # Add extra patterns with validation, compiling each one only once
         if extra_patterns:
             for pattern in extra_patterns:
                 if len(pattern) > 200:
                     continue
-                try:
-                    with regex_timeout(1):
-                        re.compile(pattern)
-                    patterns_to_use.append(pattern)
-                except (re.error, RegexTimeoutError):
-                    logger.warning(f"Invalid extra pattern: {pattern}")
-
-        # Extract using secure patterns
-        for pattern in patterns_to_use:
+                compiled = self.pattern_cache.get(pattern)
+                if compiled is None:
+                    if _has_redos_shape(pattern):
+                        logger.warning(f"Unsafe extra pattern: {pattern}")
+                        continue
+                    try:
+                        compiled = self.pattern_cache[pattern] = _compile_safe(pattern, re.IGNORECASE)
+                    except re.error:
+                        logger.warning(f"Invalid extra pattern: {pattern}")
+                        continue
+                untrusted.append(compiled)
+
+        # Untrusted patterns left on the backtracking engine see bounded input
+        searches = [(compiled, text_lower) for compiled in patterns_to_use]
+        untrusted_text = text_lower[:_UNTRUSTED_TEXT_LIMIT]
+        for compiled in untrusted:
+            searches.append((compiled, untrusted_text if isinstance(compiled, re.Pattern) else text_lower))
+
+        # Extract using secure patterns, stopping once the result limit is hit
+        for compiled, haystack in searches:
+            if len(found_packages) >= _MAX_FOUND_PACKAGES:
+                break
             try:
-                matches = safe_regex_finditer(pattern, text_lower, re.IGNORECASE, timeout=2)
-                for match in matches:
+                for match in compiled.finditer(haystack):
                     # Get the captured group (if any) or the whole match
                     if match.groups():
                         candidate = match.group(1)
@@ -248,38 +622,138 @@ class PackagePatternMatcher:
 
                     # Validate against installed packages
                     if candidate in installed_packages and candidate not in GENERIC_PACKAGE_NAMES:
-                        found_packages.add(candidate)
+                        # Interned, so repeated names across texts share one string
+                        found_packages.add(sys.intern(candidate))
                         logger.debug(f"Found package by pattern: {candidate}")
+                        if len(found_packages) >= _MAX_FOUND_PACKAGES:
+                            break
             except Exception as e:
-                logger.error(f"Error processing pattern '{pattern}': {e}")
+                logger.error(f"Error processing pattern '{compiled.pattern}': {e}")
                 continue
 
         # Method 3: Look for specific package mentions with secure patterns
-        mention_patterns = [
-            r'package\s+([a-z0-9](?:[a-z0-9\-_.]){1,48}[a-z0-9])',
-            r'([a-z0-9](?:[a-z0-9\-_.]){1,48}[a-z0-9])\s+package',
-            r'`([a-z0-9](?:[a-z0-9\-_.]){1,48}[a-z0-9])`',  # Markdown code
-            r'"([a-z0-9](?:[a-z0-9\-_.]){1,48}[a-z0-9])"',  # Quoted
-        ]
-
-        for pattern in mention_patterns:
+        for literal, finditer in _MENTION_PATTERNS:
+            if len(found_packages) >= _MAX_FOUND_PACKAGES:
+                break
+            if literal not in text_lower:
+                continue
             try:
-                matches = safe_regex_finditer(pattern, text_lower, timeout=1)
-                for match in matches:
+                for match in finditer(text_lower):
                     candidate = match.group(1).strip()
                     if candidate in installed_packages and candidate not in GENERIC_PACKAGE_NAMES:
-                        found_packages.add(candidate)
+                        found_packages.add(sys.intern(candidate))
+                        if len(found_packages) >= _MAX_FOUND_PACKAGES:
+                            break
             except Exception:
                 continue
 
         # Limit total results to prevent resource exhaustion
-        if len(found_packages) > 1000:
-            logger.warning(f"Too many packages found ({len(found_packages)}), limiting to 1000")
-            found_packages = set(list(found_packages)[:1000])
+        if len(found_packages) >= _MAX_FOUND_PACKAGES:
+            logger.warning(f"Too many packages found ({len(found_packages)}), "
+                           f"limiting to {_MAX_FOUND_PACKAGES}")
+            found_packages = set(list(found_packages)[:_MAX_FOUND_PACKAGES])
 
         logger.info(f"Extracted {len(found_packages)} package names from text")
         return found_packages
 
+    def _match_installed(self, text_lower: str, installed_packages: Set[str]) -> Set[str]:
+        """
+        Find installed packages occurring as whole words, using Aho-Corasick.
+
+        Equivalent to searching r'\b<package>\b' for every package, but scans
+        the text once. The automaton is rebuilt only when the set changes.
+
+        Args:
+            text_lower: Lowercased text to search in
+            installed_packages: Set of installed package names
+
+        Returns:
+            Set of non-generic installed packages found in the text
+        """
+        key = frozenset(installed_packages)
+        cached = self._ac_cache
+        if cached is not None and cached[0] == key:
+            automaton = cached[1]
+        else:
+            automaton = ahocorasick.Automaton()
+            for package in key:
+                if package and len(package) <= 100 and package not in GENERIC_PACKAGE_NAMES:
+                    automaton.add_word(package, package)
+            if len(automaton) == 0:
+                self._ac_cache = (key, None)
+                return set()
+            automaton.make_automaton()
+            self._ac_cache = (key, automaton)
+
+        if automaton is None:
+            return set()
+
+        found = set()
+        text_len = len(text_lower)
+        for end, package in automaton.iter(text_lower):
+            if package in found:
+                continue
+            start = end - len(package) + 1
+            # Same rule as \b: word-ness must change at both edges of the match
+            before = start > 0 and _is_word_char(text_lower[start - 1])
+            after = end + 1 < text_len and _is_word_char(text_lower[end + 1])
+            if (before != _is_word_char(package[0])) and (after != _is_word_char(package[-1])):
+                found.add(package)
+        return found
+
+    def _match_installed_regex(self, text_lower: str, installed_packages: Set[str]) -> Set[str]:
+        """
+        Find installed packages occurring as whole words, using one regex.
+
+        Fallback for _match_installed when pyahocorasick is not available.
+        A lookahead alternation finds the longest installed name starting at
+        each word boundary; the shorter names it has as prefixes are checked
+        from the same position, so overlapping names are all found.
+
+        Args:
+            text_lower: Lowercased text to search in
+            installed_packages: Set of installed package names
+
+        Returns:
+            Set of non-generic installed packages found in the text
+        """
+        key = frozenset(installed_packages)
+        cached = self._installed_re_cache
+        if cached is None or cached[0] != key:
+            names = frozenset(
+                package for package in key
+                if package and len(package) <= 100 and package not in GENERIC_PACKAGE_NAMES
+            )
+            compiled = None
+            if names:
+                # Longest first, so each match is the longest name at that position
+                alternation = '|'.join(re.escape(name) for name in sorted(names, key=len, reverse=True))
+                compiled = re.compile(r'\b(?=(' + alternation + r'))')
+            lengths = sorted({len(name) for name in names})
+            cached = self._installed_re_cache = (key, (compiled, names, lengths))
+
+        compiled, names, lengths = cached[1]
+        if compiled is None:
+            return set()
+
+        found = set()
+        text_len = len(text_lower)
+        for match in compiled.finditer(text_lower):
+            start = match.start()
+            longest = match.group(1)
+            for length in lengths:
+                if length > len(longest):
+                    break
+                package = longest[:length]
+                if package in found or package not in names:
+                    continue
+                # Same rule as \b after the name; the regex checked the start
+                end = start + length
+                after = end < text_len and _is_word_char(text_lower[end])
+                if after != _is_word_char(package[-1]):
+                    found.add(sys.intern(package))
+        return found
+
     def find_affected_packages(self, text: str,
                                installed_packages: Set[str]) -> Set[str]:
         """
@@ -299,6 +773,7 @@ class PackagePatternMatcher:
     def is_package_mentioned(self, text: str, package_name: str) -> bool:
         """
         Check if a specific package is mentioned in text with security protections.
+        To check many packages against the same text, use packages_mentioned.
 
         Args:
             text: Text to search in
@@ -315,19 +790,88 @@ class PackagePatternMatcher:
             logger.warning("Input too long for package mention check")
             return False
 
+        if text.isascii() and package_name.isascii():
+            # ASCII lowercasing matches IGNORECASE exactly, so a substring
+            # search plus the \b rule at both edges needs no regex
+            text_lower = text.lower()
+            name_lower = package_name.lower()
+            starts_word = _is_word_char(name_lower[0])
+            ends_word = _is_word_char(name_lower[-1])
+            index = text_lower.find(name_lower)
+            while index != -1:
+                end = index + len(name_lower)
+                before = index > 0 and _is_word_char(text_lower[index - 1])
+                after = end < len(text_lower) and _is_word_char(text_lower[end])
+                if before != starts_word and after != ends_word:
+                    return True
+                index = text_lower.find(name_lower, index + 1)
+            return False
+
         # Escape special regex characters in package name
         escaped_name = re.escape(package_name)
 
-        # Look for whole word matches with timeout protection
+        # Look for whole word matches; an escaped literal cannot backtrack
         pattern = r'\b' + escaped_name + r'\b'
 
         try:
-            with regex_timeout(1):
-                return bool(re.search(pattern, text, re.IGNORECASE))
-        except (RegexTimeoutError, re.error):
-            logger.warning(f"Regex timeout/error checking package mention: {package_name}")
+            return bool(re.search(pattern, text, re.IGNORECASE))
+        except re.error:
+            logger.warning(f"Regex error checking package mention: {package_name}")
             return False
 
+    def packages_mentioned(self, text: str, package_names: Iterable[str]) -> Dict[str, bool]:
+        """
+        Check which of several packages are mentioned in text.
+
+        Gives the same answer as calling is_package_mentioned for each name,
+        but scans ASCII text once with an Aho-Corasick automaton when
+        pyahocorasick is available.
+
+        Args:
+            text: Text to search in
+            package_names: Package names to look for
+
+        Returns:
+            Mapping of each package name to True if it is mentioned
+        """
+        names = list(package_names)
+        if ahocorasick is None or not text or not text.isascii():
+            return {name: self.is_package_mentioned(text, name) for name in names}
+
+        result = dict.fromkeys(names, False)
+        if len(text) > 50000:
+            logger.warning("Input too long for package mention check")
+            return result
+
+        automaton = ahocorasick.Automaton()
+        for name in names:
+            if name and len(name) <= 100 and name.isascii():
+                automaton.add_word(name.lower(), name.lower())
+        if len(automaton) == 0:
+            # Only empty, overlong or non-ASCII names, which take the slow path
+            return {name: self.is_package_mentioned(text, name) for name in names}
+        automaton.make_automaton()
+
+        text_lower = text.lower()
+        text_len = len(text_lower)
+        found = set()
+        for end, name_lower in automaton.iter(text_lower):
+            if name_lower in found:
+                continue
+            start = end - len(name_lower) + 1
+            # Same rule as \b: word-ness must change at both edges of the match
+            before = start > 0 and _is_word_char(text_lower[start - 1])
+            after = end + 1 < text_len and _is_word_char(text_lower[end + 1])
+            if (before != _is_word_char(name_lower[0])) and (after != _is_word_char(name_lower[-1])):
+                found.add(name_lower)
+
+        for name in names:
+            if name and len(name) <= 100 and name.isascii():
+                result[name] = name.lower() in found
+            else:
+                result[name] = self.is_package_mentioned(text, name)
+        return result
+
     def extract_version_info(self, text: str) -> List[tuple]:
         """
         Extract version information from text with security protections.
@@ -348,15 +892,10 @@ class PackagePatternMatcher:
 
         version_info = []
 
-        # Simplified pattern for package with version (no nested quantifiers)
-        pattern = r'([a-z0-9](?:[a-z0-9\-_.+]){1,48}[a-z0-9])\s*(>=?|<=?|==?)\s*([\d](?:[\d\-._]){0,19})'
-
         try:
-            matches = safe_regex_finditer(pattern, text.lower(), timeout=2)
-            for match in matches:
-                package = match.group(1)
-                operator = match.group(2)
-                version = match.group(3)
+            # The pattern is trusted and the length was checked above
+            for match in _VERSION_PATTERN.finditer(text.lower()):
+                package, operator, version = match.group('package', 'operator', 'version')
 
                 # Skip generic names and validate lengths
                 if (package not in GENERIC_PACKAGE_NAMES and
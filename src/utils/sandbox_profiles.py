@@ -4,8 +4,9 @@ Advanced sandboxing profiles for different security contexts.
 
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Callable, Iterable, Optional, Sequence, Tuple
 from enum import IntEnum
+import functools
 import os
 
 from .logger import get_logger
@@ -25,166 +26,294 @@ class SandboxLevel(IntEnum):
 class SandboxProfile:
     """Base class for sandbox profiles."""
     
+    __slots__ = ('name', 'level', '_bwrap_args', '_has_unshare_net', '_bwrap_prefix', '_frozen')
+    
     def __init__(self, name: str, level: SandboxLevel = SandboxLevel.STANDARD):
         """Initialize a sandbox profile."""
+        self._frozen = False
         self.name = name
         self.level = level
-        self.bwrap_args: List[str] = []
+        self.bwrap_args = ()
+    
+    @property
+    def bwrap_args(self) -> Tuple[str, ...]:
+        """Bubblewrap arguments; immutable, so shared instead of copied per command."""
+        return self._bwrap_args
+    
+    @bwrap_args.setter
+    def bwrap_args(self, args: Iterable[str]) -> None:
+        """Replace the arguments, storing any sequence as a tuple."""
+        self._bwrap_args = tuple(args)
+        self._has_unshare_net = '--unshare-net' in self._bwrap_args
+        # Complete command prefix, reused for every wrapped command
+        self._bwrap_prefix = ('bwrap', *self._bwrap_args)
+    
+    @property
+    def has_unshare_net(self) -> bool:
+        """Whether the arguments cut off network access."""
+        return self._has_unshare_net
     
-    def get_bwrap_args(self) -> List[str]:
+    def get_bwrap_args(self) -> Tuple[str, ...]:
         """Get bubblewrap arguments for this profile."""
-        return self.bwrap_args.copy()
+        return self._bwrap_args
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Reject changes once the profile is frozen."""
+        if getattr(self, '_frozen', False):
+            raise AttributeError(f"Sandbox profile '{self.name}' is shared and cannot be modified")
+        super().__setattr__(name, value)
+    
+    def _freeze(self) -> None:
+        """Make the profile read-only, for profiles shared through the profile caches."""
+        self._frozen = True
+
+
+def _ro_bind_args(paths: Sequence[str]) -> Tuple[str, ...]:
+    """Build read-only bind arguments for each path in one tuple."""
+    return tuple(arg for path in paths for arg in ('--ro-bind', path, path))
+
+
+# Bubblewrap arguments per level, shared by every profile instance
+_NETWORK_ARGS: Dict[SandboxLevel, Tuple[str, ...]] = {
+    # Basic network isolation
+    SandboxLevel.BASIC: (
+        '--share-net',
+        '--ro-bind', '/etc/resolv.conf', '/etc/resolv.conf',
+        '--ro-bind', '/etc/hosts', '/etc/hosts',
+    ),
+    # Standard network isolation with more restrictions
+    SandboxLevel.STANDARD: (
+        '--share-net',
+        '--ro-bind', '/etc/resolv.conf', '/etc/resolv.conf',
+        '--ro-bind', '/etc/hosts', '/etc/hosts',
+        '--ro-bind', '/etc/ssl', '/etc/ssl',
+        '--ro-bind', '/etc/ca-certificates', '/etc/ca-certificates',
+    ),
+}
+# No network access
+_NETWORK_STRICT_ARGS: Tuple[str, ...] = (
+    '--unshare-net',
+)
+
+_FILE_ACCESS_ARGS: Dict[SandboxLevel, Tuple[str, ...]] = {
+    # Basic file isolation
+    SandboxLevel.BASIC: (
+        '--ro-bind', '/usr', '/usr',
+        '--ro-bind', '/lib', '/lib',
+        '--ro-bind', '/lib64', '/lib64',
+        '--proc', '/proc',
+        '--dev', '/dev',
+    ),
+    # Standard file isolation
+    SandboxLevel.STANDARD: (
+        '--ro-bind', '/usr', '/usr',
+        '--ro-bind', '/lib', '/lib',
+        '--ro-bind', '/lib64', '/lib64',
+        '--ro-bind', '/bin', '/bin',
+        '--ro-bind', '/sbin', '/sbin',
+        '--proc', '/proc',
+        '--dev', '/dev',
+        '--tmpfs', '/tmp',
+    ),
+}
+# Strict file isolation
+_FILE_ACCESS_STRICT_ARGS: Tuple[str, ...] = (
+    '--ro-bind', '/usr', '/usr',
+    '--ro-bind', '/lib', '/lib',
+    '--ro-bind', '/lib64', '/lib64',
+    '--tmpfs', '/tmp',
+    '--tmpfs', '/var',
+    '--tmpfs', '/home',
+    '--proc', '/proc',
+    '--dev', '/dev',
+)
+
+# More restrictive for read-only operations
+_PACKAGE_MANAGER_READONLY_ARGS: Tuple[str, ...] = (
+    '--unshare-pid',
+    '--ro-bind', '/usr', '/usr',
+    '--ro-bind', '/etc', '/etc',
+    '--ro-bind', '/var/lib/pacman', '/var/lib/pacman',
+    '--ro-bind', '/var/cache/pacman/pkg', '/var/cache/pacman/pkg',
+    '--proc', '/proc',
+    '--dev', '/dev',
+    '--tmpfs', '/tmp',
+    '--new-session',
+)
+_PACKAGE_MANAGER_ARGS: Dict[SandboxLevel, Tuple[str, ...]] = {
+    # Basic isolation for package queries
+    SandboxLevel.BASIC: (
+        '--ro-bind', '/usr', '/usr',
+        '--ro-bind', '/etc', '/etc',
+        '--ro-bind', '/var/lib/pacman', '/var/lib/pacman',
+        '--ro-bind', '/var/cache/pacman', '/var/cache/pacman',
+        '--proc', '/proc',
+        '--dev', '/dev',
+        '--tmpfs', '/tmp',
+    ),
+    SandboxLevel.STANDARD: _PACKAGE_MANAGER_READONLY_ARGS,
+    SandboxLevel.STRICT: _PACKAGE_MANAGER_READONLY_ARGS,
+}
+
+# Home directory bound read-write into terminal sandboxes
+_HOME = os.path.expanduser('~')
+
+
+def refresh_home() -> None:
+    """Re-read the home directory, e.g. after the process switched users."""
+    global _HOME
+    _HOME = os.path.expanduser('~')
+
+
+# Terminal arguments, followed by a read-write bind of the home directory
+_TERMINAL_ARGS: Dict[SandboxLevel, Tuple[str, ...]] = {
+    # Basic terminal isolation
+    SandboxLevel.BASIC: (
+        '--share-net',
+        '--ro-bind', '/etc', '/etc',
+        '--ro-bind', '/usr', '/usr',
+        '--ro-bind', '/lib', '/lib',
+        '--ro-bind', '/lib64', '/lib64',
+        '--ro-bind', '/bin', '/bin',
+        '--proc', '/proc',
+        '--dev', '/dev',
+    ),
+    # Standard terminal isolation
+    SandboxLevel.STANDARD: (
+        '--share-net',
+        '--ro-bind', '/etc', '/etc',
+        '--ro-bind', '/usr', '/usr',
+        '--ro-bind', '/lib', '/lib',
+        '--ro-bind', '/lib64', '/lib64',
+        '--ro-bind', '/bin', '/bin',
+        '--proc', '/proc',
+        '--dev', '/dev',
+        '--tmpfs', '/tmp',
+    ),
+}
+
+
+# Added to custom profiles at STANDARD and above, and at STRICT and above
+_CUSTOM_STANDARD_ARGS: Tuple[str, ...] = (
+    '--ro-bind', '/usr', '/usr',
+    '--ro-bind', '/lib', '/lib',
+    '--ro-bind', '/lib64', '/lib64',
+    '--proc', '/proc',
+    '--dev', '/dev',
+)
+_CUSTOM_STRICT_ARGS: Tuple[str, ...] = (
+    '--tmpfs', '/tmp',
+    '--tmpfs', '/var',
+    '--tmpfs', '/home',
+)
 
 
 class NetworkProfile(SandboxProfile):
     """Sandbox profile for network operations."""
     
+    __slots__ = ()
+    
     def __init__(self, level: SandboxLevel = SandboxLevel.STANDARD):
         super().__init__("network", level)
-        
-        if level == SandboxLevel.BASIC:
-            # Basic network isolation
-            self.bwrap_args = [
-                '--share-net',
-                '--ro-bind', '/etc/resolv.conf', '/etc/resolv.conf',
-                '--ro-bind', '/etc/hosts', '/etc/hosts',
-            ]
-        elif level == SandboxLevel.STANDARD:
-            # Standard network isolation with more restrictions
-            self.bwrap_args = [
-                '--share-net',
-                '--ro-bind', '/etc/resolv.conf', '/etc/resolv.conf',
-                '--ro-bind', '/etc/hosts', '/etc/hosts',
-                '--ro-bind', '/etc/ssl', '/etc/ssl',
-                '--ro-bind', '/etc/ca-certificates', '/etc/ca-certificates',
-            ]
-        else:  # STRICT
-            # No network access
-            self.bwrap_args = [
-                '--unshare-net',
-            ]
+        self.bwrap_args = _NETWORK_ARGS.get(level, _NETWORK_STRICT_ARGS)
 
 
 class FileAccessProfile(SandboxProfile):
     """Sandbox profile for file access operations."""
     
+    __slots__ = ('allowed_paths',)
+    
     def __init__(self, level: SandboxLevel = SandboxLevel.STANDARD, 
                  allowed_paths: Optional[List[str]] = None):
         super().__init__("file_access", level)
-        self.allowed_paths = allowed_paths or []
-        
-        if level == SandboxLevel.BASIC:
-            # Basic file isolation
-            self.bwrap_args = [
-                '--ro-bind', '/usr', '/usr',
-                '--ro-bind', '/lib', '/lib',
-                '--ro-bind', '/lib64', '/lib64',
-                '--proc', '/proc',
-                '--dev', '/dev',
-            ]
-            # Add whitelisted paths
-            for path in self.allowed_paths:
-                self.bwrap_args.extend(['--ro-bind', path, path])
-        
-        elif level == SandboxLevel.STANDARD:
-            # Standard file isolation
-            self.bwrap_args = [
-                '--ro-bind', '/usr', '/usr',
-                '--ro-bind', '/lib', '/lib',
-                '--ro-bind', '/lib64', '/lib64',
-                '--ro-bind', '/bin', '/bin',
-                '--ro-bind', '/sbin', '/sbin',
-                '--proc', '/proc',
-                '--dev', '/dev',
-                '--tmpfs', '/tmp',
-            ]
-            for path in self.allowed_paths:
-                self.bwrap_args.extend(['--ro-bind', path, path])
+        self.allowed_paths: Sequence[str] = allowed_paths or []
+        self.bwrap_args = _FILE_ACCESS_ARGS.get(level, _FILE_ACCESS_STRICT_ARGS)
         
-        else:  # STRICT
-            # Strict file isolation
-            self.bwrap_args = [
-                '--ro-bind', '/usr', '/usr',
-                '--ro-bind', '/lib', '/lib',
-                '--ro-bind', '/lib64', '/lib64',
-                '--tmpfs', '/tmp',
-                '--tmpfs', '/var',
-                '--tmpfs', '/home',
-                '--proc', '/proc',
-                '--dev', '/dev',
-            ]
-            for path in self.allowed_paths:
-                self.bwrap_args.extend(['--ro-bind', path, path])
+        # Add whitelisted paths
+        if self.allowed_paths:
+            self.bwrap_args += _ro_bind_args(self.allowed_paths)
+    
+    def _freeze(self) -> None:
+        """Make the profile read-only, including its allowed paths."""
+        self.allowed_paths = tuple(self.allowed_paths)
+        super()._freeze()
 
 
 class PackageManagerProfile(SandboxProfile):
     """Sandbox profile for package manager operations."""
     
+    __slots__ = ()
+    
     def __init__(self, level: SandboxLevel = SandboxLevel.BASIC):
         super().__init__("package_manager", level)
-        
         # Package managers need more access, so sandboxing is limited
-        if level == SandboxLevel.BASIC:
-            # Basic isolation for package queries
-            self.bwrap_args = [
-                '--ro-bind', '/usr', '/usr',
-                '--ro-bind', '/etc', '/etc',
-                '--ro-bind', '/var/lib/pacman', '/var/lib/pacman',
-                '--ro-bind', '/var/cache/pacman', '/var/cache/pacman',
-                '--proc', '/proc',
-                '--dev', '/dev',
-                '--tmpfs', '/tmp',
-            ]
-            
-        elif level in [SandboxLevel.STANDARD, SandboxLevel.STRICT]:
-            # More restrictive for read-only operations
-            self.bwrap_args = [
-                '--unshare-pid',
-                '--ro-bind', '/usr', '/usr',
-                '--ro-bind', '/etc', '/etc',
-                '--ro-bind', '/var/lib/pacman', '/var/lib/pacman',
-                '--ro-bind', '/var/cache/pacman/pkg', '/var/cache/pacman/pkg',
-                '--proc', '/proc',
-                '--dev', '/dev',
-                '--tmpfs', '/tmp',
-                '--new-session',
-            ]
+        self.bwrap_args = _PACKAGE_MANAGER_ARGS.get(level, ())
 
 
 class TerminalProfile(SandboxProfile):
     """Sandbox profile for terminal operations."""
     
+    __slots__ = ()
+    
     def __init__(self, level: SandboxLevel = SandboxLevel.BASIC):
         super().__init__("terminal", level)
         
-        if level == SandboxLevel.BASIC:
-            # Basic terminal isolation
-            self.bwrap_args = [
-                '--share-net',
-                '--ro-bind', '/etc', '/etc',
-                '--ro-bind', '/usr', '/usr',
-                '--ro-bind', '/lib', '/lib',
-                '--ro-bind', '/lib64', '/lib64',
-                '--ro-bind', '/bin', '/bin',
-                '--proc', '/proc',
-                '--dev', '/dev',
-                '--bind', os.path.expanduser('~'), os.path.expanduser('~'),
-            ]
-        
-        elif level == SandboxLevel.STANDARD:
-            # Standard terminal isolation
-            self.bwrap_args = [
-                '--share-net',
-                '--ro-bind', '/etc', '/etc',
-                '--ro-bind', '/usr', '/usr',
-                '--ro-bind', '/lib', '/lib',
-                '--ro-bind', '/lib64', '/lib64',
-                '--ro-bind', '/bin', '/bin',
-                '--proc', '/proc',
-                '--dev', '/dev',
-                '--tmpfs', '/tmp',
-                '--bind', os.path.expanduser('~'), os.path.expanduser('~'),
-            ]
+        if level in _TERMINAL_ARGS:
+            self.bwrap_args = _TERMINAL_ARGS[level] + ('--bind', _HOME, _HOME)
+
+
+@functools.lru_cache(maxsize=32)
+def _make_profile(profile_class: type, name: str, level: SandboxLevel) -> SandboxProfile:
+    """Build a profile at a non-default level; it is frozen since every caller shares it."""
+    if profile_class is SandboxProfile:
+        profile = SandboxProfile(name, level)
+    else:
+        profile = profile_class(level)
+    profile._freeze()
+    return profile
+
+
+@functools.lru_cache(maxsize=128)
+def _make_custom_profile(name: str, level: SandboxLevel, network: bool,
+                         filesystem: Tuple[str, ...]) -> SandboxProfile:
+    """Build a custom profile; identical requests share one frozen profile."""
+    profile = SandboxProfile(name, level)
+    
+    # Build bubblewrap arguments
+    bwrap_args = ('--share-net',) if network else ('--unshare-net',)
+    
+    if level >= SandboxLevel.STANDARD:
+        bwrap_args += _CUSTOM_STANDARD_ARGS
+    
+    if level >= SandboxLevel.STRICT:
+        bwrap_args += _CUSTOM_STRICT_ARGS
+    
+    # Add filesystem whitelist
+    if filesystem:
+        bwrap_args += _ro_bind_args(filesystem)
+    
+    profile.bwrap_args = bwrap_args
+    profile._freeze()
+    
+    return profile
+
+
+def _wrap_bwrap(base_cmd: List[str], profile: SandboxProfile,
+                allow_network: bool) -> List[str]:
+    """Wrap a command with bwrap, swapping '--unshare-net' for '--share-net' if asked."""
+    # Default path: the precomputed prefix needs no rewriting
+    if not allow_network or not profile.has_unshare_net:
+        return [*profile._bwrap_prefix, *base_cmd]
+    
+    bwrap_args = profile.bwrap_args
+    index = bwrap_args.index('--unshare-net')
+    return ['bwrap', *bwrap_args[:index], *bwrap_args[index + 1:], '--share-net', *base_cmd]
+
+
+# Sandbox type -> wrapper taking (base_cmd, profile, allow_network)
+_SANDBOX_HANDLERS: Dict[str, Callable[[List[str], SandboxProfile, bool], List[str]]] = {
+    'bwrap': _wrap_bwrap,
+}
 
 
 class SandboxManager:
@@ -209,21 +338,25 @@ class SandboxManager:
             custom_level: Override default security level
             
         Returns:
-            Sandbox profile
+            Sandbox profile; profiles at a custom level are shared and read-only
         """
-        if operation in cls.DEFAULT_PROFILES:
-            profile = cls.DEFAULT_PROFILES[operation]
-            
-            # Create new profile with custom level if requested
-            if custom_level and custom_level != profile.level:
-                profile_class = type(profile)
-                return profile_class(profile.name, custom_level)
-            
-            return profile
-        else:
+        profile = cls.DEFAULT_PROFILES.get(operation)
+        if profile is None:
             # Return generic profile for unknown operations
             logger.debug(f"No specific profile for operation '{operation}', using generic")
             return cls.DEFAULT_PROFILES['generic']
+        
+        # Use a profile with the custom level if requested, built once per level
+        if custom_level and custom_level != profile.level:
+            return _make_profile(type(profile), profile.name, custom_level)
+        
+        return profile
+    
+    @classmethod
+    def clear_profile_cache(cls) -> None:
+        """Drop memoized custom-level and custom profiles, e.g. after DEFAULT_PROFILES changes."""
+        _make_profile.cache_clear()
+        _make_custom_profile.cache_clear()
     
     @classmethod
     def get_sandbox_command(cls, base_cmd: List[str], profile: SandboxProfile,
@@ -243,20 +376,12 @@ class SandboxManager:
         if profile.level == SandboxLevel.NONE:
             return base_cmd
         
-        if sandbox_type == "bwrap":
-            sandbox_cmd = ['bwrap'] + profile.get_bwrap_args()
-            
-            # Add network access if requested
-            if allow_network and '--unshare-net' in sandbox_cmd:
-                sandbox_cmd.remove('--unshare-net')
-                sandbox_cmd.extend(['--share-net'])
-            
-            sandbox_cmd.extend(base_cmd)
-        else:
+        handler = _SANDBOX_HANDLERS.get(sandbox_type)
+        if handler is None:
             logger.warning(f"Unknown sandbox type: {sandbox_type}")
             return base_cmd
         
-        return sandbox_cmd
+        return handler(base_cmd, profile, allow_network)
     
     @classmethod
     def create_custom_profile(cls, name: str, level: SandboxLevel,
@@ -271,42 +396,10 @@ class SandboxManager:
             level: Security level
             network: Allow network access
             filesystem: List of allowed filesystem paths
-            capabilities: List of allowed capabilities
+            capabilities: Accepted for compatibility and ignored; bubblewrap
+                can only add capabilities when run as root
             
         Returns:
-            Custom sandbox profile
+            Custom sandbox profile, shared by identical requests and read-only
         """
-        profile = SandboxProfile(name, level)
-        
-        # Build bubblewrap arguments
-        bwrap_args = []
-        
-        if not network:
-            bwrap_args.append('--unshare-net')
-        else:
-            bwrap_args.extend(['--share-net'])
-        
-        if level >= SandboxLevel.STANDARD:
-            bwrap_args.extend([
-                '--ro-bind', '/usr', '/usr',
-                '--ro-bind', '/lib', '/lib',
-                '--ro-bind', '/lib64', '/lib64',
-                '--proc', '/proc',
-                '--dev', '/dev',
-            ])
-        
-        if level >= SandboxLevel.STRICT:
-            bwrap_args.extend([
-                '--tmpfs', '/tmp',
-                '--tmpfs', '/var',
-                '--tmpfs', '/home',
-            ])
-        
-        # Add filesystem whitelist
-        if filesystem:
-            for path in filesystem:
-                bwrap_args.extend(['--ro-bind', path, path])
-        
-        profile.bwrap_args = bwrap_args
-        
-        return profile 
\ No newline at end of file
+        return _make_custom_profile(name, level, network, tuple(filesystem or ()))
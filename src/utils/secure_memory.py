@@ -4,8 +4,8 @@ Secure memory management utilities for handling sensitive data.
 
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import base64
 import gc
-import sys
 import ctypes
 import platform
 import mmap
@@ -18,8 +18,70 @@ import logging
 
 from .logger import get_logger
 
+try:
+    from cryptography.fernet import Fernet  # type: ignore[import-not-found]
+except ImportError:  # Optional: XOR fallback is used without it
+    Fernet = None
+
 logger = get_logger(__name__)
 
+# Resolved once at import; the platform and its C library do not change at runtime
+_SYSTEM = platform.system()
+
+
+def _load_native_library() -> Any:
+    """Load kernel32 on Windows or libc on Linux/macOS, or None if unavailable."""
+    try:
+        if _SYSTEM == "Windows":
+            return ctypes.windll.kernel32  # type: ignore[attr-defined]
+        if _SYSTEM in ("Linux", "Darwin"):
+            return ctypes.CDLL("libc.so.6" if _SYSTEM == "Linux" else "libc.dylib", use_errno=True)
+    except Exception as e:
+        logger.debug(f"Native memory functions not available: {e}")
+    return None
+
+
+def _bind_memory_function(library: Any, name: str, restype: Any = None) -> Any:
+    """Look up a (void *, size_t) function and set its signature, or return None."""
+    if library is None:
+        return None
+    try:
+        function = getattr(library, name)
+    except AttributeError:
+        return None
+    function.argtypes = [ctypes.c_void_p, ctypes.c_size_t]
+    function.restype = restype
+    return function
+
+
+_NATIVE_LIBRARY = _load_native_library()
+_SECURE_ZERO = _bind_memory_function(
+    _NATIVE_LIBRARY, "RtlSecureZeroMemory" if _SYSTEM == "Windows" else "explicit_bzero"
+)
+
+# VirtualLock/VirtualUnlock return a BOOL, mlock/munlock return 0 on success
+if _SYSTEM == "Windows":
+    _LOCK_PAGES = _bind_memory_function(_NATIVE_LIBRARY, "VirtualLock", ctypes.c_bool)
+    _UNLOCK_PAGES = _bind_memory_function(_NATIVE_LIBRARY, "VirtualUnlock", ctypes.c_bool)
+    _LOCK_SUCCESS: Any = True
+else:
+    _LOCK_PAGES = _bind_memory_function(_NATIVE_LIBRARY, "mlock", ctypes.c_int)
+    _UNLOCK_PAGES = _bind_memory_function(_NATIVE_LIBRARY, "munlock", ctypes.c_int)
+    _LOCK_SUCCESS = 0
+
+
+def _wipe_buffer(buffer: bytearray) -> bool:
+    """
+    Zero a bytearray in place.
+
+    Only buffers owned by the caller may be wiped; immutable bytes objects
+    can be shared with unrelated code and must never be overwritten.
+    """
+    if not buffer:
+        return True
+    view = (ctypes.c_char * len(buffer)).from_buffer(buffer)
+    return PlatformMemoryManager.secure_zero_memory(ctypes.addressof(view), len(buffer))
+
 
 class PlatformMemoryManager:
     """Platform-specific memory management operations."""
@@ -47,36 +109,16 @@ class PlatformMemoryManager:
             True if successful, False otherwise
         """
         try:
-            if platform.system() == "Windows":
-                # Use RtlSecureZeroMemory on Windows
+            # RtlSecureZeroMemory on Windows, explicit_bzero on Linux/macOS
+            if _SECURE_ZERO is not None:
                 try:
-                    kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
-                    RtlSecureZeroMemory = kernel32.RtlSecureZeroMemory
-                    RtlSecureZeroMemory.argtypes = [ctypes.c_void_p, ctypes.c_size_t]
-                    RtlSecureZeroMemory(address, size)
+                    _SECURE_ZERO(address, size)
                     return True
-                except Exception:
-                    # Fallback to explicit_bzero if available
-                    return PlatformMemoryManager._fallback_zero_memory(address, size)
-
-            elif platform.system() in ["Linux", "Darwin"]:
-                # Try explicit_bzero on Unix-like systems
-                try:
-                    libc = ctypes.CDLL("libc.so.6" if platform.system() == "Linux" else "libc.dylib")
-                    if hasattr(libc, 'explicit_bzero'):
-                        explicit_bzero = libc.explicit_bzero
-                        explicit_bzero.argtypes = [ctypes.c_void_p, ctypes.c_size_t]
-                        explicit_bzero(address, size)
-                        return True
                 except Exception:
                     pass
 
-                # Fallback to multiple overwrites
-                return PlatformMemoryManager._fallback_zero_memory(address, size)
-
-            else:
-                # Unknown platform, use fallback
-                return PlatformMemoryManager._fallback_zero_memory(address, size)
+            # Unknown platform or no native function, use fallback
+            return PlatformMemoryManager._fallback_zero_memory(address, size)
 
         except Exception as e:
             logger.error(f"Error in secure memory zeroing: {e}")
@@ -85,7 +127,7 @@ class PlatformMemoryManager:
     @staticmethod
     def _fallback_zero_memory(address: int, size: int) -> bool:
         """
-        Fallback memory zeroing using multiple overwrites.
+        Fallback memory zeroing with ctypes.memset.
 
         Args:
             address: Memory address to zero
@@ -95,11 +137,8 @@ class PlatformMemoryManager:
             True if successful
         """
         try:
-            # Multiple pass overwrite with different patterns
-            patterns = [b'\x00', b'\xFF', b'\xAA', b'\x55', b'\x00']
-
-            for pattern in patterns:
-                ctypes.memmove(address, pattern * size, size)
+            # A single in-place zero pass clears RAM
+            ctypes.memset(address, 0, size)
 
             return True
         except Exception as e:
@@ -119,21 +158,7 @@ class PlatformMemoryManager:
             True if successful
         """
         try:
-            if platform.system() == "Windows":
-                kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
-                VirtualLock = kernel32.VirtualLock
-                VirtualLock.argtypes = [ctypes.c_void_p, ctypes.c_size_t]
-                VirtualLock.restype = ctypes.c_bool
-                return bool(VirtualLock(address, size))
-
-            elif platform.system() in ["Linux", "Darwin"]:
-                libc = ctypes.CDLL("libc.so.6" if platform.system() == "Linux" else "libc.dylib")
-                mlock = libc.mlock
-                mlock.argtypes = [ctypes.c_void_p, ctypes.c_size_t]
-                mlock.restype = ctypes.c_int
-                return mlock(address, size) == 0
-
-            return False
+            return _LOCK_PAGES is not None and _LOCK_PAGES(address, size) == _LOCK_SUCCESS
 
         except Exception as e:
             logger.debug(f"Memory locking not available: {e}")
@@ -152,21 +177,7 @@ class PlatformMemoryManager:
             True if successful
         """
         try:
-            if platform.system() == "Windows":
-                kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
-                VirtualUnlock = kernel32.VirtualUnlock
-                VirtualUnlock.argtypes = [ctypes.c_void_p, ctypes.c_size_t]
-                VirtualUnlock.restype = ctypes.c_bool
-                return bool(VirtualUnlock(address, size))
-
-            elif platform.system() in ["Linux", "Darwin"]:
-                libc = ctypes.CDLL("libc.so.6" if platform.system() == "Linux" else "libc.dylib")
-                munlock = libc.munlock
-                munlock.argtypes = [ctypes.c_void_p, ctypes.c_size_t]
-                munlock.restype = ctypes.c_int
-                return munlock(address, size) == 0
-
-            return False
+            return _UNLOCK_PAGES is not None and _UNLOCK_PAGES(address, size) == _LOCK_SUCCESS
 
         except Exception as e:
             logger.debug(f"Memory unlocking not available: {e}")
@@ -174,28 +185,38 @@ class PlatformMemoryManager:
 
 
 class SecureString:
-    """A string-like object that clears its content from memory when destroyed."""
+    """
+    A string-like object that clears its content from memory when destroyed.
+
+    Python strings are immutable and id() points at the object header, not
+    the characters, so the value is kept UTF-8 encoded in a ctypes buffer
+    whose bytes can be zeroed in place.
+    """
 
     def __init__(self, value: str = ""):
         """Initialize with a string value."""
         if not isinstance(value, str):
             value = str(value)
-        self._value = value
+        encoded = value.encode('utf-8', 'surrogatepass')
+        self._buf = ctypes.create_string_buffer(encoded)
+        self._len = len(encoded)
+        self._length = len(value)
         self._cleared = False
         self._locked = False
-        self._memory_address = None
-        self._memory_size = 0
+        self._memory_address = ctypes.addressof(self._buf)
+        self._memory_size = ctypes.sizeof(self._buf)
 
         # Try to lock memory if the value contains sensitive data
         self._attempt_memory_lock()
 
+    @property
+    def _value(self) -> str:
+        """Decode the current buffer contents."""
+        return self._buf.raw[:self._len].decode('utf-8', 'surrogatepass')
+
     def _attempt_memory_lock(self):
         """Attempt to lock the memory containing sensitive data."""
         try:
-            # Get memory address and size of the string object
-            self._memory_address = id(self._value)
-            self._memory_size = sys.getsizeof(self._value)
-
             # Attempt to lock memory pages
             if PlatformMemoryManager.lock_memory_pages(self._memory_address, self._memory_size):
                 self._locked = True
@@ -222,11 +243,11 @@ class SecureString:
         """Return length of string."""
         if self._cleared:
             return 0
-        return len(self._value)
+        return self._length
 
     def __bool__(self) -> bool:
         """Return True if string is not empty and not cleared."""
-        return not self._cleared and bool(self._value)
+        return not self._cleared and self._len > 0
 
     def get(self) -> str:
         """Get the string value."""
@@ -236,8 +257,8 @@ class SecureString:
 
     def clear(self):
         """Clear the string value from memory using platform-specific secure methods."""
-        if not self._cleared and self._value:
-            # Overwrite the string multiple times using platform-specific methods
+        if not self._cleared and self._len:
+            # Overwrite the buffer using platform-specific methods
             try:
                 # Use platform-specific secure memory zeroing
                 if self._memory_address and self._memory_size:
@@ -264,24 +285,17 @@ class SecureString:
                 logger.debug(f"Could not securely clear string: {e}")
                 self._fallback_clear()
             finally:
-                self._value = ""
+                self._len = 0
+                self._length = 0
                 self._cleared = True
-                # Force garbage collection to increase chances of memory cleanup
-                gc.collect()
 
     def _fallback_clear(self):
         """Fallback clearing method for when platform-specific methods fail."""
         try:
-            # Get the string object's memory location
-            string_obj = self._value
-
-            # Try to overwrite memory (this is best-effort in Python)
-            if hasattr(string_obj, '__len__') and len(string_obj) > 0:
-                # Create multiple overwrite patterns
-                patterns = ['\x00', '\xFF', '\xAA', '\x55', '\x00']
-
-                for pattern in patterns:
-                    self._value = pattern * len(string_obj)
+            # Zero the buffer in place, then read it back so the write is observed
+            ctypes.memset(self._buf, 0, self._memory_size)
+            if self._buf.raw.count(0) != self._memory_size:
+                logger.debug("Fallback string clearing left non-zero bytes")
 
         except Exception as e:
             logger.debug(f"Fallback string clearing failed: {e}")
@@ -339,16 +353,11 @@ class SecureList:
                         except BaseException:
                             pass
 
-                # Overwrite with empty values
-                for i in range(len(self._items)):
-                    self._items[i] = None
-
             except Exception:
                 pass
             finally:
                 self._items.clear()
                 self._cleared = True
-                gc.collect()
 
     def get_copy(self) -> List[Any]:
         """Get a copy of the list."""
@@ -416,16 +425,11 @@ class SecureDict:
                         except BaseException:
                             pass
 
-                # Overwrite with None
-                for key in list(self._data.keys()):
-                    self._data[key] = None
-
             except Exception:
                 pass
             finally:
                 self._data.clear()
                 self._cleared = True
-                gc.collect()
 
     def get_copy(self) -> Dict[str, Any]:
         """Get a copy of the dict."""
@@ -469,9 +473,6 @@ class MemoryManager:
                 global_vars[var_name] = None
                 del global_vars[var_name]
 
-            # Force garbage collection
-            gc.collect()
-
         except Exception as e:
             logger.debug(f"Error during secure variable deletion: {e}")
 
@@ -492,9 +493,6 @@ class MemoryManager:
             except Exception as e:
                 logger.debug(f"Error clearing object: {e}")
 
-        # Force garbage collection
-        gc.collect()
-
     @staticmethod
     def overwrite_memory_region(data: Union[str, bytes], overwrite_value: int = 0):
         """
@@ -527,15 +525,14 @@ class MemoryManager:
 
     @staticmethod
     def force_garbage_collection():
-        """Force aggressive garbage collection to clear memory."""
-        try:
-            # Multiple GC passes to ensure cleanup
-            for _ in range(3):
-                gc.collect()
+        """
+        Run one full garbage collection to release cleared objects.
 
-            # Try to compact memory if available
-            if hasattr(gc, 'compact'):
-                gc.compact()
+        Clearing secure objects does not collect; call this once after a
+        batch of clears, e.g. at shutdown.
+        """
+        try:
+            gc.collect()
 
         except Exception as e:
             logger.debug(f"Garbage collection error: {e}")
@@ -555,15 +552,14 @@ class SecureDataStore:
             encryption_key: Optional encryption key for data at rest
         """
         self._data: Dict[str, Any] = {}
-        self._encrypted_data: Dict[str, bytes] = {}
+        self._encrypted_data: Dict[str, bytearray] = {}
         self._cleared = False
         self._lock = threading.RLock()
 
-        # Generate or use provided encryption key
-        self._encryption_key = encryption_key or secrets.token_bytes(32)
-
-        # Track memory locations for secure cleanup
-        self._memory_locations: List[Dict[str, Any]] = []
+        # Generate or use provided encryption key; the store keeps its own
+        # mutable copy so clear_all() can wipe it without touching the caller's
+        self._encryption_key: Optional[bytearray] = bytearray(encryption_key or secrets.token_bytes(32))
+        self._fernet: Any = None
 
         logger.debug("Initialized secure data store with memory protection")
 
@@ -586,17 +582,13 @@ class SecureDataStore:
 
             try:
                 if encrypt and isinstance(value, (str, bytes)):
-                    # Encrypt sensitive data
-                    encrypted_value = self._encrypt_data(value)
+                    # Encrypt sensitive data into a buffer the store owns and
+                    # wipe the one it replaces for a repeated key
+                    encrypted_value = bytearray(self._encrypt_data(value))
+                    previous = self._encrypted_data.get(key)
                     self._encrypted_data[key] = encrypted_value
-
-                    # Track memory location for cleanup
-                    self._memory_locations.append({
-                        'key': key,
-                        'type': 'encrypted',
-                        'address': id(encrypted_value),
-                        'size': sys.getsizeof(encrypted_value)
-                    })
+                    if previous is not None:
+                        _wipe_buffer(previous)
                 else:
                     # Store as secure object
                     secure_value: Any
@@ -609,16 +601,9 @@ class SecureDataStore:
                     else:
                         secure_value = value
 
+                    # Secure objects wipe their own storage in clear()
                     self._data[key] = secure_value
 
-                    # Track memory location
-                    self._memory_locations.append({
-                        'key': key,
-                        'type': 'secure_object',
-                        'address': id(secure_value),
-                        'size': sys.getsizeof(secure_value)
-                    })
-
                 return True
 
             except Exception as e:
@@ -642,11 +627,12 @@ class SecureDataStore:
 
             try:
                 # Check encrypted data first
+                # Callers get copies; the store's buffers are wiped by clear_all()
                 if key in self._encrypted_data:
                     if decrypt:
-                        return self._decrypt_data(self._encrypted_data[key])
+                        return self._decrypt_data(bytes(self._encrypted_data[key]))
                     else:
-                        return self._encrypted_data[key]
+                        return bytes(self._encrypted_data[key])
 
                 # Check regular secure data
                 return self._data.get(key)
@@ -655,49 +641,46 @@ class SecureDataStore:
                 logger.error(f"Error retrieving secure data: {e}")
                 return None
 
-    def _encrypt_data(self, data: Union[str, bytes]) -> bytes:
-        """Encrypt data using AES encryption."""
-        try:
-            from cryptography.fernet import Fernet  # type: ignore[import-not-found]
-            import base64
-
+    def _get_fernet(self) -> Any:
+        """Return the Fernet cipher for our encryption key, built on first use."""
+        if self._fernet is None:
             # Create Fernet key from our encryption key
-            key = base64.urlsafe_b64encode(self._encryption_key[:32])
-            fernet = Fernet(key)
-
-            if isinstance(data, str):
-                data = data.encode('utf-8')
+            self._fernet = Fernet(base64.urlsafe_b64encode(self._encryption_key[:32]))
+        return self._fernet
 
-            return fernet.encrypt(data)
-
-        except ImportError:
+    def _encrypt_data(self, data: Union[str, bytes]) -> bytes:
+        """Encrypt data using AES encryption."""
+        if Fernet is None:
             # Fallback to simple XOR encryption if cryptography not available
             logger.warning("Cryptography library not available, using fallback encryption")
             return self._xor_encrypt(data)
 
-    def _decrypt_data(self, encrypted_data: bytes) -> bytes:
-        """Decrypt data using AES decryption."""
-        try:
-            from cryptography.fernet import Fernet
-            import base64
-
-            # Create Fernet key from our encryption key
-            key = base64.urlsafe_b64encode(self._encryption_key[:32])
-            fernet = Fernet(key)
+        if isinstance(data, str):
+            data = data.encode('utf-8')
 
-            return fernet.decrypt(encrypted_data)
+        return self._get_fernet().encrypt(data)
 
-        except ImportError:
+    def _decrypt_data(self, encrypted_data: bytes) -> bytes:
+        """Decrypt data using AES decryption."""
+        if Fernet is None:
             # Fallback to simple XOR decryption
             return self._xor_decrypt(encrypted_data)
 
+        return self._get_fernet().decrypt(encrypted_data)
+
     def _xor_encrypt(self, data: Union[str, bytes]) -> bytes:
         """Simple XOR encryption fallback."""
         if isinstance(data, str):
             data = data.encode('utf-8')
 
+        size = len(data)
+        if not size:
+            return b''
+
+        # XOR the whole buffer as one integer instead of byte by byte
         key_bytes = self._encryption_key
-        return bytes(a ^ key_bytes[i % len(key_bytes)] for i, a in enumerate(data))
+        key_stream = (key_bytes * (size // len(key_bytes) + 1))[:size]
+        return (int.from_bytes(data, 'little') ^ int.from_bytes(key_stream, 'little')).to_bytes(size, 'little')
 
     def _xor_decrypt(self, encrypted_data: bytes) -> bytes:
         """Simple XOR decryption fallback."""
@@ -715,41 +698,25 @@ class SecureDataStore:
                     if hasattr(value, 'clear'):
                         value.clear()
 
-                # Securely clear encrypted data
-                for key, encrypted_value in list(self._encrypted_data.items()):
-                    # Get memory location
-                    addr = id(encrypted_value)
-                    size = sys.getsizeof(encrypted_value)
-
-                    # Use platform-specific secure clearing
-                    PlatformMemoryManager.secure_zero_memory(addr, size)
-
-                # Clear all memory locations
-                for location in self._memory_locations:
+                # Securely clear encrypted data using platform-specific clearing
+                for encrypted_value in self._encrypted_data.values():
                     try:
-                        PlatformMemoryManager.secure_zero_memory(
-                            location['address'], location['size']
-                        )
+                        _wipe_buffer(encrypted_value)
                     except Exception:
                         pass
 
                 # Clear dictionaries
                 self._data.clear()
                 self._encrypted_data.clear()
-                self._memory_locations.clear()
 
                 # Clear encryption key
                 if self._encryption_key:
-                    addr = id(self._encryption_key)
-                    size = sys.getsizeof(self._encryption_key)
-                    PlatformMemoryManager.secure_zero_memory(addr, size)
+                    _wipe_buffer(self._encryption_key)
                     self._encryption_key = None
+                self._fernet = None
 
                 self._cleared = True
 
-                # Force garbage collection
-                gc.collect()
-
                 logger.debug("Cleared all data from secure store")
 
             except Exception as e:
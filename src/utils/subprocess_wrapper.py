@@ -116,8 +116,13 @@ class SecureSubprocess:
     # Note: systemctl, mount, and umount now have dedicated secure wrappers
     PRIVILEGE_ALLOWED = {'pacman', 'paccache'}
 
+    # Valid package names: alphanumeric, dash, underscore, plus, dot, at most 255 characters
+    _PACKAGE_NAME_RE = re.compile(r'[a-zA-Z0-9\-_+.]+')
+    _MAX_PACKAGE_NAME_LENGTH = 255
+
     # Cache for validated command paths and system info
     _command_path_cache: Dict[str, str] = {}
+    _command_exists_cache: Dict[str, bool] = {}
     _system_info_cache: Dict[str, Any] = {}
     _validation_lock = threading.Lock()
 
@@ -691,8 +696,8 @@ class SecureSubprocess:
         """
         return cls._find_command_path(command)
 
-    @staticmethod
-    def sanitize_package_name(name: str) -> str:
+    @classmethod
+    def sanitize_package_name(cls, name: str) -> str:
         """
         Sanitize a package name to prevent injection.
 
@@ -706,12 +711,11 @@ class SecureSubprocess:
             ValueError: If package name is invalid
         """
         # Valid package name pattern: alphanumeric, dash, underscore, plus, dot
-        import re
-        if not re.match(r'^[a-zA-Z0-9\-_+.]+$', name):
+        if not cls._PACKAGE_NAME_RE.fullmatch(name):
             raise ValueError(f"Invalid package name: {name}")
 
         # Additional length check
-        if len(name) > 255:
+        if len(name) > cls._MAX_PACKAGE_NAME_LENGTH:
             raise ValueError(f"Package name too long: {name}")
 
         return name
@@ -900,6 +904,7 @@ class SecureSubprocess:
         require_sudo: bool = False,
         timeout: int = 30,
         use_sandbox: bool = True,
+        merge_stderr: bool = False,
         **kwargs: Any
     ) -> subprocess.CompletedProcess:
         """
@@ -909,6 +914,8 @@ class SecureSubprocess:
             args: Pacman arguments
             require_sudo: Whether to run with sudo
             timeout: Command timeout
+            use_sandbox: Whether to sandbox unprivileged runs with bwrap
+            merge_stderr: Capture stderr interleaved into stdout through one pipe
             **kwargs: Additional arguments for subprocess.run
 
         Returns:
@@ -936,6 +943,12 @@ class SecureSubprocess:
         env['LC_ALL'] = 'C'
         env['LC_TIME'] = 'C'
         kwargs['env'] = env
+
+        if merge_stderr:
+            # One pipe carries both streams, so no stdout + stderr copy is needed
+            kwargs['capture_output'] = False
+            kwargs['stdout'] = subprocess.PIPE
+            kwargs['stderr'] = subprocess.STDOUT
         
         # Determine sandbox type based on availability
         sandbox = None
@@ -956,7 +969,19 @@ class SecureSubprocess:
         Returns:
             True if command exists and is valid
         """
-        return cls._find_command_path(command) is not None
+        # Availability doesn't change while we run; remember both outcomes so
+        # missing commands don't repeat the PATH walk and 'which' fallback
+        exists = cls._command_exists_cache.get(command)
+        if exists is None:
+            exists = cls._command_exists_cache[command] = cls._find_command_path(command) is not None
+        return exists
+
+    @classmethod
+    def clear_command_cache(cls) -> None:
+        """Forget cached command lookups, e.g. after installing a command."""
+        with cls._validation_lock:
+            cls._command_exists_cache.clear()
+            cls._command_path_cache.clear()
 
     @classmethod
     def get_available_commands(cls) -> Dict[str, str]:
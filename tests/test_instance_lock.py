@@ -0,0 +1,44 @@
+"""
+Unit tests for instance locking.
+"""
+
+import signal
+import tempfile
+import threading
+import unittest
+
+import src.utils.instance_lock as instance_lock_module
+from src.utils.instance_lock import InstanceLock
+
+
+class TestInstanceLockSignalHandlers(unittest.TestCase):
+    """Test signal handler installation for instance locks."""
+
+    def setUp(self):
+        """Restore signal handlers and module state after each test."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            self.addCleanup(signal.signal, sig, signal.getsignal(sig))
+        self.addCleanup(setattr, instance_lock_module, '_handlers_installed',
+                        instance_lock_module._handlers_installed)
+        instance_lock_module._handlers_installed = False
+
+    def test_handlers_installed_after_non_main_thread_lock(self):
+        """Test a lock acquired off the main thread does not block later installation."""
+        def acquire_in_thread():
+            with InstanceLock('test-signal-handlers', 'thread', lock_dir=self.temp_dir.name):
+                pass
+
+        thread = threading.Thread(target=acquire_in_thread)
+        thread.start()
+        thread.join()
+        self.assertFalse(instance_lock_module._handlers_installed)
+
+        with InstanceLock('test-signal-handlers', 'main', lock_dir=self.temp_dir.name):
+            self.assertTrue(instance_lock_module._handlers_installed)
+            self.assertIs(signal.getsignal(signal.SIGTERM), instance_lock_module._cleanup_all_locks)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,176 @@
+"""
+Unit tests for logging utilities.
+"""
+
+import json
+import os
+import re
+import tempfile
+import time
+import unittest
+
+import src.utils.logger as logger_module
+from src.utils.logger import log_security_event, sanitize_log_message, setup_logging
+
+
+class TestSanitizeLogMessage(unittest.TestCase):
+    """Test log message sanitization."""
+
+    def test_long_message_truncated(self):
+        """Test oversized messages are cut to the output limit."""
+        sanitized = sanitize_log_message('package linux updated ' * 200)
+        self.assertTrue(sanitized.endswith('... [TRUNCATED]'))
+        self.assertLessEqual(len(sanitized), 1000 + len('... [TRUNCATED]'))
+
+    def test_secret_straddling_scan_limit_is_not_leaked(self):
+        """Test redaction shrinkage cannot pull a cut secret into the output."""
+        message = ' '.join(['0123456789abcdef' * 4] * 20)
+        for debug_level in (False, True):
+            sanitized = sanitize_log_message(message, debug_level=debug_level)
+            self.assertIsNone(re.search(r'[0-9a-f]{17,}', sanitized), sanitized[-80:])
+
+    def test_unclosed_block_at_scan_limit_is_redacted(self):
+        """Test a config block crossing the scan limit is still redacted."""
+        message = 'x ' * 950 + 'config={' + 'secret_value ' * 100 + '}'
+        sanitized = sanitize_log_message(message, debug_level=True)
+        self.assertNotIn('secret_value', sanitized)
+
+
+
+class TestSecurityEventLog(unittest.TestCase):
+    """Test the background writer for the dedicated security log."""
+
+    def setUp(self):
+        """Point the security log at a temporary file."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.log_path = os.path.join(self.temp_dir.name, 'security.log')
+        original_path = logger_module._security_log_path
+        logger_module._security_log_path = self.log_path
+        self.addCleanup(setattr, logger_module, '_security_log_path', original_path)
+        self.addCleanup(self._reset_security_worker)
+
+    def _reset_security_worker(self):
+        """Drain the worker and start the next test from a fresh one."""
+        logger_module._stop_security_worker()
+        logger_module._flush_security_log()
+        logger_module._reset_security_worker_after_fork()
+
+    def _read_entries(self):
+        """Return the JSON entries on disk."""
+        if not os.path.exists(self.log_path):
+            return []
+        with open(self.log_path, encoding='utf-8') as f:
+            return [json.loads(line) for line in f]
+
+    def _wait_for(self, condition, timeout=5.0):
+        """Poll until condition() holds or the timeout elapses."""
+        deadline = time.monotonic() + timeout
+        while not condition():
+            if time.monotonic() > deadline:
+                self.fail('timed out waiting for the security worker')
+            time.sleep(0.01)
+
+    def test_error_event_written_and_flushed(self):
+        """Test a queued error event reaches the disk without an explicit flush."""
+        log_security_event('TEST_WORKER_ERROR', {'package': 'linux'}, severity='error')
+        self._wait_for(lambda: self._read_entries())
+
+        entry = self._read_entries()[0]
+        self.assertEqual(entry['event_type'], 'TEST_WORKER_ERROR')
+        self.assertEqual(entry['severity'], 'error')
+        self.assertEqual(entry['details'], {'package': 'linux'})
+
+    def test_buffered_event_flushed_at_exit(self):
+        """Test buffered events are written by the exit handlers."""
+        log_security_event('TEST_WORKER_INFO', severity='info')
+        logger_module._stop_security_worker()
+        logger_module._flush_security_log()
+
+        self.assertEqual([e['event_type'] for e in self._read_entries()], ['TEST_WORKER_INFO'])
+
+    def test_event_after_stop_written_synchronously(self):
+        """Test events logged after the worker stopped are not lost."""
+        log_security_event('TEST_BEFORE_STOP', severity='info')
+        logger_module._stop_security_worker()
+        log_security_event('TEST_AFTER_STOP', severity='info')
+
+        self.assertEqual([e['event_type'] for e in self._read_entries()],
+                         ['TEST_BEFORE_STOP', 'TEST_AFTER_STOP'])
+
+    @unittest.skipUnless(hasattr(os, 'fork'), 'requires os.fork')
+    def test_fork_discards_inherited_buffer(self):
+        """Test a forked child neither reuses nor flushes the parent's handle."""
+        log_security_event('TEST_BEFORE_FORK', severity='info')
+        self._wait_for(lambda: logger_module._sec_pending
+                       and not logger_module._global_state_lock.locked())
+
+        pid = os.fork()
+        if pid == 0:
+            try:
+                # What the child's exit handlers would do
+                logger_module._flush_security_log()
+                reset = (logger_module._security_log_fh is None
+                         and logger_module._security_log_fh_path is None
+                         and logger_module._security_worker is None)
+                os._exit(0 if reset else 1)
+            finally:
+                os._exit(2)
+
+        _, status = os.waitpid(pid, 0)
+        self.assertEqual(os.WEXITSTATUS(status), 0)
+        logger_module._flush_security_log()
+        self.assertEqual([e['event_type'] for e in self._read_entries()], ['TEST_BEFORE_FORK'])
+
+
+
+class TestFileLogWriter(unittest.TestCase):
+    """Test the background writer for log files."""
+
+    def setUp(self):
+        """Log to a temporary file."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.log_path = os.path.join(self.temp_dir.name, 'app.log')
+        self.logger = setup_logging('test_file_log_writer', self.log_path)
+        self.addCleanup(self.logger.handlers.clear)
+        self.addCleanup(logger_module._stop_file_writer, self.log_path)
+
+    def _read_messages(self):
+        """Return the messages on disk."""
+        with open(self.log_path, encoding='utf-8') as f:
+            return [line.rsplit(' - ', 1)[1].strip() for line in f]
+
+    @unittest.skipUnless(hasattr(os, 'fork'), 'requires os.fork')
+    def test_fork_discards_inherited_buffer(self):
+        """Test a forked child writes its own records but not the parent's buffer."""
+        self.logger.warning('parent-before-fork')
+        log_queue, listener = logger_module._file_log_writers[self.log_path]
+        deadline = time.monotonic() + 5.0
+        while not log_queue.empty() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.05)
+        # Wait for the listener to finish writing the record to its buffer
+        with listener.handlers[0].lock:
+            pass
+
+        pid = os.fork()
+        if pid == 0:
+            try:
+                self.logger.warning('child-message')
+                # What the child's exit handlers would do
+                logger_module._stop_file_logging()
+                os._exit(0)
+            finally:
+                os._exit(1)
+
+        _, status = os.waitpid(pid, 0)
+        self.assertEqual(os.WEXITSTATUS(status), 0)
+        self.logger.warning('parent-after')
+        logger_module._stop_file_writer(self.log_path)
+        self.assertEqual(sorted(self._read_messages()),
+                         ['child-message', 'parent-after', 'parent-before-fork'])
+
+
+if __name__ == '__main__':
+    unittest.main()
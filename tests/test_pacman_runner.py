@@ -2,6 +2,7 @@
 Tests for the PacmanRunner utility.
 """
 
+import asyncio
 import pytest
 import subprocess
 import tempfile
@@ -130,6 +131,18 @@ class TestPacmanRunner:
         assert duration > 0
         assert output is None
     
+    @patch('src.utils.subprocess_wrapper.SecureSubprocess.run_pacman')
+    def test_run_update_interactive_invalid_package(self, mock_run_pacman):
+        """Test that invalid package names are rejected before running pacman."""
+        packages = ['valid-package', 'bad;name', 'x' * 256]
+        
+        exit_code, duration, output = PacmanRunner.run_update_interactive(packages)
+        
+        assert exit_code == 1
+        assert duration == 0.0
+        assert output == f"Invalid package names: bad;name, {'x' * 256}"
+        mock_run_pacman.assert_not_called()
+    
     @patch('src.utils.subprocess_wrapper.SecureSubprocess.run_pacman')
     def test_run_update_interactive_with_capture(self, mock_run_pacman):
         """Test running update with output capture."""
@@ -170,6 +183,36 @@ class TestPacmanRunner:
         assert duration > 0
         assert "Command not found" in output
     
+    @patch('src.utils.subprocess_wrapper.SecureSubprocess.run_pacman')
+    def test_run_update_interactive_async(self, mock_run_pacman):
+        """Test the async variant returns the same result as the blocking call."""
+        mock_result = Mock()
+        mock_result.returncode = 0
+        mock_result.stdout = "done"
+        mock_result.stderr = ""
+        mock_run_pacman.return_value = mock_result
+        
+        exit_code, duration, output = asyncio.run(
+            PacmanRunner.run_update_interactive_async(['test-package'], capture_output=True)
+        )
+        
+        assert exit_code == 0
+        assert output == "done"
+        mock_run_pacman.assert_called_once()
+    
+    @patch('src.utils.pacman_runner.PacmanRunner.get_last_full_update_time')
+    @patch('src.utils.pacman_runner.PacmanRunner.get_database_last_sync_time')
+    def test_get_sync_and_update_times(self, mock_sync_time, mock_update_time):
+        """Test both timestamps are returned from one awaitable call."""
+        sync_time = datetime(2024, 1, 2, 3, 4, 5)
+        update_time = datetime(2024, 1, 1, 12, 0, 0)
+        mock_sync_time.return_value = sync_time
+        mock_update_time.return_value = update_time
+        
+        result = asyncio.run(PacmanRunner.get_sync_and_update_times())
+        
+        assert result == (sync_time, update_time)
+    
     def test_create_history_entry(self):
         """Test creation of history entries."""
         packages = ['kernel', 'systemd']
@@ -2,9 +2,14 @@
 Unit tests for package pattern matching.
 """
 
+import re
 import unittest
+from unittest.mock import patch
 
-from src.utils.patterns import PackagePatternMatcher
+from src.utils.patterns import (
+    PackagePatternMatcher, _NAME_BEFORE_PACKAGE, _finditer_name_before_package, _has_redos_shape,
+    _make_possessive
+)
 
 
 class TestPackagePatternMatcher(unittest.TestCase):
@@ -100,12 +105,52 @@ class TestPackagePatternMatcher(unittest.TestCase):
         self.assertIn("vim", packages)
         self.assertIn("pacman", packages)
 
+    def test_direct_match_without_ahocorasick(self):
+        """Test the combined-regex fallback finds overlapping names."""
+        text = "Upgrade python-pip and lib32-glibc; python itself is fine"
+        with patch('src.utils.patterns.ahocorasick', None):
+            packages = self.matcher.extract_package_names(text, self.installed_packages)
+        self.assertTrue({"python", "python-pip", "glibc", "lib32-glibc"} <= packages)
+        self.assertNotIn("pip", packages)
+
+    def test_name_before_package_matches_full_scan(self):
+        """Test the windowed 'name package' scan matches a full regex scan."""
+        texts = [
+            "the nvidia package and foo-bar  package",
+            "a package package package",
+            "x" * 60 + " package, " + "lib-" * 20 + "\tpackage",
+            "package-with-dashes package\npackagepackage package",
+            "no mention here",
+        ]
+        for text in texts:
+            expected = [m.span() for m in _NAME_BEFORE_PACKAGE.finditer(text)]
+            actual = [m.span() for m in _finditer_name_before_package(text)]
+            self.assertEqual(actual, expected, text)
+
     def test_is_package_mentioned(self):
         """Test checking if a specific package is mentioned."""
         text = "The firefox browser needs an update"
         self.assertTrue(self.matcher.is_package_mentioned(text, "firefox"))
         self.assertFalse(self.matcher.is_package_mentioned(text, "chromium"))
 
+    def test_is_package_mentioned_word_boundaries(self):
+        """Test mention checks respect word boundaries and ignore case."""
+        text = "Pythonic code needs Python-pip; see lib32-glibc"
+        self.assertTrue(self.matcher.is_package_mentioned(text, "python"))
+        self.assertTrue(self.matcher.is_package_mentioned(text, "PYTHON-PIP"))
+        self.assertTrue(self.matcher.is_package_mentioned(text, "glibc"))
+        self.assertFalse(self.matcher.is_package_mentioned(text, "lib"))
+        self.assertFalse(self.matcher.is_package_mentioned("pythonic", "python"))
+
+    def test_packages_mentioned(self):
+        """Test checking several packages in one call."""
+        text = "Pythonic code needs Python-pip; see lib32-glibc"
+        names = ["python", "PYTHON-PIP", "glibc", "lib", "firefox"]
+        expected = {name: self.matcher.is_package_mentioned(text, name) for name in names}
+        self.assertEqual(self.matcher.packages_mentioned(text, names), expected)
+        with patch('src.utils.patterns.ahocorasick', None):
+            self.assertEqual(self.matcher.packages_mentioned(text, names), expected)
+
     def test_find_affected_packages(self):
         """Test finding affected packages (legacy method)."""
         text = "Security update for firefox and nvidia drivers"
@@ -184,6 +229,40 @@ class TestPackagePatternMatcher(unittest.TestCase):
         packages = self.matcher.extract_package_names(text, self.installed_packages)
         self.assertIn("firefox", packages)
 
+    def test_redos_prone_custom_pattern_rejected(self):
+        """Test patterns prone to catastrophic backtracking are rejected."""
+        self.matcher.add_custom_patterns([r'(a+)+b', r'(x|x)*', r'\w+\w+', r'aur/([a-z0-9\-]+)'])
+        self.assertEqual(self.matcher.custom_patterns, [r'aur/([a-z0-9\-]+)'])
+
+        text = "a" * 5000 + " firefox"
+        packages = self.matcher.extract_package_names(
+            text, self.installed_packages, extra_patterns=[r'(a*)*c']
+        )
+        self.assertEqual(packages, {"firefox"})
+
+    def test_make_possessive(self):
+        """Test greedy quantifiers become possessive only where safe."""
+        self.assertEqual(_make_possessive(r'[a-z]+-[0-9]+'), r'[a-z]++-[0-9]+')
+        self.assertEqual(_make_possessive(r'\w+\s'), r'\w++\s')
+        # Overlapping or optional successors, and unknown constructs, are kept
+        for pattern in [r'a+a', r'[a-z]+\w', r'a+b?', r'a*?b', r'a+\b', r'(?x)a+ b', r'\x61+a']:
+            self.assertEqual(_make_possessive(pattern), pattern)
+
+    def test_make_possessive_non_latin1_atoms(self):
+        """Test atoms beyond Latin-1 are not assumed disjoint."""
+        self.assertEqual(_make_possessive('[Ā-Ȁ]+Ő'), '[Ā-Ȁ]+Ő')
+        self.assertIsNotNone(re.fullmatch(_make_possessive('[Ā-Ȁ]+Ő'), 'ŐŐ'))
+        # Case-insensitive matches outside Latin-1 (KELVIN SIGN) are still seen
+        self.assertEqual(_make_possessive('\u212a+k'), '\u212a+k')
+
+    def test_has_redos_shape(self):
+        """Test static vetting of regex shapes."""
+        for pattern in [r'(x+)+', r'(x*)*', r'(x|x)+', r'(a|ab)*', r'(\w|\d)+', r'\w+\w+']:
+            self.assertTrue(_has_redos_shape(pattern), pattern)
+        for pattern in [r'aur/([a-z0-9\-]+)', r'(a|b)+', r'[a-z]+-[0-9]+', r'(?:ab){2}',
+                        r'package\s+([a-z0-9](?:[a-z0-9\-_.]){1,48}[a-z0-9])']:
+            self.assertFalse(_has_redos_shape(pattern), pattern)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -10,6 +10,7 @@ import threading
 from src.utils.cache import CacheManager
 from src.utils.thread_manager import ThreadResourceManager
 from src.utils.validators import validate_package_name
+from src.utils.logger import sanitize_log_message
 from src.news_fetcher import NewsFetcher
 from src.models import NewsItem
 
@@ -60,6 +61,27 @@ class TestPerformanceBenchmarks(unittest.TestCase):
         # Should validate 10000 names reasonably fast (under 1.5 seconds)
         self.assertLess(validation_time, 1.5, "Package validation too slow")
 
+    def test_log_sanitization_performance(self):
+        """Test log message sanitization performance."""
+        messages = [
+            "Initialized instance lock for arch-smart-update-checker (gui)",
+            "Found 12 updates for packages linux, firefox, mesa",
+            "Loaded config from /home/alice/.config/asuc/config.json password=hunter2",
+        ] * 500
+
+        start = time.time()
+        for message in messages:
+            sanitize_log_message(message)
+        sanitize_time = time.time() - start
+
+        # Should sanitize 1500 typical messages well under a second
+        self.assertLess(sanitize_time, 1.0, "Log sanitization too slow")
+
+        # Redaction must still apply on the fast path
+        sanitized = sanitize_log_message(messages[2])
+        self.assertIn('/home/[USER]', sanitized)
+        self.assertNotIn('hunter2', sanitized)
+
     def test_thread_creation_performance(self):
         """Test thread creation and management performance."""
         # Test creating multiple threads using public API
@@ -0,0 +1,79 @@
+"""
+Unit tests for sandbox profiles.
+"""
+
+import unittest
+
+from src.utils.sandbox_profiles import (
+    FileAccessProfile, NetworkProfile, SandboxLevel, SandboxManager
+)
+
+
+class TestSandboxManager(unittest.TestCase):
+    """Test sandbox profile selection and command wrapping."""
+
+    def setUp(self):
+        """Start every test with empty profile caches."""
+        SandboxManager.clear_profile_cache()
+        self.addCleanup(SandboxManager.clear_profile_cache)
+
+    def test_custom_level_profile(self):
+        """Test a custom level builds the operation's profile once and shares it."""
+        default = SandboxManager.get_profile('url_open')
+        self.assertIs(SandboxManager.get_profile('url_open', SandboxLevel.STANDARD), default)
+
+        strict = SandboxManager.get_profile('url_open', SandboxLevel.STRICT)
+        self.assertIsInstance(strict, NetworkProfile)
+        self.assertEqual(strict.level, SandboxLevel.STRICT)
+        self.assertEqual(strict.bwrap_args, ('--unshare-net',))
+        self.assertIs(SandboxManager.get_profile('url_open', SandboxLevel.STRICT), strict)
+
+        file_profile = SandboxManager.get_profile('file_open', SandboxLevel.STRICT)
+        self.assertIsInstance(file_profile, FileAccessProfile)
+        self.assertIn('--tmpfs', file_profile.bwrap_args)
+
+    def test_allow_network_rewrites_unshare_net(self):
+        """Test allow_network swaps '--unshare-net' for '--share-net'."""
+        profile = SandboxManager.create_custom_profile('viewer', SandboxLevel.STRICT,
+                                                       filesystem=['/opt/docs'])
+        command = SandboxManager.get_sandbox_command(['ls'], profile)
+        self.assertEqual(command[:2], ['bwrap', '--unshare-net'])
+        self.assertEqual(command[-4:], ['--ro-bind', '/opt/docs', '/opt/docs', 'ls'])
+
+        command = SandboxManager.get_sandbox_command(['ls'], profile, allow_network=True)
+        self.assertNotIn('--unshare-net', command)
+        self.assertEqual(command[-2:], ['--share-net', 'ls'])
+        self.assertEqual(len(command), len(profile.bwrap_args) + 2)
+
+    def test_identical_custom_profiles_are_shared_and_frozen(self):
+        """Test identical requests reuse one profile that callers cannot change."""
+        profile = SandboxManager.create_custom_profile('viewer', SandboxLevel.STANDARD,
+                                                       network=True, filesystem=['/opt/docs'])
+        same = SandboxManager.create_custom_profile('viewer', SandboxLevel.STANDARD,
+                                                    network=True, filesystem=('/opt/docs',))
+        self.assertIs(same, profile)
+        self.assertIsNot(
+            SandboxManager.create_custom_profile('viewer', SandboxLevel.STANDARD, network=True),
+            profile
+        )
+
+        original_args = profile.bwrap_args
+        with self.assertRaises(AttributeError):
+            profile.bwrap_args += ('--bind', '/', '/')
+        with self.assertRaises(AttributeError):
+            profile.level = SandboxLevel.NONE
+        self.assertEqual(profile.bwrap_args, original_args)
+
+        file_profile = SandboxManager.get_profile('file_open', SandboxLevel.STRICT)
+        with self.assertRaises(AttributeError):
+            file_profile.allowed_paths.append('/')  # type: ignore[attr-defined]
+
+    def test_new_profiles_stay_mutable(self):
+        """Test profiles built directly can still be adjusted."""
+        profile = FileAccessProfile(SandboxLevel.BASIC, allowed_paths=['/srv'])
+        profile.bwrap_args += ('--tmpfs', '/tmp')
+        self.assertEqual(profile.bwrap_args[-2:], ('--tmpfs', '/tmp'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+"""
+Unit tests for secure memory utilities.
+"""
+
+import unittest
+
+from src.utils.secure_memory import SecureDataStore, SecureString
+
+
+class TestSecureDataStore(unittest.TestCase):
+    """Test secure data store cleanup."""
+
+    def test_clear_all_leaves_caller_bytes_intact(self):
+        """Test clearing wipes only buffers the store owns."""
+        key = bytes(range(32))
+        store = SecureDataStore(key)
+        store.store('token', 'secret-value', encrypt=True)
+        ciphertext = store.retrieve('token')
+        owned = store._encrypted_data['token']
+
+        store.clear_all()
+
+        self.assertEqual(key, bytes(range(32)))
+        self.assertTrue(any(ciphertext))
+        self.assertFalse(any(owned))
+        self.assertIsNone(store.retrieve('token'))
+
+    def test_repeated_key_replaces_and_wipes(self):
+        """Test storing a key again wipes the replaced ciphertext."""
+        store = SecureDataStore()
+        store.store('token', 'first-value', encrypt=True)
+        replaced = store._encrypted_data['token']
+        store.store('token', 'second-value', encrypt=True)
+
+        self.assertFalse(any(replaced))
+        self.assertEqual(store.retrieve('token', decrypt=True), b'second-value')
+        store.clear_all()
+
+
+class TestSecureString(unittest.TestCase):
+    """Test secure string clearing."""
+
+    def test_clear_zeroes_buffer(self):
+        """Test clearing overwrites the stored characters."""
+        secret = SecureString('pässword')
+        buffer = secret._buf
+        self.assertEqual(secret.get(), 'pässword')
+        self.assertEqual(len(secret), 8)
+
+        secret.clear()
+
+        self.assertFalse(any(buffer.raw))
+        self.assertEqual(secret.get(), '')
+
+
+if __name__ == '__main__':
+    unittest.main()